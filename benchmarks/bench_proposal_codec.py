@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+""" Compares the legacy JSON proposal record with the binary record in size and CPU time
+
+Usage: python -m benchmarks.bench_proposal_codec [count_of_main_preps] [count_of_voters]
+"""
+
+import hashlib
+import sys
+import timeit
+
+from iconservice import *
+
+from governance.network_proposal import ProposalInfo, NetworkProposalStatus, NetworkProposalType
+
+REPEAT = 2000
+# per byte step costs of the schema 1 step cost table, see tests/test_governance.py
+STEP_COST_GET = 25
+STEP_COST_SET = 320
+
+
+def create_address(index: int) -> 'Address':
+    return Address(AddressPrefix.EOA, hashlib.sha3_256(index.to_bytes(8, 'big')).digest()[-20:])
+
+
+def create_proposal_info(count_of_main_preps: int, count_of_voters: int) -> 'ProposalInfo':
+    addresses = [str(create_address(i)) for i in range(count_of_main_preps)]
+    delegated = 3_000_000 * 10 ** 18
+
+    vote = {
+        "agree": {"list": [], "amount": 0},
+        "disagree": {"list": [], "amount": 0},
+        "noVote": {"list": addresses[count_of_voters:], "amount": delegated * (count_of_main_preps - count_of_voters)}
+    }
+    for i, address in enumerate(addresses[:count_of_voters]):
+        vote_type = "agree" if i % 3 else "disagree"
+        vote[vote_type]["list"].append({
+            "id": '0x' + hashlib.sha3_256(address.encode()).hexdigest(),
+            "timestamp": 1_600_000_000_000_000 + i,
+            "address": address,
+            "name": f"P-Rep node {i}",
+            "amount": delegated
+        })
+        vote[vote_type]["amount"] += delegated
+
+    return ProposalInfo(hashlib.sha3_256(b'proposal').digest(), create_address(0), "P-Rep node 0",
+                        "Step price proposal", "Adjusts the step price to follow the ICX market price",
+                        NetworkProposalType.STEP_PRICE, {"value": hex(12_500_000_000)}, 10_000_000, 10_043_200,
+                        NetworkProposalStatus.VOTING, vote)
+
+
+def to_legacy_bytes(proposal_info: 'ProposalInfo') -> bytes:
+    proposal_info_in_dict = dict(vars(proposal_info))
+    proposal_info_in_dict["id"] = bytes.hex(proposal_info.id)
+    proposal_info_in_dict["proposer"] = str(proposal_info.proposer)
+    return json_dumps(proposal_info_in_dict).encode()
+
+
+def main(count_of_main_preps: int = 22, count_of_voters: int = 15):
+    proposal_info = create_proposal_info(count_of_main_preps, count_of_voters)
+    legacy_bytes = to_legacy_bytes(proposal_info)
+    binary_bytes = proposal_info.to_bytes()
+
+    results = {
+        "legacy": (len(legacy_bytes),
+                   timeit.timeit(lambda: to_legacy_bytes(proposal_info), number=REPEAT),
+                   timeit.timeit(lambda: ProposalInfo.from_bytes(legacy_bytes), number=REPEAT)),
+        "binary": (len(binary_bytes),
+                   timeit.timeit(lambda: proposal_info.to_bytes(), number=REPEAT),
+                   timeit.timeit(lambda: ProposalInfo.from_bytes(binary_bytes).vote, number=REPEAT)),
+    }
+    # list queries only need the summary, which leaves the voter lists undecoded
+    summary_decode = timeit.timeit(lambda: ProposalInfo.from_bytes(binary_bytes).get_vote_tallies(), number=REPEAT)
+
+    print(f"main preps: {count_of_main_preps}, voters: {count_of_voters}, repeat: {REPEAT}")
+    print(f"{'format':<8}{'size(B)':>10}{'get(step)':>12}{'set(step)':>12}{'encode(us)':>14}{'decode(us)':>14}")
+    for name, (size, encode, decode) in results.items():
+        print(f"{name:<8}{size:>10}{size * STEP_COST_GET:>12}{size * STEP_COST_SET:>12}"
+              f"{encode / REPEAT * 1e6:>14.1f}{decode / REPEAT * 1e6:>14.1f}")
+
+    legacy, binary = results["legacy"], results["binary"]
+    saved = legacy[0] - binary[0]
+    print(f"{'saved':<8}{saved:>10}{saved * STEP_COST_GET:>12}{saved * STEP_COST_SET:>12}"
+          f"{(legacy[1] - binary[1]) / REPEAT * 1e6:>14.1f}{(legacy[2] - binary[2]) / REPEAT * 1e6:>14.1f}")
+    print(f"binary summary decode(us): {summary_decode / REPEAT * 1e6:.1f}")
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:3]])
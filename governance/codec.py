@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from iconservice import *
+
+
+class RecordWriter:
+    """ Writer for compact binary records
+
+    A record starts with a one-byte schema tag followed by fields.
+    Lengths and counts are unsigned varints. Other integers are written as a varint byte length followed by
+    the minimal big endian two's complement bytes, the same integer layout iconservice uses in its containers.
+    Strings and bytes are prefixed with their length and addresses are written as raw 20 bytes (EOA)
+    or 21 bytes (SCORE) with a length prefix.
+    """
+
+    def __init__(self, schema: int):
+        self._buf = bytearray()
+        self._buf.append(schema)
+
+    def write_uint(self, value: int) -> 'RecordWriter':
+        if value < 0:
+            raise ValueError(f"Negative value for unsigned varint: {value}")
+        buf = self._buf
+        while value > 0x7f:
+            buf.append((value & 0x7f) | 0x80)
+            value >>= 7
+        buf.append(value)
+        return self
+
+    def write_int(self, value: int) -> 'RecordWriter':
+        if value == 0:
+            self._buf.append(0)
+            return self
+        size = (value.bit_length() + 8) // 8
+        self.write_uint(size)
+        self._buf += value.to_bytes(size, 'big', signed=True)
+        return self
+
+    def write_bytes(self, value: bytes) -> 'RecordWriter':
+        self.write_uint(len(value))
+        self._buf += value
+        return self
+
+    def write_str(self, value: str) -> 'RecordWriter':
+        return self.write_bytes(value.encode())
+
+    def write_address(self, value: 'Address') -> 'RecordWriter':
+        return self.write_bytes(value.to_bytes())
+
+    def write_address_str(self, value: str) -> 'RecordWriter':
+        """ Write an address given in string form like 'hx...' without converting it to Address """
+        if value[:2] == "hx":
+            self._buf.append(20)
+        elif value[:2] == "cx":
+            self._buf += b'\x15\x01'
+        else:
+            raise ValueError(f"Invalid address: {value}")
+        body = bytes.fromhex(value[2:])
+        if len(body) != 20:
+            raise ValueError(f"Invalid address: {value}")
+        self._buf += body
+        return self
+
+    def to_bytes(self) -> bytes:
+        return bytes(self._buf)
+
+
+class RecordReader:
+    """ Reader for records written by RecordWriter """
+
+    def __init__(self, buf: bytes, offset: int = 1):
+        self._buf = buf
+        self._offset = offset
+
+    @property
+    def schema(self) -> int:
+        return self._buf[0]
+
+    @property
+    def offset(self) -> int:
+        return self._offset
+
+    def read_uint(self) -> int:
+        buf = self._buf
+        offset = self._offset
+        b = buf[offset]
+        offset += 1
+        value = b & 0x7f
+        shift = 7
+        while b > 0x7f:
+            b = buf[offset]
+            offset += 1
+            value |= (b & 0x7f) << shift
+            shift += 7
+        self._offset = offset
+        return value
+
+    def read_int(self) -> int:
+        return int.from_bytes(self.read_bytes(), 'big', signed=True)
+
+    def read_bytes(self) -> bytes:
+        buf = self._buf
+        start = self._offset
+        size = buf[start]
+        if size < 0x80:
+            start += 1
+        else:
+            size = self.read_uint()
+            start = self._offset
+        end = start + size
+        if end > len(buf):
+            raise ValueError("Truncated record")
+        self._offset = end
+        return buf[start:end]
+
+    def read_str(self) -> str:
+        return self.read_bytes().decode()
+
+    def read_address(self) -> 'Address':
+        return Address.from_bytes(self.read_bytes())
+
+    def read_address_str(self) -> str:
+        """ Read an address written by RecordWriter and return it in string form like 'hx...' """
+        body = self.read_bytes()
+        if len(body) == 20:
+            return "hx" + body.hex()
+        return "cx" + body[1:].hex()
@@ -14,15 +14,22 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from typing import List
+
 from iconservice import *
 from iconservice.iconscore.system import *
 
-from .network_proposal import NetworkProposal, NetworkProposalType, MaliciousScoreType, MAX_GET_PROPOSALS_SIZE
+from .import_white_list import ImportWhiteList
+from .network_proposal import NetworkProposal, NetworkProposalType, MaliciousScoreType, MAX_GET_PROPOSALS_SIZE, \
+    MAX_GET_PROPOSALS_PAGE_SIZE, MAX_FINALIZE_EXPIRED_SIZE, EXPIRY_SWEEP_SIZE_PER_CALL, MAX_VOTE_PROPOSALS_SIZE, \
+    MAX_GET_VOTES_PAGE_SIZE, MAX_ARCHIVE_PROPOSALS_SIZE, MAX_GET_VOTERS_PAGE_SIZE
 
-VERSION = '1.2.2'
+VERSION = '1.6.0'
 TAG = 'Governance'
 DEBUG = False
 
+MAX_SCORE_BLACK_LIST_QUERY_SIZE = 100
+
 STEP_TYPE_DEFAULT = 'default'
 STEP_TYPE_CONTRACT_CALL = 'contractCall'
 STEP_TYPE_CONTRACT_CREATE = 'contractCreate'
@@ -61,6 +68,8 @@ class Governance(IconSystemScoreBase):
     _VERSION = 'version'
     _AUDIT_STATUS = 'audit_status'
     _REJECT_STATUS = 'reject_status'
+    _SCORE_BLACK_LIST_INDEX = 'score_black_list_index'
+    _AUDITOR_INDEX = 'auditor_index'
 
     @eventlog(indexed=1)
     def Accepted(self, txHash: str):
@@ -121,14 +130,21 @@ class Governance(IconSystemScoreBase):
     def __init__(self, db: IconScoreDatabase) -> None:
         super().__init__(db)
         self._auditor_list = ArrayDB(self._AUDITOR_LIST, db, value_type=Address)
+        # 1-based position of the auditor in _auditor_list, 0 if not an auditor
+        self._auditor_index = DictDB(self._AUDITOR_INDEX, db, value_type=int)
         self._audit_status = DictDB(self._AUDIT_STATUS, db, value_type=bytes)
         self._reject_status = DictDB(self._REJECT_STATUS, db, value_type=bytes)
+        # 1-based position of the SCORE in the SCORE blacklist, 0 if not in it
+        self._score_black_list_index = DictDB(self._SCORE_BLACK_LIST_INDEX, db, value_type=int)
 
         self._version = VarDB(self._VERSION, db, value_type=str)
         self._network_proposal = NetworkProposal(db)
+        # IMPORT_WHITE_LIST compiled once and kept over calls. It is written only by the migration in on_update
+        self._import_white_list = None
 
     def on_update(self) -> None:
         super().on_update()
+        self._import_white_list = None
 
         if self.is_less_than_target_version('0.0.2'):
             self._migrate_v0_0_2()
@@ -142,6 +158,14 @@ class Governance(IconSystemScoreBase):
             self._migrate_v0_0_6()
         if self.is_less_than_target_version('1.1.0'):
             self._migrate_v1_1_0()
+        if self.is_less_than_target_version('1.3.0'):
+            self._migrate_v1_3_0()
+        if self.is_less_than_target_version('1.4.0'):
+            self._migrate_v1_4_0()
+        if self.is_less_than_target_version('1.5.0'):
+            self._migrate_v1_5_0()
+        if self.is_less_than_target_version('1.6.0'):
+            self._migrate_v1_6_0()
         self._version.set(VERSION)
 
     def on_install(self) -> None:
@@ -243,6 +267,25 @@ class Governance(IconSystemScoreBase):
         _remove_array(score_black_list)
         _remove_array(deployer_list)
 
+    def _migrate_v1_3_0(self):
+        # Split the network proposals into header, tally and votes
+        self._network_proposal.migrate_proposals()
+
+    def _migrate_v1_4_0(self):
+        # Index the SCORE blacklist by address
+        score_black_list: list = self.get_icon_network_value(IconNetworkValueType.SCORE_BLACK_LIST)
+        for i, address in enumerate(score_black_list):
+            self._score_black_list_index[address] = i + 1
+
+    def _migrate_v1_5_0(self):
+        # Index the auditors by address
+        for i, auditor in enumerate(self._auditor_list):
+            self._auditor_index[auditor] = i + 1
+
+    def _migrate_v1_6_0(self):
+        # Index the network proposals by type and status together and count them by proposer
+        self._network_proposal.migrate_indexes()
+
     @staticmethod
     def _versions(version: str):
         parts = []
@@ -254,6 +297,13 @@ class Governance(IconSystemScoreBase):
                     pass
         return tuple(parts)
 
+    def _get_import_white_list(self) -> 'ImportWhiteList':
+        import_white_list = self._import_white_list
+        if import_white_list is None:
+            import_white_list = ImportWhiteList(self.get_icon_network_value(IconNetworkValueType.IMPORT_WHITE_LIST))
+            self._import_white_list = import_white_list
+        return import_white_list
+
     @external(readonly=True)
     def getScoreStatus(self, address: Address) -> dict:
         return self.get_score_status(address)
@@ -266,7 +316,7 @@ class Governance(IconSystemScoreBase):
     def acceptScore(self, txHash: bytes):
         # check message sender
         Logger.debug(f'acceptScore: msg.sender = "{self.msg.sender}"', TAG)
-        if self.msg.sender not in self._auditor_list:
+        if self._auditor_index[self.msg.sender] == 0:
             revert('Invalid sender: no permission')
 
         # check txHash
@@ -311,7 +361,7 @@ class Governance(IconSystemScoreBase):
     def rejectScore(self, txHash: bytes, reason: str):
         # check message sender
         Logger.debug(f'rejectScore: msg.sender = "{self.msg.sender}"', TAG)
-        if self.msg.sender not in self._auditor_list:
+        if self._auditor_index[self.msg.sender] == 0:
             revert('Invalid sender: no permission')
 
         # check txHash
@@ -340,8 +390,9 @@ class Governance(IconSystemScoreBase):
         # check message sender, only owner can add new auditor
         if self.msg.sender != self.owner:
             revert('Invalid sender: not owner')
-        if address not in self._auditor_list:
+        if self._auditor_index[address] == 0:
             self._auditor_list.put(address)
+            self._auditor_index[address] = len(self._auditor_list)
         else:
             revert(f'Invalid address: already auditor')
         if DEBUG is True:
@@ -351,18 +402,19 @@ class Governance(IconSystemScoreBase):
     def removeAuditor(self, address: Address):
         if address.is_contract:
             revert(f'Invalid EOA Address: {address}')
-        if address not in self._auditor_list:
+        position: int = self._auditor_index[address]
+        if position == 0:
             revert('Invalid address: not in list')
         # check message sender
         if self.msg.sender != self.owner:
             if self.msg.sender != address:
                 revert('Invalid sender: not yourself')
-        # get the topmost value
+        # get the topmost value and move it to the position of the removed one
         top = self._auditor_list.pop()
         if top != address:
-            for i in range(len(self._auditor_list)):
-                if self._auditor_list[i] == address:
-                    self._auditor_list[i] = top
+            self._auditor_list[position - 1] = top
+            self._auditor_index[top] = position
+        self._auditor_index.remove(address)
         if DEBUG is True:
             self._print_auditor_list('removeAuditor')
 
@@ -378,29 +430,34 @@ class Governance(IconSystemScoreBase):
         if self.address == address:
             revert("can't add myself")
 
-        score_black_list: list = self.get_icon_network_value(IconNetworkValueType.SCORE_BLACK_LIST)
-        if address not in score_black_list:
-            score_black_list.append(address)
-            self.set_icon_network_value(IconNetworkValueType.SCORE_BLACK_LIST, score_black_list)
-            self.MaliciousScore(address, MaliciousScoreType.FREEZE)
-        else:
+        if self._score_black_list_index[address] != 0:
             revert('Invalid address: already SCORE blacklist')
 
+        score_black_list: list = self.get_icon_network_value(IconNetworkValueType.SCORE_BLACK_LIST)
+        score_black_list.append(address)
+        self.set_icon_network_value(IconNetworkValueType.SCORE_BLACK_LIST, score_black_list)
+        self._score_black_list_index[address] = len(score_black_list)
+        self.MaliciousScore(address, MaliciousScoreType.FREEZE)
+
         if DEBUG is True:
             self._print_black_list('addScoreToBlackList', score_black_list)
 
     def _removeFromScoreBlackList(self, address: Address):
         if not address.is_contract:
             revert(f'Invalid SCORE Address: {address}')
-        score_black_list: list = self.get_icon_network_value(IconNetworkValueType.SCORE_BLACK_LIST)
 
-        for i, listed_score_address in enumerate(score_black_list):
-            if listed_score_address == address:
-                score_black_list.pop(i)
-                break
-        else:
+        position: int = self._score_black_list_index[address]
+        if position == 0:
             revert('Invalid address: not in list')
 
+        # move the last one to the position of the removed one
+        score_black_list: list = self.get_icon_network_value(IconNetworkValueType.SCORE_BLACK_LIST)
+        last_address: 'Address' = score_black_list.pop()
+        if position <= len(score_black_list):
+            score_black_list[position - 1] = last_address
+            self._score_black_list_index[last_address] = position
+        self._score_black_list_index.remove(address)
+
         self.set_icon_network_value(IconNetworkValueType.SCORE_BLACK_LIST, score_black_list)
         self.MaliciousScore(address, MaliciousScoreType.UNFREEZE)
 
@@ -410,8 +467,19 @@ class Governance(IconSystemScoreBase):
     @external(readonly=True)
     def isInScoreBlackList(self, address: Address) -> bool:
         Logger.debug(f'isInBlackList address: {address}', TAG)
-        score_black_list: list = self.get_icon_network_value(IconNetworkValueType.SCORE_BLACK_LIST)
-        return address in score_black_list
+        return self._score_black_list_index[address] != 0
+
+    @external(readonly=True)
+    def areInScoreBlackList(self, addresses: List[Address]) -> list:
+        """ Check if each of the SCOREs is in the SCORE blacklist
+
+        :param addresses: SCORE addresses. Maximum count is 100
+        :return: list of bool in the order of addresses
+        """
+        if not 0 < len(addresses) <= MAX_SCORE_BLACK_LIST_QUERY_SIZE:
+            revert(f"Invalid addresses parameter: count must be 1 to {MAX_SCORE_BLACK_LIST_QUERY_SIZE}")
+
+        return [self._score_black_list_index[address] != 0 for address in addresses]
 
     def _print_black_list(self, header: str, score_black_list: list):
         Logger.debug(f'{header}: list len = {len(score_black_list)}', TAG)
@@ -483,51 +551,19 @@ class Governance(IconSystemScoreBase):
 
     @external(readonly=True)
     def isInImportWhiteList(self, importStmt: str) -> bool:
+        import_white_list = self._get_import_white_list()
         try:
-            import_stmt_dict: dict = self._check_import_stmt(importStmt)
+            import_stmt_dict: dict = import_white_list.parse_import_stmt(importStmt)
         except Exception as e:
             raise ValueError(f'{e}')
 
-        import_white_list: dict = self.get_icon_network_value(IconNetworkValueType.IMPORT_WHITE_LIST)
-        for key, value in import_stmt_dict.items():
-            old_value: list = import_white_list.get(key, None)
-            if old_value is None:
-                return False
-
-            if old_value[0] == "*":
-                # import white list has ALL. See next key
-                continue
-
-            if len(value) == 0:
-                # input is ALL
-                return False
-
-            for v in value:
-                if v not in old_value:
-                    return False
+        if not import_white_list.contains(import_stmt_dict):
+            return False
 
         if DEBUG is True:
             Logger.debug(f'({importStmt}) is in import white list')
         return True
 
-    @staticmethod
-    def _check_import_stmt(import_stmt: str) -> dict:
-        Logger.debug(f'check_import_stmt: {import_stmt}')
-        import_stmt_dict: dict = json_loads(import_stmt.replace("\'", "\""))
-        for key, value in import_stmt_dict.items():
-            if not isinstance(key, str):
-                raise TypeError("Key must be of type `str`")
-
-            if not isinstance(value, list):
-                raise TypeError("Value must be of type `list`")
-            else:
-                for v in value:
-                    if not isinstance(v, str):
-                        raise TypeError("Element of value must be of type `str`")
-
-        Logger.debug(f'check_import_stmt_dict: {import_stmt_dict}')
-        return import_stmt_dict
-
     def _set_initial_service_config(self):
         service_config = VarDB("service_config", self.db, value_type=int)
         service_config.set(self.get_icon_service_flag() | 8)
@@ -579,6 +615,7 @@ class Governance(IconSystemScoreBase):
         if not self._validate_network_proposal(type, value_in_dict):
             revert(f"Invalid parameter - type: {type}, value: {value_in_dict}")
 
+        self._network_proposal.finalize_expired_proposals(self.block_height, EXPIRY_SWEEP_SIZE_PER_CALL)
         self._network_proposal.register_proposal(self.tx.hash, self.msg.sender, self.block_height, expire_block_height,
                                                  title, description, type, value_in_dict, main_preps)
 
@@ -597,6 +634,7 @@ class Governance(IconSystemScoreBase):
         if not self._check_main_prep(self.msg.sender, main_preps):
             revert("No permission - only for main prep")
 
+        self._network_proposal.finalize_expired_proposals(self.block_height, EXPIRY_SWEEP_SIZE_PER_CALL)
         self._network_proposal.cancel_proposal(id, self.msg.sender, self.block_height)
 
         self.NetworkProposalCanceled(id)
@@ -610,15 +648,46 @@ class Governance(IconSystemScoreBase):
         :return: None
         """
         main_preps, _ = get_main_prep_info()
-        if not self._check_main_prep(self.msg.sender, main_preps):
+        main_prep = self._find_main_prep(self.msg.sender, main_preps)
+        if main_prep is None:
+            revert("No permission - only for main prep")
+
+        self._network_proposal.finalize_expired_proposals(self.block_height, EXPIRY_SWEEP_SIZE_PER_CALL)
+        self._vote_proposal(id, main_prep, vote)
+
+    @external
+    def voteProposals(self, ids: List[bytes], votes: List[int]):
+        """ Vote for several proposals in one transaction
+
+        Votes are applied in the given order as voteProposal does, emitting the same events and applying
+        approved proposals right away. If any of them fails, the whole transaction is reverted and no vote is applied.
+
+        :param ids: transaction hashes to generate when registering proposals. Maximum count is 20
+        :param votes: agree(1) or disagree(0) for each proposal in ids
+        :return: None
+        """
+        if not 0 < len(ids) <= MAX_VOTE_PROPOSALS_SIZE:
+            revert(f"Invalid ids parameter: count must be 1 to {MAX_VOTE_PROPOSALS_SIZE}")
+        if len(votes) != len(ids):
+            revert("Invalid votes parameter: count must be the same as ids")
+        if len(set(ids)) != len(ids):
+            revert("Invalid ids parameter: duplicated id")
+
+        main_preps, _ = get_main_prep_info()
+        main_prep = self._find_main_prep(self.msg.sender, main_preps)
+        if main_prep is None:
             revert("No permission - only for main prep")
 
-        approved, proposal_type, value = self._network_proposal.vote_proposal(id, self.msg.sender,
+        self._network_proposal.finalize_expired_proposals(self.block_height, EXPIRY_SWEEP_SIZE_PER_CALL)
+        for id, vote in zip(ids, votes):
+            self._vote_proposal(id, main_prep, vote)
+
+    def _vote_proposal(self, id: bytes, main_prep: 'PRepInfo', vote: int):
+        approved, proposal_type, value = self._network_proposal.vote_proposal(id, main_prep,
                                                                               vote,
                                                                               self.block_height,
                                                                               self.tx.hash,
-                                                                              self.tx.timestamp,
-                                                                              main_preps)
+                                                                              self.tx.timestamp)
 
         self.NetworkProposalVoted(id, vote, self.msg.sender)
 
@@ -626,28 +695,159 @@ class Governance(IconSystemScoreBase):
             self.NetworkProposalApproved(id)
             self._approve_network_proposal(proposal_type, value)
 
+    @external
+    def finalizeExpiredProposals(self, limit: int = MAX_FINALIZE_EXPIRED_SIZE):
+        """ Set status of the proposals whose voting period has ended without decision to DISAPPROVED
+
+        Part of the expired proposals are finalized on every registerProposal, cancelProposal and voteProposal call.
+        This method lets anyone finalize the rest in bounded batches.
+
+        :param limit: maximum count of the proposals to check. Default and maximum is 100 (optional)
+        :return: None
+        """
+        if not 0 < limit <= MAX_FINALIZE_EXPIRED_SIZE:
+            revert(f"Invalid limit parameter: {limit}")
+
+        self._network_proposal.finalize_expired_proposals(self.block_height, limit)
+
+    @external
+    def archiveProposals(self, limit: int = MAX_ARCHIVE_PROPOSALS_SIZE):
+        """ Compact expired proposals into archived records
+
+        Votes of an archived proposal are kept in a single record and getProposal returns the same result as before.
+        Expired proposals are finalized first as finalizeExpiredProposals does.
+
+        :param limit: maximum count of the proposals to archive. Default and maximum is 20 (optional)
+        :return: None
+        """
+        if not 0 < limit <= MAX_ARCHIVE_PROPOSALS_SIZE:
+            revert(f"Invalid limit parameter: {limit}")
+
+        self._network_proposal.finalize_expired_proposals(self.block_height, limit)
+        self._network_proposal.archive_proposals(limit)
+
     @external(readonly=True)
-    def getProposal(self, id: bytes) -> dict:
+    def getProposal(self, id: bytes, voters: str = None, start: int = 0,
+                    size: int = MAX_GET_VOTERS_PAGE_SIZE) -> dict:
         """ Get Proposal info as dict
 
         :param id: transaction hash to generate when registering proposal
+        :param voters: voter lists to include. Omit it or "all" for all the lists, "none" for the count and the amount
+        of each vote only, "agree", "disagree" or "noVote" for a page of the list (optional)
+        :param start: count of the voters to skip in the list given by voters. Default is 0 (optional)
+        :param size: size of the page of the list given by voters. Default and maximum is 50 (optional)
         :return: proposal information in dict
         """
-        proposal_info = self._network_proposal.get_proposal(id, self.block_height)
+        proposal_info = self._network_proposal.get_proposal(id, self.block_height, voters, start, size)
         return proposal_info
 
+    @external(readonly=True)
+    def getProposalStats(self) -> dict:
+        """ Get the count of proposals by status and type
+
+        :return: the total count, the counts by status, the counts by type and status and whether the counts are
+        approximate, as too many expired proposals are left to finalize, in dict
+        """
+        return self._network_proposal.get_proposal_stats(self.block_height)
+
+    @external(readonly=True)
+    def getProposalsByIds(self, ids: List[bytes], includeVoters: bool = True) -> dict:
+        """ Get Proposal info of several proposals in the given order
+
+        :param ids: transaction hashes to generate when registering proposals. Maximum count is 20
+        :param includeVoters: include the voter lists as getProposal does. If False, only the count and the amount
+        of each vote are included as getProposals does. Default is True (optional)
+        :return: proposal list in dict. The item of an unregistered id is null
+        """
+        return self._network_proposal.get_proposals_by_ids(ids, self.block_height, includeVoters)
+
     @external(readonly=True)
     def getProposals(self, type: int = None, status: int = None, start: int = 0, size: int = MAX_GET_PROPOSALS_SIZE) -> dict:
         """ Get a list of proposals filtered by type, status, start and size
 
         :param type: type of network proposal to filter (optional)
         :param status: status of network proposal to filter (optional)
-        :param start: starting index of network proposal to filter. Default is 0, which means the latest (optional)
+        :param start: count of the matching network proposals to skip. Default is 0, which means the latest (optional).
+        Before 1.3.0, it was the count of all the proposals to skip before filtering, so a page could have fewer
+        proposals than `size` even if more matching proposals were left
         :param size: size of network proposal to filter. Default and maximum is 10 (optional)
         :return: proposal list in dict
         """
         return self._network_proposal.get_proposals(self.block_height, type, status, start, size)
 
+    @external(readonly=True)
+    def getProposalsByCursor(self, type: int = None, status: int = None, cursor: int = None,
+                             size: int = MAX_GET_PROPOSALS_PAGE_SIZE) -> dict:
+        """ Get a page of proposals filtered by type and status. Pages are not shifted by new proposals
+
+        :param type: type of network proposal to filter (optional)
+        :param status: status of network proposal to filter (optional)
+        :param cursor: `next` of the previous page. Omit it to get the latest proposals (optional)
+        :param size: size of the page. Default is 50 and so is the maximum unless changed by setMaxProposalsPageSize (optional)
+        :return: proposal list, total count of proposals matching the filters, hasMore and next cursor in dict
+        """
+        return self._network_proposal.get_proposals_by_cursor(self.block_height, type, status, cursor, size)
+
+    @external(readonly=True)
+    def getProposalsSince(self, blockHeight: int, size: int = MAX_GET_PROPOSALS_PAGE_SIZE, cursor: int = None) -> dict:
+        """ Get proposals registered, voted, canceled or finalized at or after the block height
+
+        :param blockHeight: block height from which changes are included
+        :param size: size of the page. Default is 50 and so is the maximum unless changed by setMaxProposalsPageSize (optional)
+        :param cursor: `next` of the previous call to get the changes after it. If given, blockHeight is ignored
+        (optional)
+        :return: proposal list in order of the block height of the change, hasMore and next cursor in dict
+        """
+        return self._network_proposal.get_proposals_since(self.block_height, blockHeight, cursor, size)
+
+    @external(readonly=True)
+    def getProposalsByProposer(self, address: Address, type: int = None, status: int = None, cursor: int = None,
+                               size: int = MAX_GET_PROPOSALS_PAGE_SIZE) -> dict:
+        """ Get a page of proposals registered by the address, filtered by type and status
+
+        :param address: address of the proposer
+        :param type: type of network proposal to filter (optional)
+        :param status: status of network proposal to filter (optional)
+        :param cursor: `next` of the previous page. Omit it to get the latest proposals (optional)
+        :param size: size of the page. Default is 50 and so is the maximum unless changed by setMaxProposalsPageSize (optional)
+        :return: proposal list, total count of proposals of the proposer matching the filters, hasMore and next
+        cursor in dict
+        """
+        return self._network_proposal.get_proposals_by_proposer(self.block_height, address, type, status, cursor,
+                                                                size)
+
+    @external(readonly=True)
+    def getMaxProposalsPageSize(self) -> int:
+        """ Get the maximum size of a page of getProposalsByCursor, getProposalsByProposer and getProposalsSince
+
+        :return: maximum size of a page
+        """
+        return self._network_proposal.get_max_page_size()
+
+    @external
+    def setMaxProposalsPageSize(self, size: int):
+        """ Set the maximum size of a page of getProposalsByCursor, getProposalsByProposer and getProposalsSince.
+        Only the owner can call it
+
+        :param size: maximum size of a page, from 1 to 100
+        :return: None
+        """
+        if self.msg.sender != self.owner:
+            revert('Invalid sender: not owner')
+        self._network_proposal.set_max_page_size(size)
+
+    @external(readonly=True)
+    def getVotesByPRep(self, address: Address, cursor: int = None, size: int = MAX_GET_VOTES_PAGE_SIZE) -> dict:
+        """ Get a page of the votes of the P-Rep for network proposals, the latest first
+
+        :param address: address of the P-Rep
+        :param cursor: `next` of the previous page. Omit it to get the latest votes (optional)
+        :param size: size of the page. Default and maximum is 50 (optional)
+        :return: vote list with proposal id, vote and block height, total count of votes, hasMore and next cursor
+        in dict
+        """
+        return self._network_proposal.get_votes_by_prep(address, cursor, size)
+
     @staticmethod
     def _check_main_prep(address: 'Address', main_preps: list) -> bool:
         """ Check if the address is main prep
@@ -656,10 +856,20 @@ class Governance(IconSystemScoreBase):
         :param main_preps: list of main preps
         :return: bool value to be checked if it is one of main preps or not
         """
+        return Governance._find_main_prep(address, main_preps) is not None
+
+    @staticmethod
+    def _find_main_prep(address: 'Address', main_preps: list) -> 'PRepInfo':
+        """ Find the main prep of the address
+
+        :param address: address of the main prep
+        :param main_preps: list of main preps
+        :return: PRepInfo of the main prep or None if the address is not one of main preps
+        """
         for prep in main_preps:
             if prep.address == address:
-                return True
-        return False
+                return prep
+        return None
 
     def _validate_network_proposal(self, proposal_type: int, value: dict) -> bool:
         if proposal_type == NetworkProposalType.TEXT:
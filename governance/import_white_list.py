@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from iconservice import *
+
+MAX_PARSED_IMPORT_STMTS = 256
+
+
+class ImportWhiteList:
+    """ Import white list compiled into a dict of module to the names allowed to import from it
+
+    None in place of the names means all the names are allowed.
+    The import statements parsed recently are kept with the compiled white list, up to MAX_PARSED_IMPORT_STMTS.
+    The instance is shared by the invoke and the queries, so they are evicted without failing on concurrent changes.
+    """
+
+    def __init__(self, import_white_list: dict):
+        self._index = {}
+        for module, names in import_white_list.items():
+            self._index[module] = None if len(names) > 0 and names[0] == "*" else frozenset(names)
+        self._parsed_import_stmts = {}
+
+    def contains(self, import_stmt: dict) -> bool:
+        """ Check if all the imports in the parsed import statement are allowed
+
+        :param import_stmt: dict of module to the names to import from it; empty names to import all
+        """
+        index = self._index
+        for module, names in import_stmt.items():
+            if module not in index:
+                return False
+
+            allowed_names = index[module]
+            if allowed_names is None:
+                # import white list has ALL. See next module
+                continue
+
+            if len(names) == 0 or not allowed_names.issuperset(names):
+                # input is ALL or has a name not allowed
+                return False
+        return True
+
+    def parse_import_stmt(self, import_stmt: str) -> dict:
+        """ Parse the import statement like "{'os': ['path']}", reusing the result parsed recently
+
+        The result is shared, so callers must not change it.
+        """
+        parsed_import_stmts = self._parsed_import_stmts
+        import_stmt_dict = parsed_import_stmts.pop(import_stmt, None)
+        if import_stmt_dict is None:
+            import_stmt_dict = self._check_import_stmt(import_stmt)
+            if len(parsed_import_stmts) >= MAX_PARSED_IMPORT_STMTS:
+                # dict keeps the insertion order, so the first one is the least recently used
+                try:
+                    del parsed_import_stmts[next(iter(parsed_import_stmts))]
+                except (RuntimeError, KeyError, StopIteration):
+                    # changed by another call at the same time. The next one parsed evicts again
+                    pass
+        parsed_import_stmts[import_stmt] = import_stmt_dict
+        return import_stmt_dict
+
+    @staticmethod
+    def _check_import_stmt(import_stmt: str) -> dict:
+        Logger.debug(f'check_import_stmt: {import_stmt}')
+        import_stmt_dict: dict = json_loads(import_stmt.replace("\'", "\""))
+        for key, value in import_stmt_dict.items():
+            if not isinstance(key, str):
+                raise TypeError("Key must be of type `str`")
+
+            if not isinstance(value, list):
+                raise TypeError("Value must be of type `list`")
+            else:
+                for v in value:
+                    if not isinstance(v, str):
+                        raise TypeError("Element of value must be of type `str`")
+
+        Logger.debug(f'check_import_stmt_dict: {import_stmt_dict}')
+        return import_stmt_dict
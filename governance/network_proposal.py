@@ -1,6 +1,20 @@
 from iconservice import *
 
+from .codec import RecordReader, RecordWriter
+from .sorted_index import SortedIndex
+
 MAX_GET_PROPOSALS_SIZE = 10
+MAX_GET_PROPOSALS_PAGE_SIZE = 50
+MAX_PROPOSALS_PAGE_SIZE_LIMIT = 100
+MAX_FINALIZE_EXPIRED_SIZE = 100
+EXPIRY_SWEEP_SIZE_PER_CALL = 5
+MAX_VOTE_PROPOSALS_SIZE = 20
+MAX_GET_PROPOSALS_BY_IDS_SIZE = 20
+MAX_GET_VOTES_PAGE_SIZE = 50
+MAX_ARCHIVE_PROPOSALS_SIZE = 20
+MAX_GET_VOTERS_PAGE_SIZE = 50
+MAX_RENDERED_ARCHIVES_SIZE = 64
+MAX_SKIPPED_PROPOSALS_SIZE = 100
 
 
 class NetworkProposalType:
@@ -36,6 +50,9 @@ class NetworkProposalVote:
 class ApproveCondition:
     APPROVE_RATE = 0.66
     DISAPPROVE_RATE = 0.33
+    # the rates above in percent for integer arithmetic
+    APPROVE_RATE_IN_PERCENT = 66
+    DISAPPROVE_RATE_IN_PERCENT = 33
 
 
 class MaliciousScoreType:
@@ -49,10 +66,94 @@ class NetworkProposal:
     """ Network Proposal which implements related method, controls DB and make result formatted """
     _PROPOSAL_LIST = 'proposal_list'
     _PROPOSAL_LIST_KEYS = 'proposal_list_keys'
+    _PROPOSAL_TALLY = 'proposal_tally'
+    _PROPOSAL_VOTES = 'proposal_votes'
+    _PROPOSAL_VOTERS = 'proposal_voters'
+    _PROPOSAL_THRESHOLDS = 'proposal_thresholds'
+    _PROPOSAL_PREP_SNAPSHOT = 'proposal_prep_snapshot'
+    _PREP_SNAPSHOTS = 'prep_snapshots'
+    _PREP_SNAPSHOT_IDS = 'prep_snapshot_ids'
+    _PREP_SNAPSHOT_MEMBERS = 'prep_snapshot_members'
+    _PREP_SNAPSHOT_COUNT = 'prep_snapshot_count'
+    _PROPOSAL_SEQ = 'proposal_seq'
+    _PROPOSAL_TYPE_INDEX = 'proposal_type_index_'
+    _PROPOSAL_STATUS_INDEX = 'proposal_status_index_'
+    _PROPOSAL_TYPE_STATUS_INDEX = 'proposal_type_status_index_'
+    _PROPOSAL_PROPOSER_INDEX = 'proposal_proposer_index_'
+    _PROPOSAL_COUNT = 'proposal_count'
+    _PROPOSAL_PROPOSER_COUNT = 'proposal_proposer_count'
+    _PREP_VOTES = 'prep_votes'
+    _PREP_VOTE_COUNT = 'prep_vote_count'
+    _PROPOSAL_EXPIRY_QUEUE = 'proposal_expiry_queue'
+    _PROPOSAL_EXPIRY_HEAD = 'proposal_expiry_head'
+    _PROPOSAL_ARCHIVE = 'proposal_archive'
+    _PROPOSAL_ARCHIVE_HEAD = 'proposal_archive_head'
+    _PROPOSAL_CHANGE_LOG = 'proposal_change_log'
+    _PROPOSAL_MAX_PAGE_SIZE = 'proposal_max_page_size'
+    # an entry of the expiry queue and the change log is block_height << _EXPIRY_SEQ_BITS | seq
+    _EXPIRY_SEQ_BITS = 32
 
     def __init__(self, db: IconScoreDatabase) -> None:
+        self._db = db
+        # immutable header of the proposal written once at registration
         self._proposal_list = DictDB(self._PROPOSAL_LIST, db, value_type=bytes)
         self._proposal_list_keys = ArrayDB(self._PROPOSAL_LIST_KEYS, db, value_type=bytes)
+        # status and vote counts of the proposal, updated on every vote
+        self._proposal_tally = DictDB(self._PROPOSAL_TALLY, db, value_type=bytes)
+        # vote of each voter: proposal id -> voter address -> ProposalVote
+        self._proposal_votes = DictDB(self._PROPOSAL_VOTES, db, value_type=bytes, depth=2)
+        # voters of each vote type in order of voting: proposal id -> vote type -> position -> voter address
+        self._proposal_voters = DictDB(self._PROPOSAL_VOTERS, db, value_type=Address, depth=3)
+        # votes needed to approve or disapprove the proposal, fixed at registration
+        self._proposal_thresholds = DictDB(self._PROPOSAL_THRESHOLDS, db, value_type=bytes)
+        # main P-Reps who can vote for the proposal: proposal id -> id of PRepSnapshot
+        self._proposal_prep_snapshot = DictDB(self._PROPOSAL_PREP_SNAPSHOT, db, value_type=int)
+        # PRepSnapshot shared by the proposals registered while the same main P-Reps serve. Ids start from 1
+        self._prep_snapshots = DictDB(self._PREP_SNAPSHOTS, db, value_type=bytes)
+        self._prep_snapshot_ids = DictDB(self._PREP_SNAPSHOT_IDS, db, value_type=int)
+        # whether the address is in the snapshot: snapshot id -> address -> bool
+        self._prep_snapshot_members = DictDB(self._PREP_SNAPSHOT_MEMBERS, db, value_type=bool, depth=2)
+        self._prep_snapshot_count = VarDB(self._PREP_SNAPSHOT_COUNT, db, value_type=int)
+        # index of the proposal in _proposal_list_keys
+        self._proposal_seq = DictDB(self._PROPOSAL_SEQ, db, value_type=int)
+        # indexes of _proposal_list_keys by type and status
+        self._type_index = {
+            type_: SortedIndex(ArrayDB(f"{self._PROPOSAL_TYPE_INDEX}{type_}", db, value_type=int))
+            for type_ in range(NetworkProposalType.MIN, NetworkProposalType.MAX + 1)
+        }
+        self._status_index = {
+            status: SortedIndex(ArrayDB(f"{self._PROPOSAL_STATUS_INDEX}{status}", db, value_type=int))
+            for status in range(NetworkProposalStatus.MIN, NetworkProposalStatus.MAX + 1)
+        }
+        self._type_status_index = {
+            type_: {
+                status: SortedIndex(ArrayDB(f"{self._PROPOSAL_TYPE_STATUS_INDEX}{type_}_{status}", db, value_type=int))
+                for status in range(NetworkProposalStatus.MIN, NetworkProposalStatus.MAX + 1)
+            }
+            for type_ in range(NetworkProposalType.MIN, NetworkProposalType.MAX + 1)
+        }
+        # count of the proposals: type -> status -> count
+        self._proposal_count = DictDB(self._PROPOSAL_COUNT, db, value_type=int, depth=2)
+        # count of the proposals of each proposer: proposer address -> type -> status -> count
+        self._proposer_count = DictDB(self._PROPOSAL_PROPOSER_COUNT, db, value_type=int, depth=3)
+        # votes of each P-Rep in order of voting: voter address -> position -> PRepVote
+        self._prep_votes = DictDB(self._PREP_VOTES, db, value_type=bytes, depth=2)
+        self._prep_vote_count = DictDB(self._PREP_VOTE_COUNT, db, value_type=int)
+        # proposals ordered by end block height and the count of entries already swept
+        self._expiry_queue = SortedIndex(ArrayDB(self._PROPOSAL_EXPIRY_QUEUE, db, value_type=int))
+        self._expiry_head = VarDB(self._PROPOSAL_EXPIRY_HEAD, db, value_type=int)
+        # votes of expired proposals in a single ProposalArchive in place of their votes and thresholds,
+        # and the count of the expiry queue entries already archived
+        self._proposal_archive = DictDB(self._PROPOSAL_ARCHIVE, db, value_type=bytes)
+        self._archive_head = VarDB(self._PROPOSAL_ARCHIVE_HEAD, db, value_type=int)
+        # proposals registered, voted, canceled or finalized in order of the block height and the proposal
+        self._change_log = SortedIndex(ArrayDB(self._PROPOSAL_CHANGE_LOG, db, value_type=int))
+        # maximum size of a page of proposals set by the owner, 0 for MAX_GET_PROPOSALS_PAGE_SIZE
+        self._max_page_size = VarDB(self._PROPOSAL_MAX_PAGE_SIZE, db, value_type=int)
+
+        # Results of `get_proposal` for archived proposals, keyed by the records they are rendered from. An entry is
+        # what any call reading the same records renders, so it can be shared by the invoke and the queries.
+        self._rendered_archives = {}
 
     def register_proposal(self, id: bytes, proposer: 'Address', start: int, expired: int,
                           title: str, description: str, type: int, value: dict, main_preps: list) -> None:
@@ -68,17 +169,17 @@ class NetworkProposal:
         :param value: specific value of the proposal
         :param main_preps: main preps in list, List['PRepInfo']
         """
+        headers = ProposalHeaders(self._proposal_list)
+        seq = len(self._proposal_list_keys)
         self._proposal_list_keys.put(id)
         _STATUS = NetworkProposalStatus.VOTING
 
-        main_prep_addresses = []
-        main_prep_total_delegated = 0
+        snapshot = PRepSnapshot.from_main_preps(main_preps)
         proposer_name = ''
         for main_prep in main_preps:
-            main_prep_addresses.append(str(main_prep.address))
-            main_prep_total_delegated += main_prep.delegated
             if main_prep.address == proposer:
                 proposer_name = main_prep.name
+                break
 
         _VOTER = {
             "agree": {
@@ -90,14 +191,18 @@ class NetworkProposal:
                 "amount": 0
             },
             "noVote": {
-                "list": main_prep_addresses,
-                "amount": main_prep_total_delegated
+                "list": snapshot.addresses,
+                "amount": snapshot.total_delegated
             }
         }
 
         proposal_info = ProposalInfo(id, proposer, proposer_name, title, description, type, value, start, expired,
-                                     _STATUS, _VOTER, len(main_prep_addresses), main_prep_total_delegated)
-        self._proposal_list[id] = proposal_info.to_bytes()
+                                     _STATUS, _VOTER, len(snapshot.preps), snapshot.total_delegated)
+        headers.put(id, proposal_info)
+        self._proposal_tally[id] = ProposalTally.from_proposal_info(proposal_info).to_bytes()
+        self._proposal_thresholds[id] = ProposalThresholds.from_proposal_info(proposal_info).to_bytes()
+        self._proposal_prep_snapshot[id] = self._put_prep_snapshot(snapshot)
+        self._add_to_indexes(id, seq, proposal_info)
 
     def cancel_proposal(self, id: bytes, proposer: 'Address', current_block_height: int) -> None:
         """ Set status out of the proposal's info to NetworkProposalStatus.CANCELED
@@ -106,10 +211,12 @@ class NetworkProposal:
         :param proposer: address of EOA who want to cancel this proposal
         :param current_block_height: current block height
         """
-        if not self._check_registered_proposal(id):
+        headers = ProposalHeaders(self._proposal_list)
+        if not self._check_registered_proposal(id, headers):
             revert("No registered proposal")
 
-        proposal_info = ProposalInfo.from_bytes(self._proposal_list[id])
+        proposal_info = headers.get(id)
+        tally = ProposalTally.from_bytes(self._proposal_tally[id])
 
         if proposal_info.end_block_height < current_block_height:
             revert("This proposal has already expired")
@@ -117,96 +224,130 @@ class NetworkProposal:
         if proposer != proposal_info.proposer:
             revert("No permission - only for proposer")
 
-        if proposal_info.status != NetworkProposalStatus.VOTING:
+        if tally.status != NetworkProposalStatus.VOTING:
             revert("Can not be canceled - only voting proposal")
 
-        proposal_info.status = NetworkProposalStatus.CANCELED
-        self._proposal_list[id] = proposal_info.to_bytes()
+        self._set_status(id, tally, headers, NetworkProposalStatus.CANCELED)
+        self._proposal_tally[id] = tally.to_bytes()
+        self._log_change(current_block_height, self._proposal_seq[id])
 
-    def vote_proposal(self, id: bytes, voter_address: 'Address', vote_type: int, current_block_height: int,
-                      tx_hash: bytes, timestamp: int, main_preps: list) -> (bool, int, dict):
+    def vote_proposal(self, id: bytes, voter: 'PRepInfo', vote_type: int, current_block_height: int,
+                      tx_hash: bytes, timestamp: int) -> (bool, int, dict):
         """ Vote for the proposal - agree or disagree
         
         :param id: transaction hash to vote to the proposal
-        :param voter_address: voter address
+        :param voter: main prep who votes, PRepInfo
         :param vote_type: votes type - agree(NetworkProposalVote.AGREE, 1) or disagree(NetworkProposalVote.DISAGREE, 0)
         :param current_block_height: current block height
         :param tx_hash: generated transaction hash of this transaction to vote the proposal
         :param timestamp: timestamp of this transaction to vote the proposal
-        :param main_preps: main preps list
         :return: bool - True means success for voting and False means failure for voting
         """
+        headers = ProposalHeaders(self._proposal_list)
         if not self._validate_vote_type(vote_type):
             revert(f"Invalid vote parameter: {vote_type}")
 
-        if not self._check_registered_proposal(id):
+        if not self._check_registered_proposal(id, headers):
             revert("No registered proposal")
 
-        proposal_info = ProposalInfo.from_bytes(self._proposal_list[id])
+        proposal_info = headers.get(id)
+        tally = ProposalTally.from_bytes(self._proposal_tally[id])
 
         if proposal_info.end_block_height < current_block_height:
             revert("This proposal has already expired")
 
-        if proposal_info.status == NetworkProposalStatus.CANCELED:
+        if tally.status == NetworkProposalStatus.CANCELED:
             revert("This proposal has already canceled")
 
-        _VOTE_TYPE_IN_STR = "agree" if vote_type == NetworkProposalVote.AGREE else "disagree"
-        _NO_VOTE_IN_STR = "noVote"
-
-        addresses_of_voters_agreeing_or_disagreeing = \
-            [voter["address"] for voter in proposal_info.vote["agree"]["list"]] \
-            + [voter["address"] for voter in proposal_info.vote["disagree"]["list"]]
-
-        if str(voter_address) in addresses_of_voters_agreeing_or_disagreeing:
+        votes = self._proposal_votes[id]
+        if votes[voter.address] is not None:
             revert("Already voted")
 
-        if str(voter_address) not in proposal_info.vote["noVote"]["list"]:
+        if not self._prep_snapshot_members[self._proposal_prep_snapshot[id]][voter.address]:
             revert("No permission - only for main prep when network proposal registered")
 
-        for main_prep in main_preps:
-            if main_prep.address == voter_address:
-                voter_in_dict = self._generate_voter_in_dict(tx_hash, timestamp, main_prep)
-
-        proposal_info.vote[_VOTE_TYPE_IN_STR]["list"].append(voter_in_dict)
-        proposal_info.vote[_VOTE_TYPE_IN_STR]["amount"] += voter_in_dict["amount"]
-
-        proposal_info.vote[_NO_VOTE_IN_STR]["list"].remove(voter_in_dict["address"])
-        proposal_info.vote[_NO_VOTE_IN_STR]["amount"] -= voter_in_dict["amount"]
+        vote = ProposalVote(vote_type, tally.count_of_voters(), tx_hash, timestamp, voter.name, voter.delegated)
+        votes[voter.address] = vote.to_bytes()
+        self._add_voter(id, vote_type, tally, voter.address)
+        tally.add_vote(vote_type, vote.amount)
+        seq = self._proposal_seq[id]
+        self._add_prep_vote(voter.address, PRepVote(seq, vote_type, current_block_height))
+        self._log_change(current_block_height, seq)
 
         # set status
         approved = False
-        if proposal_info.status == NetworkProposalStatus.VOTING:
-            if self._check_vote_result(vote_type, proposal_info):
+        if tally.status == NetworkProposalStatus.VOTING:
+            thresholds = ProposalThresholds.from_bytes(self._proposal_thresholds[id])
+            if self._check_vote_result(vote_type, thresholds, tally):
                 if vote_type == NetworkProposalVote.AGREE:
-                    proposal_info.status = NetworkProposalStatus.APPROVED
+                    self._set_status(id, tally, headers, NetworkProposalStatus.APPROVED)
                     approved = True
                 else:
-                    proposal_info.status = NetworkProposalStatus.DISAPPROVED
-            elif len(proposal_info.vote["noVote"]["list"]) == 0:
+                    self._set_status(id, tally, headers, NetworkProposalStatus.DISAPPROVED)
+            elif tally.vote["noVote"]["count"] == 0:
                 # All voters voted but the status is still VOTING. Set status to DISAPPROVED
-                proposal_info.status = NetworkProposalStatus.DISAPPROVED
+                self._set_status(id, tally, headers, NetworkProposalStatus.DISAPPROVED)
 
-        self._proposal_list[id] = proposal_info.to_bytes()
+        self._proposal_tally[id] = tally.to_bytes()
 
         return approved, proposal_info.type, proposal_info.value
 
-    def get_proposal(self, id: bytes, current_block_height: int) -> dict:
+    def get_proposal(self, id: bytes, current_block_height: int, voters: str = None, start: int = 0,
+                     size: int = MAX_GET_VOTERS_PAGE_SIZE) -> dict:
         """ Get proposal information by ID
 
         :param id: transaction hash to register the proposal
         :param current_block_height: current block height
+        :param voters: voter lists to include. None or "all" means all the lists. "none" means the count and the amount
+        of each vote only as `get_proposals` does. "agree", "disagree" or "noVote" means a page of the list with
+        the count and the amount of each vote (optional)
+        :param start: count of the voters to skip in the list given by `voters`. Default is 0 (optional)
+        :param size: size of the page of the list given by `voters`. Default and maximum is 50 (optional)
         :return: the proposal info in result format in dict
         """
-        if not self._check_registered_proposal(id):
+        headers = ProposalHeaders(self._proposal_list)
+        if voters is not None and voters not in ("all", "none", "agree", "disagree", "noVote"):
+            revert(f"Invalid voters parameter: {voters}")
+
+        if start < 0:
+            revert(f"Invalid start parameter: {start}")
+
+        if size <= 0:
+            revert(f"Invalid size parameter: {size}")
+
+        # a page of a voter list is read apart from the rest, so the summary is enough
+        result = self._get_proposal_in_dict(id, current_block_height, headers, voters is None or voters == "all")
+        if result is None:
             revert("No registered proposal")
 
-        proposal_info = ProposalInfo.from_bytes(self._proposal_list[id])
+        if voters in ("agree", "disagree", "noVote"):
+            result["vote"][voters]["list"] = self._get_voters_page(id, voters, start,
+                                                                   min(MAX_GET_VOTERS_PAGE_SIZE, size))
+        return result
 
-        if proposal_info.end_block_height < current_block_height:
-            if proposal_info.status == NetworkProposalStatus.VOTING:
-                proposal_info.status = NetworkProposalStatus.DISAPPROVED
+    def get_proposals_by_ids(self, ids: list, current_block_height: int, include_voters: bool = True) -> dict:
+        """ Get proposal information of several IDs in the given order
+
+        :param ids: transaction hashes to register the proposals
+        :param current_block_height: current block height
+        :param include_voters: include the voter lists as `get_proposal` does. If False, only the count and the amount
+        of each vote are included as `get_proposals` does (optional)
+        :return: the proposal info list in result format in dict. The item of an unregistered ID is None
+        """
+        headers = ProposalHeaders(self._proposal_list)
+        if not 0 < len(ids) <= MAX_GET_PROPOSALS_BY_IDS_SIZE:
+            revert(f"Invalid ids parameter: count must be 1 to {MAX_GET_PROPOSALS_BY_IDS_SIZE}")
+
+        results = {}
+        proposals = []
+        for id in ids:
+            if id not in results:
+                results[id] = self._get_proposal_in_dict(id, current_block_height, headers, include_voters)
+            proposals.append(results[id])
 
-        result = self._generate_proposal_info_in_dict_for_get_proposal(proposal_info)
+        result = {
+            "proposals": proposals
+        }
         return result
 
     def get_proposals(self, current_block_height: int, type: int = None, status: int = None, start: int = 0, size: int = MAX_GET_PROPOSALS_SIZE) -> dict:
@@ -215,10 +356,12 @@ class NetworkProposal:
         :param current_block_height: current block height
         :param type: type of network proposal to filter (optional)
         :param status: status of network proposal to filter (optional)
-        :param start: starting index of network proposal to filter. Default is 0, which means the latest (optional)
+        :param start: count of the matching network proposals to skip. Default is 0, which means the latest (optional)
         :param size: size of network proposal to filter. Default and maximum is 10 (optional)
-        :return: the proposal info list in result format in dict
+        :return: the proposal info list in result format in dict. Up to MAX_SKIPPED_PROPOSALS_SIZE proposals are
+        looked up to filter VOTING or DISAPPROVED ones in a call, so the list may end before `size` proposals
         """
+        headers = ProposalHeaders(self._proposal_list)
         if type is not None and not self._validate_proposal_type(type):
             revert(f"Invalid type parameter: {type}")
 
@@ -231,32 +374,606 @@ class NetworkProposal:
 
         self._validate_proposal_index(start, size, total_proposals - 1)
 
-        start_idx = total_proposals - start - 1
-        count = min(MAX_GET_PROPOSALS_SIZE, size, total_proposals - start)
+        count = min(MAX_GET_PROPOSALS_SIZE, size)
+
+        # skipped in the index without decoding the proposals if the index has the matching proposals only
+        if self._is_exact_index(type, status):
+            seqs = self._iter_proposal_seqs(type, status, start=start)
+            start = 0
+        else:
+            seqs = None
+
+        proposals = []
+        for _, proposal_info, tally in self._iter_matching_proposals(current_block_height, headers, type, status,
+                                                                     seqs=seqs, start=start):
+            if proposal_info is None:
+                break
+
+            proposal_info_in_dict = self._generate_proposal_info_in_dict_for_get_proposals(proposal_info, tally)
+            proposals.append(proposal_info_in_dict)
+            if len(proposals) == count:
+                break
+
+        result = {
+            "proposals": proposals
+        }
+        return result
+
+    def get_proposals_by_cursor(self, current_block_height: int, type: int = None, status: int = None,
+                                cursor: int = None, size: int = MAX_GET_PROPOSALS_PAGE_SIZE) -> dict:
+        """ Get a page of proposal list filtered by type and status, the latest first
+
+        The cursor points the position in the proposal list, so the pages are not shifted by new proposals.
+
+        :param current_block_height: current block height
+        :param type: type of network proposal to filter (optional)
+        :param status: status of network proposal to filter (optional)
+        :param cursor: `next` of the previous page. None means the latest (optional)
+        :param size: size of the page. Default is 50 and so is the maximum unless changed by the owner (optional)
+        :return: the proposal info list, the total count of proposals matching the filters and the cursor of the next
+        page in dict
+        """
+        headers = ProposalHeaders(self._proposal_list)
+        return self._get_proposal_page(current_block_height, type, status, cursor, size, headers)
+
+    def get_proposals_by_proposer(self, current_block_height: int, proposer: 'Address', type: int = None,
+                                  status: int = None, cursor: int = None,
+                                  size: int = MAX_GET_PROPOSALS_PAGE_SIZE) -> dict:
+        """ Get a page of proposal list of the proposer filtered by type and status, the latest first
+
+        :param current_block_height: current block height
+        :param proposer: address of the proposer
+        :param type: type of network proposal to filter (optional)
+        :param status: status of network proposal to filter (optional)
+        :param cursor: `next` of the previous page. None means the latest (optional)
+        :param size: size of the page. Default is 50 and so is the maximum unless changed by the owner (optional)
+        :return: the proposal info list, the total count of proposals of the proposer matching the filters and
+        the cursor of the next page in dict
+        """
+        headers = ProposalHeaders(self._proposal_list)
+        return self._get_proposal_page(current_block_height, type, status, cursor, size, headers, proposer)
+
+    def get_max_page_size(self) -> int:
+        """ Get the maximum size of a page of `get_proposals_by_cursor`, `get_proposals_by_proposer` and
+        `get_proposals_since`
+        """
+        max_page_size = self._max_page_size.get()
+        return max_page_size if max_page_size > 0 else MAX_GET_PROPOSALS_PAGE_SIZE
+
+    def set_max_page_size(self, size: int) -> None:
+        """ Set the maximum size of a page of `get_proposals_by_cursor`, `get_proposals_by_proposer` and
+        `get_proposals_since`
+
+        :param size: maximum size of a page, up to MAX_PROPOSALS_PAGE_SIZE_LIMIT
+        """
+        if not 0 < size <= MAX_PROPOSALS_PAGE_SIZE_LIMIT:
+            revert(f"Invalid size parameter: {size}")
+        self._max_page_size.set(size)
+
+    def _get_proposal_page(self, current_block_height: int, type: int, status: int, cursor: int, size: int,
+                           headers: 'ProposalHeaders', proposer: 'Address' = None) -> dict:
+        """ Get a page of proposal list for `get_proposals_by_cursor` and `get_proposals_by_proposer`
+
+        :param headers: headers of the proposals read in the call
+        :param proposer: iterate the proposals of the proposer instead of all proposals (optional)
+        """
+        if type is not None and not self._validate_proposal_type(type):
+            revert(f"Invalid type parameter: {type}")
+
+        if status is not None and not self._validate_proposal_status(status):
+            revert(f"Invalid status parameter: {status}")
+
+        if cursor is not None and not 0 <= cursor <= len(self._proposal_list_keys):
+            revert(f"Invalid cursor parameter: {cursor}")
+
+        if size <= 0:
+            revert(f"Invalid size parameter: {size}")
+
+        count = min(self.get_max_page_size(), size)
+
+        if proposer is None:
+            seqs = None
+            if type is None and status is None:
+                total_proposals = len(self._proposal_list_keys)
+            else:
+                total_proposals = self._count_proposals(current_block_height, headers, type, status)
+        else:
+            proposer_index = self._proposer_index(proposer)
+            seqs = proposer_index.iter_reversed(below=cursor)
+            if type is None and status is None:
+                total_proposals = len(proposer_index)
+            else:
+                total_proposals = self._count_proposals(current_block_height, headers, type, status, proposer)
 
         proposals = []
-        for i in range(count):
-            hash = self._proposal_list_keys.get(start_idx-i)
-            proposal_info = ProposalInfo.from_bytes(self._proposal_list[hash])
+        has_more = False
+        next_cursor = None
+        for seq, proposal_info, tally in self._iter_matching_proposals(current_block_height, headers, type, status,
+                                                                       cursor, seqs):
+            if proposal_info is None:
+                # the next page goes on from the proposal not looked up yet
+                has_more = True
+                next_cursor = seq
+                break
+
+            if len(proposals) == count:
+                has_more = True
+                break
+
+            proposal_info_in_dict = self._generate_proposal_info_in_dict_for_get_proposals(proposal_info, tally)
+            proposals.append(proposal_info_in_dict)
+            next_cursor = seq
+
+        result = {
+            "proposals": proposals,
+            "total": hex(total_proposals),
+            "hasMore": has_more
+        }
+        if has_more:
+            result["next"] = hex(next_cursor)
+        return result
+
+    def _get_proposal_in_dict(self, id: bytes, current_block_height: int, headers: 'ProposalHeaders',
+                              include_voters: bool) -> dict:
+        """ Get proposal information in the format of `get_proposal` or `get_proposals`, None if unregistered """
+        if not self._check_registered_proposal(id, headers):
+            return None
+
+        if include_voters:
+            archived_votes = self._proposal_archive[id]
+            if archived_votes is not None:
+                # archived proposals are finalized already and not changed any more
+                return self._get_archived_proposal_in_dict(id, headers, archived_votes)
+            proposal_info = self._get_proposal_info(id, headers)
+            tally = None
+        else:
+            proposal_info = headers.get(id)
+            tally = ProposalTally.from_bytes(self._proposal_tally[id])
+            proposal_info.status = tally.status
+
+        if proposal_info.end_block_height < current_block_height:
+            if proposal_info.status == NetworkProposalStatus.VOTING:
+                proposal_info.status = NetworkProposalStatus.DISAPPROVED
+
+        if include_voters:
+            return self._generate_proposal_info_in_dict_for_get_proposal(proposal_info)
+        return self._generate_proposal_info_in_dict_for_get_proposals(proposal_info, tally)
+
+    def _get_archived_proposal_in_dict(self, id: bytes, headers: 'ProposalHeaders', archived_votes: bytes) -> dict:
+        """ Get the archived proposal in the format of `get_proposal`, rendered once for the same records
+
+        Up to MAX_RENDERED_ARCHIVES_SIZE results are kept. The result is shared by the callers, who must not change it.
+        """
+        snapshot_in_bytes = self._prep_snapshots[self._proposal_prep_snapshot[id]]
+        key = (headers.get_in_bytes(id), self._proposal_tally[id], snapshot_in_bytes, archived_votes)
+        rendered_archives = self._rendered_archives
+        proposal_info_in_dict = rendered_archives.get(key)
+        if proposal_info_in_dict is None:
+            proposal_info_in_dict = self._generate_proposal_info_in_dict_for_get_proposal(
+                self._get_proposal_info(id, headers))
+            if len(rendered_archives) >= MAX_RENDERED_ARCHIVES_SIZE:
+                # replaced rather than evicted in place, as other calls may read it at the same time
+                rendered_archives = {}
+                self._rendered_archives = rendered_archives
+            rendered_archives[key] = proposal_info_in_dict
+        return proposal_info_in_dict
+
+    def _get_voters_page(self, id: bytes, vote_type_in_str: str, start: int, size: int) -> list:
+        """ Get a page of the voter list of the vote type in the format of `get_proposal`
+
+        Votes are read only for the page. The noVote list is read from the P-Rep snapshot, skipping the voters.
+        """
+        snapshot = PRepSnapshot.from_bytes(self._prep_snapshots[self._proposal_prep_snapshot[id]])
+        archived_votes = self._proposal_archive[id]
+        if archived_votes is not None:
+            # a single record already read as a whole
+            votes = ProposalArchive.from_bytes(archived_votes, snapshot).votes
+            if vote_type_in_str == "noVote":
+                voted = set(address for address, _ in votes)
+                return [address for address in snapshot.addresses if address not in voted][start:start + size]
+            vote_type = NetworkProposalVote.AGREE if vote_type_in_str == "agree" else NetworkProposalVote.DISAGREE
+            votes = [(address, vote) for address, vote in votes if vote.vote_type == vote_type][start:start + size]
+        else:
+            tally = ProposalTally.from_bytes(self._proposal_tally[id])
+            if vote_type_in_str == "noVote":
+                return self._get_no_voters_page(id, snapshot.addresses, tally.count_of_voters(), start, size)
+            vote_type = NetworkProposalVote.AGREE if vote_type_in_str == "agree" else NetworkProposalVote.DISAGREE
+            voters = self._proposal_voters[id][vote_type]
+            votes_of_proposal = self._proposal_votes[id]
+            votes = []
+            for position in range(start, min(start + size, tally.vote[vote_type_in_str]["count"])):
+                address = voters[position]
+                votes.append((str(address), ProposalVote.from_bytes(votes_of_proposal[address])))
+
+        voters_in_dict = []
+        for address, vote in votes:
+            voter_in_dict = vote.to_voter_in_dict(address)
+            voter_in_dict["timestamp"] = hex(voter_in_dict["timestamp"])
+            voter_in_dict["amount"] = hex(voter_in_dict["amount"])
+            voters_in_dict.append(voter_in_dict)
+        return voters_in_dict
+
+    def _get_no_voters_page(self, id: bytes, registered_voters: list, count_of_votes: int, start: int,
+                            size: int) -> list:
+        votes_of_proposal = self._proposal_votes[id]
+        no_voters = []
+        for address in registered_voters:
+            if len(no_voters) == start + size:
+                break
+
+            # once all the voters are found, the rest have not voted
+            if count_of_votes > 0 and votes_of_proposal[Address.from_string(address)] is not None:
+                count_of_votes -= 1
+                continue
+            no_voters.append(address)
+        return no_voters[start:]
+
+    def _iter_matching_proposals(self, current_block_height: int, headers: 'ProposalHeaders', type: int = None,
+                                 status: int = None, below: int = None, seqs=None, start: int = 0):
+        """ Iterate proposals matching the filters, the latest first
+
+        Up to MAX_SKIPPED_PROPOSALS_SIZE proposals not matching or skipped by `start` are looked up. If it stops
+        for the limit, the index to go on below is given with None in place of ProposalInfo and ProposalTally.
+
+        :param current_block_height: current block height
+        :param headers: headers of the proposals read in the call
+        :param type: type of network proposal to filter
+        :param status: status of network proposal to filter
+        :param below: iterate proposals whose index in _proposal_list_keys is less than it only
+        :param seqs: indexes in _proposal_list_keys to filter instead of the ones from the type and status indexes.
+        They should be in descending order and less than `below`
+        :param start: count of the matching proposals to skip
+        :return: index in _proposal_list_keys, ProposalInfo and ProposalTally of the proposal
+        """
+        if seqs is None:
+            seqs = self._iter_proposal_seqs(type, status, below)
+        skipped = 0
+        for seq in seqs:
+            if skipped == MAX_SKIPPED_PROPOSALS_SIZE:
+                yield seq + 1, None, None
+                return
+
+            hash = self._proposal_list_keys.get(seq)
+            proposal_info = headers.get(hash)
+            tally = ProposalTally.from_bytes(self._proposal_tally[hash])
+            proposal_info.status = tally.status
 
             if proposal_info.end_block_height < current_block_height:
                 if proposal_info.status == NetworkProposalStatus.VOTING:
                     proposal_info.status = NetworkProposalStatus.DISAPPROVED
 
             if type is not None and proposal_info.type != type:
+                skipped += 1
                 continue
 
             if status is not None and proposal_info.status != status:
+                skipped += 1
                 continue
 
-            proposal_info_in_dict = self._generate_proposal_info_in_dict_for_get_proposals(proposal_info)
-            proposals.append(proposal_info_in_dict)
+            if start > 0:
+                start -= 1
+                skipped += 1
+                continue
+
+            yield seq, proposal_info, tally
+
+    def finalize_expired_proposals(self, current_block_height: int, limit: int) -> int:
+        """ Set status of VOTING proposals whose voting period has ended to DISAPPROVED
+
+        Proposals are visited in order of their end block height and at most `limit` entries of the expiry queue are
+        visited in a call. Entries of proposals which were decided by votes or canceled are skipped.
+
+        :param current_block_height: current block height
+        :param limit: maximum count of the expiry queue entries to visit
+        :return: count of the proposals set to DISAPPROVED
+        """
+        headers = ProposalHeaders(self._proposal_list)
+        head = self._expiry_head.get()
+        end = min(len(self._expiry_queue), head + limit)
+        seq_mask = (1 << self._EXPIRY_SEQ_BITS) - 1
+
+        count = 0
+        while head < end:
+            entry = self._expiry_queue.get(head)
+            if entry >> self._EXPIRY_SEQ_BITS >= current_block_height:
+                break
+            head += 1
+
+            seq = entry & seq_mask
+            id = self._proposal_list_keys.get(seq)
+            tally = ProposalTally.from_bytes(self._proposal_tally[id])
+            if tally.status != NetworkProposalStatus.VOTING:
+                continue
+            self._set_status(id, tally, headers, NetworkProposalStatus.DISAPPROVED)
+            self._proposal_tally[id] = tally.to_bytes()
+            self._log_change(current_block_height, seq)
+            count += 1
+
+        self._expiry_head.set(head)
+        return count
+
+    def archive_proposals(self, limit: int) -> int:
+        """ Archive proposals finalized by `finalize_expired_proposals`
+
+        Expired proposals can not be changed any more. Their votes are written as a single ProposalArchive and
+        their votes and thresholds are removed. The header, the tally and the link to the P-Rep snapshot are kept.
+
+        :param limit: maximum count of the proposals to archive
+        :return: count of the proposals archived
+        """
+        head = self._archive_head.get()
+        end = min(self._expiry_head.get(), head + limit)
+        seq_mask = (1 << self._EXPIRY_SEQ_BITS) - 1
+
+        count = end - head
+        while head < end:
+            id = self._proposal_list_keys.get(self._expiry_queue.get(head) & seq_mask)
+            self._archive_proposal(id)
+            head += 1
+
+        self._archive_head.set(head)
+        return count
+
+    def _archive_proposal(self, id: bytes) -> None:
+        snapshot = PRepSnapshot.from_bytes(self._prep_snapshots[self._proposal_prep_snapshot[id]])
+        tally = ProposalTally.from_bytes(self._proposal_tally[id])
+        votes = self._get_votes(id, snapshot.addresses, tally.count_of_voters())
+        self._proposal_archive[id] = ProposalArchive(votes).to_bytes(snapshot)
+
+        votes_of_proposal = self._proposal_votes[id]
+        for address, _ in votes:
+            votes_of_proposal.remove(Address.from_string(address))
+        for vote_type, vote_type_in_str in ((NetworkProposalVote.AGREE, "agree"),
+                                            (NetworkProposalVote.DISAGREE, "disagree")):
+            voters = self._proposal_voters[id][vote_type]
+            for position in range(tally.vote[vote_type_in_str]["count"]):
+                voters.remove(position)
+        self._proposal_thresholds.remove(id)
+
+    def get_proposals_since(self, current_block_height: int, block_height: int, cursor: int = None,
+                            size: int = MAX_GET_PROPOSALS_PAGE_SIZE) -> dict:
+        """ Get a page of proposals changed at or after the block height, in order of the block height of the change
+
+        A proposal changed several times in the page is included once with its current information.
+
+        :param current_block_height: current block height
+        :param block_height: block height from which changes are included
+        :param cursor: `next` of the previous page. If given, `block_height` is ignored (optional)
+        :param size: size of the page. Default is 50 and so is the maximum unless changed by the owner (optional)
+        :return: the proposal info list and the cursor of the next changes in dict
+        """
+        headers = ProposalHeaders(self._proposal_list)
+        total_changes = len(self._change_log)
+        if cursor is None:
+            if block_height < 0:
+                revert(f"Invalid blockHeight parameter: {block_height}")
+            cursor = self._change_log.bisect_left(block_height << self._EXPIRY_SEQ_BITS)
+        elif not 0 <= cursor <= total_changes:
+            revert(f"Invalid cursor parameter: {cursor}")
+
+        if size <= 0:
+            revert(f"Invalid size parameter: {size}")
+
+        count = min(self.get_max_page_size(), size)
+        seq_mask = (1 << self._EXPIRY_SEQ_BITS) - 1
+
+        proposals = []
+        seqs = set()
+        while cursor < total_changes:
+            seq = self._change_log.get(cursor) & seq_mask
+            if seq not in seqs:
+                if len(proposals) == count:
+                    break
+                seqs.add(seq)
+                id = self._proposal_list_keys.get(seq)
+                proposals.append(self._get_proposal_in_dict(id, current_block_height, headers, False))
+            cursor += 1
 
         result = {
-            "proposals": proposals
+            "proposals": proposals,
+            "hasMore": cursor < total_changes,
+            "next": hex(cursor)
+        }
+        return result
+
+    def get_votes_by_prep(self, address: 'Address', cursor: int = None, size: int = MAX_GET_VOTES_PAGE_SIZE) -> dict:
+        """ Get a page of the votes of the P-Rep, the latest first
+
+        :param address: address of the P-Rep
+        :param cursor: `next` of the previous page. None means the latest (optional)
+        :param size: size of the page. Default and maximum is 50 (optional)
+        :return: the vote list, the total count of votes and the cursor of the next page in dict
+        """
+        total_votes = self._prep_vote_count[address]
+        if cursor is None:
+            cursor = total_votes
+        elif not 0 <= cursor <= total_votes:
+            revert(f"Invalid cursor parameter: {cursor}")
+
+        if size <= 0:
+            revert(f"Invalid size parameter: {size}")
+
+        end = max(0, cursor - min(MAX_GET_VOTES_PAGE_SIZE, size))
+        prep_votes = self._prep_votes[address]
+        votes = []
+        for position in range(cursor - 1, end - 1, -1):
+            prep_vote = PRepVote.from_bytes(prep_votes[position])
+            votes.append({
+                "id": '0x' + bytes.hex(self._proposal_list_keys.get(prep_vote.proposal_seq)),
+                "vote": hex(prep_vote.vote_type),
+                "blockHeight": hex(prep_vote.block_height)
+            })
+
+        result = {
+            "votes": votes,
+            "total": hex(total_votes),
+            "hasMore": end > 0
         }
+        if end > 0:
+            result["next"] = hex(end)
         return result
 
+    def get_proposal_stats(self, current_block_height: int) -> dict:
+        """ Get the count of proposals by status and type
+
+        VOTING proposals whose voting period has ended are counted as DISAPPROVED as in `get_proposals`.
+        Up to MAX_FINALIZE_EXPIRED_SIZE of them not finalized yet are looked up, so the counts are approximate
+        if more of them are left, until `finalize_expired_proposals` catches up.
+
+        :param current_block_height: current block height
+        :return: the total count, the counts by status, the counts by type and status and whether the counts are
+        approximate in dict
+        """
+        headers = ProposalHeaders(self._proposal_list)
+        statuses = range(NetworkProposalStatus.MIN, NetworkProposalStatus.MAX + 1)
+        counts = {
+            type_: {status: self._proposal_count[type_][status] for status in statuses}
+            for type_ in range(NetworkProposalType.MIN, NetworkProposalType.MAX + 1)
+        }
+
+        expired, approximate = self._get_expired_voting_headers(current_block_height, headers)
+        for proposal_info in expired:
+            counts_of_type = counts[proposal_info.type]
+            counts_of_type[NetworkProposalStatus.VOTING] -= 1
+            counts_of_type[NetworkProposalStatus.DISAPPROVED] += 1
+
+        result = {
+            "total": hex(len(self._proposal_list_keys)),
+            "byStatus": {
+                hex(status): hex(sum(counts_of_type[status] for counts_of_type in counts.values()))
+                for status in statuses
+            },
+            "byType": {
+                hex(type_): {hex(status): hex(count) for status, count in counts_of_type.items()}
+                for type_, counts_of_type in counts.items()
+            },
+            "approximate": approximate
+        }
+        return result
+
+    def _count_proposals(self, current_block_height: int, headers: 'ProposalHeaders', type: int = None,
+                         status: int = None, proposer: 'Address' = None) -> int:
+        """ Count the proposals matching the filters as `get_proposal_stats` does
+
+        :param proposer: count the proposals of the proposer only (optional)
+        """
+        counts = self._proposal_count if proposer is None else self._proposer_count[proposer]
+        types = range(NetworkProposalType.MIN, NetworkProposalType.MAX + 1) if type is None else (type,)
+        statuses = range(NetworkProposalStatus.MIN, NetworkProposalStatus.MAX + 1) if status is None else (status,)
+        count = sum(counts[type_][status_] for type_ in types for status_ in statuses)
+
+        if status in (NetworkProposalStatus.VOTING, NetworkProposalStatus.DISAPPROVED):
+            expired, _ = self._get_expired_voting_headers(current_block_height, headers)
+            count_of_expired = sum(1 for proposal_info in expired
+                                   if (type is None or proposal_info.type == type) and
+                                   (proposer is None or proposal_info.proposer == proposer))
+            count += count_of_expired if status == NetworkProposalStatus.DISAPPROVED else -count_of_expired
+        return count
+
+    def _get_expired_voting_headers(self, current_block_height: int, headers: 'ProposalHeaders') -> (list, bool):
+        """ Get the headers of VOTING proposals whose voting period has ended, not finalized yet
+
+        Up to MAX_FINALIZE_EXPIRED_SIZE entries of the expiry queue are looked up. `finalize_expired_proposals`
+        keeps few of them left.
+
+        :param current_block_height: current block height
+        :param headers: headers of the proposals read in the call
+        :return: ProposalInfo list and whether more of them may be left
+        """
+        expired = []
+        head = self._expiry_head.get()
+        end = min(len(self._expiry_queue), head + MAX_FINALIZE_EXPIRED_SIZE)
+        seq_mask = (1 << self._EXPIRY_SEQ_BITS) - 1
+        while head < end:
+            entry = self._expiry_queue.get(head)
+            if entry >> self._EXPIRY_SEQ_BITS >= current_block_height:
+                break
+            head += 1
+
+            id = self._proposal_list_keys.get(entry & seq_mask)
+            tally = ProposalTally.from_bytes(self._proposal_tally[id])
+            if tally.status == NetworkProposalStatus.VOTING:
+                expired.append(headers.get(id))
+        approximate = head < len(self._expiry_queue) and \
+            self._expiry_queue.get(head) >> self._EXPIRY_SEQ_BITS < current_block_height
+        return expired, approximate
+
+    @staticmethod
+    def _is_exact_index(type: int = None, status: int = None) -> bool:
+        """ Check if `_iter_proposal_seqs` iterates the proposals matching the filters only
+
+        Proposals in the index of VOTING may have expired and DISAPPROVED ones are merged with them.
+        """
+        return status not in (NetworkProposalStatus.VOTING, NetworkProposalStatus.DISAPPROVED)
+
+    def _iter_proposal_seqs(self, type: int = None, status: int = None, below: int = None, start: int = 0):
+        """ Iterate indexes in _proposal_list_keys of proposals which can match the filters, the latest first
+
+        :param type: type of network proposal to filter
+        :param status: status of network proposal to filter
+        :param below: iterate indexes less than it only
+        :param start: count of the indexes to skip. Only for the filters `_is_exact_index` accepts
+        """
+        if status is None:
+            if type is None:
+                end = len(self._proposal_list_keys) if below is None else below
+                return range(end - 1 - start, -1, -1)
+            return self._type_index[type].iter_reversed(start, below)
+
+        status_indexes = self._status_index if type is None else self._type_status_index[type]
+        if status == NetworkProposalStatus.DISAPPROVED:
+            # VOTING proposals which have expired but have not been finalized yet are DISAPPROVED
+            return SortedIndex.merge_reversed([status_indexes[status], status_indexes[NetworkProposalStatus.VOTING]],
+                                              below)
+        return status_indexes[status].iter_reversed(start, below)
+
+    def _add_to_indexes(self, id: bytes, seq: int, proposal_info: 'ProposalInfo') -> None:
+        self._proposal_seq[id] = seq
+        self._type_index[proposal_info.type].add(seq)
+        self._status_index[proposal_info.status].add(seq)
+        self._type_status_index[proposal_info.type][proposal_info.status].add(seq)
+        self._proposer_index(proposal_info.proposer).add(seq)
+        for counts in (self._proposal_count[proposal_info.type],
+                       self._proposer_count[proposal_info.proposer][proposal_info.type]):
+            counts[proposal_info.status] = counts[proposal_info.status] + 1
+        # all the proposals are queued to be archived after expiry even if they have been decided already
+        self._expiry_queue.add(proposal_info.end_block_height << self._EXPIRY_SEQ_BITS | seq)
+        self._log_change(proposal_info.start_block_height, seq)
+
+    def _log_change(self, block_height: int, seq: int) -> None:
+        entry = block_height << self._EXPIRY_SEQ_BITS | seq
+        size = len(self._change_log)
+        if size == 0 or self._change_log.get(size - 1) != entry:
+            self._change_log.add(entry)
+
+    def _proposer_index(self, proposer: 'Address') -> 'SortedIndex':
+        """ Index of _proposal_list_keys of the proposals registered by the proposer """
+        return SortedIndex(ArrayDB(f"{self._PROPOSAL_PROPOSER_INDEX}{proposer}", self._db, value_type=int))
+
+    def _add_voter(self, id: bytes, vote_type: int, tally: 'ProposalTally', address: 'Address') -> None:
+        """ Append the voter to the voters of the vote type, before the vote is added to the tally """
+        vote_type_in_str = "agree" if vote_type == NetworkProposalVote.AGREE else "disagree"
+        self._proposal_voters[id][vote_type][tally.vote[vote_type_in_str]["count"]] = address
+
+    def _add_prep_vote(self, address: 'Address', prep_vote: 'PRepVote') -> None:
+        position = self._prep_vote_count[address]
+        self._prep_votes[address][position] = prep_vote.to_bytes()
+        self._prep_vote_count[address] = position + 1
+
+    def _set_status(self, id: bytes, tally: 'ProposalTally', headers: 'ProposalHeaders', status: int) -> None:
+        """ Set status of the tally, move the proposal to the index of the status and update the counts """
+        seq = self._proposal_seq[id]
+        proposal_info = headers.get(id)
+        type_ = proposal_info.type
+        self._status_index[tally.status].remove(seq)
+        self._status_index[status].add(seq)
+        self._type_status_index[type_][tally.status].remove(seq)
+        self._type_status_index[type_][status].add(seq)
+        for counts in (self._proposal_count[type_], self._proposer_count[proposal_info.proposer][type_]):
+            counts[tally.status] = counts[tally.status] - 1
+            counts[status] = counts[status] + 1
+        tally.status = status
+
     @staticmethod
     def _validate_proposal_type(type_: int):
         return True if NetworkProposalType.MIN <= type_ <= NetworkProposalType.MAX else False
@@ -278,39 +995,152 @@ class NetworkProposal:
         if start > max_index:
             revert(f"Invalid start parameter: Out of index {start} > {max_index}")
 
-    def _check_registered_proposal(self, id: bytes) -> bool:
+    def _check_registered_proposal(self, id: bytes, headers: 'ProposalHeaders') -> bool:
         """ Check if the proposal with ID have already registered
 
         :param id: transaction hash to register the proposal
+        :param headers: headers of the proposals read in the call
         :return: bool
         """
-        proposal_in_bytes = self._proposal_list[id]
+        proposal_in_bytes = headers.get_in_bytes(id)
         return True if proposal_in_bytes else False
 
+    def _put_prep_snapshot(self, snapshot: 'PRepSnapshot') -> int:
+        """ Put the snapshot unless the same one has been put already
+
+        :param snapshot: PRepSnapshot
+        :return: id of the snapshot
+        """
+        snapshot_in_bytes = snapshot.to_bytes()
+        key = sha3_256(snapshot_in_bytes)
+        snapshot_id = self._prep_snapshot_ids[key]
+        if snapshot_id != 0:
+            return snapshot_id
+
+        snapshot_id = self._prep_snapshot_count.get() + 1
+        self._prep_snapshot_count.set(snapshot_id)
+        self._prep_snapshot_ids[key] = snapshot_id
+        self._prep_snapshots[snapshot_id] = snapshot_in_bytes
+        members = self._prep_snapshot_members[snapshot_id]
+        for address in snapshot.addresses:
+            members[Address.from_string(address)] = True
+        return snapshot_id
+
+    def _get_proposal_info(self, id: bytes, headers: 'ProposalHeaders') -> 'ProposalInfo':
+        """ Assemble the whole proposal info from its header, tally, P-Rep snapshot and votes
+
+        :param id: transaction hash to register the proposal
+        :param headers: headers of the proposals read in the call
+        :return: ProposalInfo object including the voter lists
+        """
+        snapshot = PRepSnapshot.from_bytes(self._prep_snapshots[self._proposal_prep_snapshot[id]])
+        # decoded apart from the shared header as the voter lists are filled in
+        proposal_info = ProposalInfo.from_bytes(headers.get_in_bytes(id), snapshot.addresses)
+        tally = ProposalTally.from_bytes(self._proposal_tally[id])
+        proposal_info.status = tally.status
+
+        archived_votes = self._proposal_archive[id]
+        if archived_votes is not None:
+            votes = ProposalArchive.from_bytes(archived_votes, snapshot).votes
+        else:
+            votes = self._get_votes(id, snapshot.addresses, tally.count_of_voters())
+
+        voters_in_dict = {NetworkProposalVote.AGREE: [], NetworkProposalVote.DISAGREE: []}
+        for address, vote in votes:
+            voters_in_dict[vote.vote_type].append(vote.to_voter_in_dict(address))
+        for vote_type, vote_type_in_str in ((NetworkProposalVote.AGREE, "agree"),
+                                            (NetworkProposalVote.DISAGREE, "disagree")):
+            proposal_info.vote[vote_type_in_str] = {
+                "list": voters_in_dict[vote_type],
+                "amount": tally.vote[vote_type_in_str]["amount"]
+            }
+
+        voted = set(address for address, _ in votes)
+        proposal_info.vote["noVote"] = {
+            "list": [address for address in snapshot.addresses if address not in voted],
+            "amount": tally.vote["noVote"]["amount"]
+        }
+        return proposal_info
+
+    def _get_votes(self, id: bytes, voters: list, count_of_votes: int) -> list:
+        """ Get the votes of a proposal not archived
+
+        :param id: transaction hash to register the proposal
+        :param voters: addresses of the voters registered for the proposal in str
+        :param count_of_votes: count of the votes in the tally, to stop looking up once all are found
+        :return: list of (address in str, ProposalVote) in order of voting
+        """
+        # votes are looked up only for the voters registered
+        votes_of_proposal = self._proposal_votes[id]
+        votes = []
+        for address in voters:
+            if len(votes) == count_of_votes:
+                break
+
+            vote_in_bytes = votes_of_proposal[Address.from_string(address)]
+            if vote_in_bytes is not None:
+                votes.append((address, ProposalVote.from_bytes(vote_in_bytes)))
+        votes.sort(key=lambda x: x[1].seq)
+        return votes
+
+    def migrate_proposals(self) -> None:
+        """ Split the proposals saved as a whole into header, tally, thresholds, votes and P-Rep snapshot
+        and index them
+        """
+        headers = ProposalHeaders(self._proposal_list)
+        for seq, id in enumerate(self._proposal_list_keys):
+            if self._proposal_tally[id] is not None:
+                continue
+
+            proposal_info = ProposalInfo.from_bytes(self._proposal_list[id])
+            votes = self._proposal_votes[id]
+            vote_seq = 0
+            for vote_type, vote_type_in_str in ((NetworkProposalVote.AGREE, "agree"),
+                                                (NetworkProposalVote.DISAGREE, "disagree")):
+                voters = self._proposal_voters[id][vote_type]
+                for position, voter_in_dict in enumerate(proposal_info.vote[vote_type_in_str]["list"]):
+                    vote = ProposalVote.from_voter_in_dict(vote_type, vote_seq, voter_in_dict)
+                    address = Address.from_string(voter_in_dict["address"])
+                    votes[address] = vote.to_bytes()
+                    voters[position] = address
+                    # block heights of the votes were not kept
+                    self._add_prep_vote(address, PRepVote(seq, vote_type, 0))
+                    vote_seq += 1
+
+            # Names and delegation of the main P-Reps at registration were not kept. The ones of the voters
+            # at their votes are used instead, and the ones of the others are left empty.
+            preps = [(voter_in_dict["address"], voter_in_dict["name"], voter_in_dict["amount"])
+                     for voter_in_dict in proposal_info.vote["agree"]["list"] + proposal_info.vote["disagree"]["list"]]
+            preps += [(address, "", 0) for address in proposal_info.vote["noVote"]["list"]]
+            self._proposal_prep_snapshot[id] = self._put_prep_snapshot(PRepSnapshot(preps))
+            self._proposal_thresholds[id] = ProposalThresholds.from_proposal_info(proposal_info).to_bytes()
+
+            self._proposal_tally[id] = ProposalTally.from_proposal_info(proposal_info).to_bytes()
+            headers.put(id, proposal_info)
+            self._add_to_indexes(id, seq, proposal_info)
+
+    def migrate_indexes(self) -> None:
+        """ Index the proposals by type and status together and count them by proposer """
+        for seq, id in enumerate(self._proposal_list_keys):
+            proposal_info = ProposalInfo.from_bytes(self._proposal_list[id])
+            tally = ProposalTally.from_bytes(self._proposal_tally[id])
+            index = self._type_status_index[proposal_info.type][tally.status]
+            # proposals split by migrate_proposals in the same update are indexed and counted already
+            if len(index) > 0 and index.get(len(index) - 1) >= seq:
+                continue
+
+            index.add(seq)
+            counts = self._proposer_count[proposal_info.proposer][proposal_info.type]
+            counts[tally.status] = counts[tally.status] + 1
+
     @staticmethod
-    def _check_vote_result(vote_type: int, proposal_info: 'ProposalInfo') -> bool:
+    def _check_vote_result(vote_type: int, thresholds: 'ProposalThresholds', tally: 'ProposalTally') -> bool:
         """ Check that the results of the vote meet the approve or disapprove conditions
 
         :return: bool
         """
-        total_delegated = 0
-        for vote_type_in_str in ("agree", "disagree", "noVote"):
-            total_delegated += proposal_info.vote[vote_type_in_str]["amount"]
-
-        preps_to_vote = proposal_info.vote["agree" if vote_type == NetworkProposalVote.AGREE else "disagree"]
-        voters_of_preps_to_vote: list = preps_to_vote["list"]
-        delegated_of_preps_to_vote: int = preps_to_vote["amount"]
-        try:
-            if vote_type == NetworkProposalVote.AGREE:
-                return len(voters_of_preps_to_vote) / proposal_info.total_voter >= ApproveCondition.APPROVE_RATE \
-                       and delegated_of_preps_to_vote / proposal_info.total_delegated_amount \
-                       >= ApproveCondition.APPROVE_RATE
-            else:
-                return len(voters_of_preps_to_vote) / proposal_info.total_voter >= ApproveCondition.DISAPPROVE_RATE \
-                       and delegated_of_preps_to_vote / proposal_info.total_delegated_amount \
-                       >= ApproveCondition.DISAPPROVE_RATE
-        except ZeroDivisionError:
-            return False
+        preps_to_vote = tally.vote["agree" if vote_type == NetworkProposalVote.AGREE else "disagree"]
+        return thresholds.is_reached(vote_type, preps_to_vote["count"], preps_to_vote["amount"])
 
     @staticmethod
     def _generate_common_proposal_info_in_dict(proposal_info: 'ProposalInfo') -> dict:
@@ -335,17 +1165,19 @@ class NetworkProposal:
         }
         return proposal_info_in_dict
 
-    def _generate_proposal_info_in_dict_for_get_proposals(self, proposal_info: 'ProposalInfo') -> dict:
+    def _generate_proposal_info_in_dict_for_get_proposals(self, proposal_info: 'ProposalInfo',
+                                                          tally: 'ProposalTally') -> dict:
         """ Generate proposal info in dict for `getProposals` method
 
         :param proposal_info: ProposalInfo instance
+        :param tally: ProposalTally instance of the proposal
         :return: proposal info in dict where format is set to the `getProposals` method
         """
         vote_value = {}
         for vote_type in ("agree", "disagree", "noVote"):
             vote_value[vote_type] = {
-                "count": hex(len(proposal_info.vote[vote_type]["list"])),
-                "amount": hex(proposal_info.vote[vote_type]["amount"])
+                "count": hex(tally.vote[vote_type]["count"]),
+                "amount": hex(tally.vote[vote_type]["amount"])
             }
 
         proposal_info_in_dict = self._generate_common_proposal_info_in_dict(proposal_info)
@@ -370,28 +1202,49 @@ class NetworkProposal:
         proposal_info_in_dict["vote"] = proposal_info.vote
         return proposal_info_in_dict
 
-    @staticmethod
-    def _generate_voter_in_dict(id: bytes, timestamp: int, prep: 'Prep') -> dict:
-        """ Generate one of items in dict of voter list
 
-        :param id: transaction hash generated for the voter to vote for the proposal
-        :param timestamp: timestamp
-        :param prep: 'Prep' having attributes of prep information like address, name, delegated and etc.
-        :return: voter information in dict; one of the items in dict for voter list.
-                 A data type is either integer or string in order not to be converted but to JSON dumps directly
+class ProposalHeaders:
+    """ ProposalHeaders Class including the headers of the proposals read in a call, raw and decoded
+
+    Each public method of NetworkProposal creates one and passes it down. The SCORE instance is shared by
+    the invoke and the queries, so nothing read in a call is kept in it.
+    """
+
+    def __init__(self, proposal_list: 'DictDB'):
+        self._proposal_list = proposal_list
+        self._headers_in_bytes = {}
+        self._headers = {}
+
+    def get_in_bytes(self, id: bytes) -> bytes:
+        if id not in self._headers_in_bytes:
+            self._headers_in_bytes[id] = self._proposal_list[id]
+        return self._headers_in_bytes[id]
+
+    def get(self, id: bytes) -> 'ProposalInfo':
+        """ Get the decoded header of the proposal, shared in the call
+
+        Callers may set its status from the tally but must not change anything else.
+
+        :param id: transaction hash to register the proposal
+        :return: ProposalInfo object
         """
-        voter_in_dict = {
-            "id": '0x' + bytes.hex(id),
-            "timestamp": timestamp,
-            "address": str(prep.address),
-            "name": prep.name,
-            "amount": prep.delegated
-        }
-        return voter_in_dict
+        proposal_info = self._headers.get(id)
+        if proposal_info is None:
+            proposal_info = ProposalInfo.from_bytes(self.get_in_bytes(id))
+            self._headers[id] = proposal_info
+        return proposal_info
+
+    def put(self, id: bytes, proposal_info: 'ProposalInfo') -> None:
+        header_in_bytes = proposal_info.header_to_bytes()
+        self._proposal_list[id] = header_in_bytes
+        self._headers_in_bytes[id] = header_in_bytes
+        self._headers.pop(id, None)
 
 
 class ProposalInfo:
     """ ProposalInfo Class including proposal information"""
+    _SCHEMA_V1 = 0x01
+    _SCHEMA_HEADER = 0x02
 
     def __init__(self, id: bytes, proposer: 'Address', proposer_name: str, title: str, description: str, type: int,
                  value: dict, start_block_height: int, end_block_height: int, status: int, vote: dict,
@@ -406,32 +1259,451 @@ class ProposalInfo:
         self.start_block_height = start_block_height
         self.end_block_height = end_block_height
         self.status = status
-        self.vote = vote
-        if total_voter == 0 and total_delegated_amount == 0:
+        if vote is not None:
+            self.vote = vote
+        if vote is not None and total_voter == 0 and total_delegated_amount == 0:
             for vote_type_in_str in ("agree", "disagree", "noVote"):
                 total_voter += len(vote[vote_type_in_str]["list"])
                 total_delegated_amount += vote[vote_type_in_str]["amount"]
         self.total_voter = total_voter
         self.total_delegated_amount = total_delegated_amount
 
+    def __getattr__(self, name: str):
+        # `vote` of ProposalInfo created by from_bytes is decoded on the first access.
+        # Once decoded, it is a plain attribute and this method is not called any more.
+        if name != "vote" or self.__dict__.get("_vote_source") is None:
+            raise AttributeError(name)
+        return self.decode_vote()
+
+    def decode_vote(self) -> dict:
+        """ Decode the voter lists now instead of on the first access to `vote`
+
+        :return: vote in dict
+        """
+        if "vote" not in self.__dict__:
+            if self.__dict__.get("_vote_source") is None:
+                raise AttributeError("vote")
+            self.vote = self._read_vote()
+        return self.vote
+
+    def get_vote_tallies(self) -> list:
+        """ Get the count and amount of agree, disagree and noVote without decoding the voter lists
+
+        :return: list of (count, amount)
+        """
+        if "vote" not in self.__dict__:
+            return self._vote_tallies
+        return [(len(self.vote[vote_type_in_str]["list"]), self.vote[vote_type_in_str]["amount"])
+                for vote_type_in_str in ("agree", "disagree", "noVote")]
+
+    def _read_vote(self) -> dict:
+        source = self.__dict__.pop("_vote_source")
+        tallies = self.__dict__.pop("_vote_tallies")
+
+        vote = {}
+        for vote_type_in_str, (_, amount) in zip(("agree", "disagree", "noVote"), tallies):
+            vote[vote_type_in_str] = {"list": [], "amount": amount}
+
+        if isinstance(source, list):
+            # header: all the registered voters are in the noVote list
+            vote["noVote"]["list"] = source
+            return vote
+
+        reader = source
+        for vote_type_in_str, (count, _) in zip(("agree", "disagree"), tallies):
+            vote[vote_type_in_str]["list"] = [
+                {
+                    "id": '0x' + bytes.hex(reader.read_bytes()),
+                    "timestamp": reader.read_int(),
+                    "address": reader.read_address_str(),
+                    "name": reader.read_str(),
+                    "amount": reader.read_int()
+                }
+                for _ in range(count)
+            ]
+        vote["noVote"]["list"] = [reader.read_address_str() for _ in range(tallies[2][0])]
+        return vote
+
     def to_bytes(self) -> bytes:
         """ Convert ProposalInfo to bytes
 
         :return: ProposalInfo in bytes
         """
-        proposal_info_in_dict = vars(self)
-        proposal_info_in_dict["id"] = bytes.hex(proposal_info_in_dict["id"])
-        proposal_info_in_dict["proposer"] = str(proposal_info_in_dict["proposer"])
-        return json_dumps(proposal_info_in_dict).encode()
+        writer = RecordWriter(self._SCHEMA_V1)
+        self._write_common(writer)
+        writer.write_int(self.status)
+
+        # tallies come before the voter lists, so that the lists can be skipped by readers only needing the tallies
+        for vote_type_in_str in ("agree", "disagree", "noVote"):
+            writer.write_uint(len(self.vote[vote_type_in_str]["list"]))
+            writer.write_int(self.vote[vote_type_in_str]["amount"])
+
+        for vote_type_in_str in ("agree", "disagree"):
+            for voter in self.vote[vote_type_in_str]["list"]:
+                writer.write_bytes(bytes.fromhex(voter["id"][2:]))
+                writer.write_int(voter["timestamp"])
+                writer.write_address_str(voter["address"])
+                writer.write_str(voter["name"])
+                writer.write_int(voter["amount"])
+
+        for address in self.vote["noVote"]["list"]:
+            writer.write_address_str(address)
+
+        return writer.to_bytes()
+
+    def header_to_bytes(self) -> bytes:
+        """ Convert the immutable part of ProposalInfo to bytes
+
+        Status and votes are not included. The registered voters are not included either
+        as they are kept in PRepSnapshot shared by the proposals.
+
+        :return: header of ProposalInfo in bytes
+        """
+        writer = RecordWriter(self._SCHEMA_HEADER)
+        self._write_common(writer)
+        return writer.to_bytes()
+
+    def _write_common(self, writer: 'RecordWriter') -> None:
+        writer.write_bytes(self.id)
+        writer.write_address(self.proposer)
+        writer.write_str(self.proposer_name)
+        writer.write_str(self.title)
+        writer.write_str(self.description)
+        writer.write_int(self.type)
+        writer.write_str(json_dumps(self.value))
+        writer.write_int(self.start_block_height)
+        writer.write_int(self.end_block_height)
+        writer.write_int(self.total_voter)
+        writer.write_int(self.total_delegated_amount)
 
     @staticmethod
-    def from_bytes(buf: bytes) -> 'ProposalInfo':
+    def from_bytes(buf: bytes, registered_voters: list = None) -> 'ProposalInfo':
         """ Create ProposalInfo object from bytes
 
-        :param buf: ProposalInfo in bytes
+        Header fields and tallies are decoded at once and the voter lists are decoded on the first access to `vote`,
+        so that readers only needing the summary of the proposal do not pay for them.
+
+        :param buf: ProposalInfo in bytes; either a binary record, a header or a legacy JSON record
+        :param registered_voters: addresses of the voters registered for the proposal, which become the noVote list
+            of a header. Without them, `vote` of a header is not available
+        :return: ProposalInfo object
+        """
+        if buf[:1] == b'{':
+            return ProposalInfo._from_legacy_bytes(buf)
+
+        reader = RecordReader(buf)
+        if reader.schema not in (ProposalInfo._SCHEMA_V1, ProposalInfo._SCHEMA_HEADER):
+            revert(f"Unknown proposal schema: {reader.schema}")
+
+        id = reader.read_bytes()
+        proposer = reader.read_address()
+        proposer_name = reader.read_str()
+        title = reader.read_str()
+        description = reader.read_str()
+        type = reader.read_int()
+        value = json_loads(reader.read_str())
+        start_block_height = reader.read_int()
+        end_block_height = reader.read_int()
+        total_voter = reader.read_int()
+        total_delegated_amount = reader.read_int()
+
+        if reader.schema == ProposalInfo._SCHEMA_HEADER:
+            status = NetworkProposalStatus.VOTING
+            tallies = [(0, 0), (0, 0), (total_voter, total_delegated_amount)]
+            source = registered_voters
+        else:
+            status = reader.read_int()
+            tallies = [(reader.read_uint(), reader.read_int()) for _ in range(3)]
+            # the voter lists follow
+            source = reader
+
+        proposal_info = ProposalInfo(id, proposer, proposer_name, title, description, type, value, start_block_height,
+                                     end_block_height, status, None, total_voter, total_delegated_amount)
+        proposal_info._vote_source = source
+        proposal_info._vote_tallies = tallies
+        return proposal_info
+
+    @staticmethod
+    def _from_legacy_bytes(buf: bytes) -> 'ProposalInfo':
+        """ Create ProposalInfo object from the legacy JSON record
+
+        :param buf: ProposalInfo in JSON bytes
         :return: ProposalInfo object
         """
         proposal_info_in_dict: dict = json_loads(buf.decode())
         proposal_info_in_dict["id"] = bytes.fromhex(proposal_info_in_dict["id"])
         proposal_info_in_dict["proposer"] = Address.from_string(proposal_info_in_dict["proposer"])
         return ProposalInfo(**proposal_info_in_dict)
+
+
+class PRepSnapshot:
+    """ PRepSnapshot Class including the main P-Reps who can vote for the proposals registered in a term """
+    _SCHEMA_V1 = 0x05
+
+    def __init__(self, preps: list):
+        # list of (address in str, name, delegated) in the order of main P-Reps
+        self.preps = preps
+
+    @property
+    def addresses(self) -> list:
+        return [address for address, _, _ in self.preps]
+
+    @property
+    def total_delegated(self) -> int:
+        return sum(delegated for _, _, delegated in self.preps)
+
+    @staticmethod
+    def from_main_preps(main_preps: list) -> 'PRepSnapshot':
+        return PRepSnapshot([(str(main_prep.address), main_prep.name, main_prep.delegated) for main_prep in main_preps])
+
+    def to_bytes(self) -> bytes:
+        writer = RecordWriter(self._SCHEMA_V1)
+        writer.write_uint(len(self.preps))
+        for address, name, delegated in self.preps:
+            writer.write_address_str(address)
+            writer.write_str(name)
+            writer.write_int(delegated)
+        return writer.to_bytes()
+
+    @staticmethod
+    def from_bytes(buf: bytes) -> 'PRepSnapshot':
+        reader = RecordReader(buf)
+        if reader.schema != PRepSnapshot._SCHEMA_V1:
+            revert(f"Unknown P-Rep snapshot schema: {reader.schema}")
+
+        return PRepSnapshot([(reader.read_address_str(), reader.read_str(), reader.read_int())
+                             for _ in range(reader.read_uint())])
+
+
+class ProposalThresholds:
+    """ ProposalThresholds Class including the count of voters and the amount of delegation needed to approve
+    or disapprove a proposal
+    """
+    _SCHEMA_V1 = 0x06
+
+    def __init__(self, approve_count: int, approve_amount: int, disapprove_count: int, disapprove_amount: int):
+        self.approve_count = approve_count
+        self.approve_amount = approve_amount
+        self.disapprove_count = disapprove_count
+        self.disapprove_amount = disapprove_amount
+
+    def is_reached(self, vote_type: int, count: int, amount: int) -> bool:
+        if vote_type == NetworkProposalVote.AGREE:
+            return count >= self.approve_count and amount >= self.approve_amount
+        return count >= self.disapprove_count and amount >= self.disapprove_amount
+
+    @staticmethod
+    def from_proposal_info(proposal_info: 'ProposalInfo') -> 'ProposalThresholds':
+        """ Compute the thresholds from ApproveCondition in integer arithmetic
+
+        The least value reaching the rate is ceil(total * rate). A proposal without voters or delegation
+        can not be decided by votes, so its thresholds are at least 1.
+        """
+        def threshold(total: int, rate_in_percent: int) -> int:
+            return max(1, -(-total * rate_in_percent // 100))
+
+        total_voter = proposal_info.total_voter
+        total_delegated_amount = proposal_info.total_delegated_amount
+        return ProposalThresholds(threshold(total_voter, ApproveCondition.APPROVE_RATE_IN_PERCENT),
+                                  threshold(total_delegated_amount, ApproveCondition.APPROVE_RATE_IN_PERCENT),
+                                  threshold(total_voter, ApproveCondition.DISAPPROVE_RATE_IN_PERCENT),
+                                  threshold(total_delegated_amount, ApproveCondition.DISAPPROVE_RATE_IN_PERCENT))
+
+    def to_bytes(self) -> bytes:
+        writer = RecordWriter(self._SCHEMA_V1)
+        writer.write_uint(self.approve_count)
+        writer.write_int(self.approve_amount)
+        writer.write_uint(self.disapprove_count)
+        writer.write_int(self.disapprove_amount)
+        return writer.to_bytes()
+
+    @staticmethod
+    def from_bytes(buf: bytes) -> 'ProposalThresholds':
+        reader = RecordReader(buf)
+        if reader.schema != ProposalThresholds._SCHEMA_V1:
+            revert(f"Unknown thresholds schema: {reader.schema}")
+
+        return ProposalThresholds(reader.read_uint(), reader.read_int(), reader.read_uint(), reader.read_int())
+
+
+class ProposalTally:
+    """ ProposalTally Class including the status and the count and amount of each vote type of a proposal """
+    _SCHEMA_V1 = 0x03
+
+    def __init__(self, status: int, vote: dict):
+        self.status = status
+        self.vote = vote
+
+    def count_of_voters(self) -> int:
+        return self.vote["agree"]["count"] + self.vote["disagree"]["count"]
+
+    def add_vote(self, vote_type: int, amount: int) -> None:
+        vote_type_in_str = "agree" if vote_type == NetworkProposalVote.AGREE else "disagree"
+        self.vote[vote_type_in_str]["count"] += 1
+        self.vote[vote_type_in_str]["amount"] += amount
+        self.vote["noVote"]["count"] -= 1
+        self.vote["noVote"]["amount"] -= amount
+
+    @staticmethod
+    def from_proposal_info(proposal_info: 'ProposalInfo') -> 'ProposalTally':
+        vote = {}
+        for vote_type_in_str, (count, amount) in zip(("agree", "disagree", "noVote"),
+                                                     proposal_info.get_vote_tallies()):
+            vote[vote_type_in_str] = {"count": count, "amount": amount}
+        return ProposalTally(proposal_info.status, vote)
+
+    def to_bytes(self) -> bytes:
+        writer = RecordWriter(self._SCHEMA_V1)
+        writer.write_int(self.status)
+        for vote_type_in_str in ("agree", "disagree", "noVote"):
+            writer.write_uint(self.vote[vote_type_in_str]["count"])
+            writer.write_int(self.vote[vote_type_in_str]["amount"])
+        return writer.to_bytes()
+
+    @staticmethod
+    def from_bytes(buf: bytes) -> 'ProposalTally':
+        reader = RecordReader(buf)
+        if reader.schema != ProposalTally._SCHEMA_V1:
+            revert(f"Unknown tally schema: {reader.schema}")
+
+        status = reader.read_int()
+        vote = {}
+        for vote_type_in_str in ("agree", "disagree", "noVote"):
+            vote[vote_type_in_str] = {"count": reader.read_uint(), "amount": reader.read_int()}
+        return ProposalTally(status, vote)
+
+
+class ProposalVote:
+    """ ProposalVote Class including a vote of a voter for a proposal """
+    _SCHEMA_V1 = 0x04
+
+    def __init__(self, vote_type: int, seq: int, id: bytes, timestamp: int, name: str, amount: int):
+        self.vote_type = vote_type
+        self.seq = seq  # order of the vote in the proposal
+        self.id = id
+        self.timestamp = timestamp
+        self.name = name
+        self.amount = amount
+
+    def to_voter_in_dict(self, address: str) -> dict:
+        """ Generate one of items in dict of voter list
+
+        :param address: address of the voter in str
+        :return: voter information in dict; one of the items in dict for voter list.
+                 A data type is either integer or string in order not to be converted but to JSON dumps directly
+        """
+        return {
+            "id": '0x' + bytes.hex(self.id),
+            "timestamp": self.timestamp,
+            "address": address,
+            "name": self.name,
+            "amount": self.amount
+        }
+
+    @staticmethod
+    def from_voter_in_dict(vote_type: int, seq: int, voter_in_dict: dict) -> 'ProposalVote':
+        return ProposalVote(vote_type, seq, bytes.fromhex(voter_in_dict["id"][2:]), voter_in_dict["timestamp"],
+                            voter_in_dict["name"], voter_in_dict["amount"])
+
+    def to_bytes(self) -> bytes:
+        writer = RecordWriter(self._SCHEMA_V1)
+        writer.write_int(self.vote_type)
+        writer.write_uint(self.seq)
+        writer.write_bytes(self.id)
+        writer.write_int(self.timestamp)
+        writer.write_str(self.name)
+        writer.write_int(self.amount)
+        return writer.to_bytes()
+
+    @staticmethod
+    def from_bytes(buf: bytes) -> 'ProposalVote':
+        reader = RecordReader(buf)
+        if reader.schema != ProposalVote._SCHEMA_V1:
+            revert(f"Unknown vote schema: {reader.schema}")
+
+        return ProposalVote(reader.read_int(), reader.read_uint(), reader.read_bytes(), reader.read_int(),
+                            reader.read_str(), reader.read_int())
+
+
+class ProposalArchive:
+    """ ProposalArchive Class including the votes of an expired proposal in a single record
+
+    Voters are written by their position in the PRepSnapshot of the proposal, and their names and delegation only if
+    they differ from the ones in the snapshot. The noVote list is not written as it is the rest of the snapshot.
+    """
+    _SCHEMA_V1 = 0x08
+    _NAME_CHANGED = 0x01
+    _AMOUNT_CHANGED = 0x02
+
+    def __init__(self, votes: list):
+        # list of (address in str, ProposalVote) in order of voting
+        self.votes = votes
+
+    def to_bytes(self, snapshot: 'PRepSnapshot') -> bytes:
+        positions = {address: position for position, address in enumerate(snapshot.addresses)}
+        writer = RecordWriter(self._SCHEMA_V1)
+        writer.write_uint(len(self.votes))
+        for address, vote in self.votes:
+            position = positions[address]
+            _, name, delegated = snapshot.preps[position]
+            flags = 0
+            if vote.name != name:
+                flags |= self._NAME_CHANGED
+            if vote.amount != delegated:
+                flags |= self._AMOUNT_CHANGED
+
+            writer.write_uint(position)
+            writer.write_int(vote.vote_type)
+            writer.write_uint(flags)
+            writer.write_bytes(vote.id)
+            writer.write_int(vote.timestamp)
+            if flags & self._NAME_CHANGED:
+                writer.write_str(vote.name)
+            if flags & self._AMOUNT_CHANGED:
+                writer.write_int(vote.amount)
+        return writer.to_bytes()
+
+    @staticmethod
+    def from_bytes(buf: bytes, snapshot: 'PRepSnapshot') -> 'ProposalArchive':
+        reader = RecordReader(buf)
+        if reader.schema != ProposalArchive._SCHEMA_V1:
+            revert(f"Unknown proposal archive schema: {reader.schema}")
+
+        votes = []
+        for seq in range(reader.read_uint()):
+            address, name, amount = snapshot.preps[reader.read_uint()]
+            vote_type = reader.read_int()
+            flags = reader.read_uint()
+            id = reader.read_bytes()
+            timestamp = reader.read_int()
+            if flags & ProposalArchive._NAME_CHANGED:
+                name = reader.read_str()
+            if flags & ProposalArchive._AMOUNT_CHANGED:
+                amount = reader.read_int()
+            votes.append((address, ProposalVote(vote_type, seq, id, timestamp, name, amount)))
+        return ProposalArchive(votes)
+
+
+class PRepVote:
+    """ PRepVote Class including a vote in the voting history of a P-Rep """
+    _SCHEMA_V1 = 0x07
+
+    def __init__(self, proposal_seq: int, vote_type: int, block_height: int):
+        self.proposal_seq = proposal_seq  # index of the proposal in the proposal list
+        self.vote_type = vote_type
+        self.block_height = block_height  # 0 for the votes before the history was kept
+
+    def to_bytes(self) -> bytes:
+        writer = RecordWriter(self._SCHEMA_V1)
+        writer.write_uint(self.proposal_seq)
+        writer.write_int(self.vote_type)
+        writer.write_uint(self.block_height)
+        return writer.to_bytes()
+
+    @staticmethod
+    def from_bytes(buf: bytes) -> 'PRepVote':
+        reader = RecordReader(buf)
+        if reader.schema != PRepVote._SCHEMA_V1:
+            revert(f"Unknown P-Rep vote schema: {reader.schema}")
+
+        return PRepVote(reader.read_uint(), reader.read_int(), reader.read_uint())
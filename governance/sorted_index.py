@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from iconservice import *
+
+
+class SortedIndex:
+    """ Integers kept in ascending order in ArrayDB
+
+    Values are expected to be added and removed mostly near the end, so that both take a few DB accesses only.
+    """
+
+    def __init__(self, array: 'ArrayDB'):
+        self._array = array
+
+    def __len__(self) -> int:
+        return len(self._array)
+
+    def get(self, index: int) -> int:
+        return self._array.get(index)
+
+    def add(self, value: int) -> None:
+        array = self._array
+        array.put(value)
+        i = len(array) - 1
+        while i > 0:
+            prev = array.get(i - 1)
+            if prev <= value:
+                break
+            array[i] = prev
+            i -= 1
+        if i != len(array) - 1:
+            array[i] = value
+
+    def remove(self, value: int) -> bool:
+        array = self._array
+        size = len(array)
+        i = self._find(value, size)
+        if i < 0:
+            return False
+
+        for j in range(i, size - 1):
+            array[j] = array.get(j + 1)
+        array.pop()
+        return True
+
+    def _find(self, value: int, size: int) -> int:
+        low, high = 0, size - 1
+        while low <= high:
+            mid = (low + high) // 2
+            mid_value = self._array.get(mid)
+            if mid_value == value:
+                return mid
+            if mid_value < value:
+                low = mid + 1
+            else:
+                high = mid - 1
+        return -1
+
+    def bisect_left(self, value: int) -> int:
+        """ Return the position of the first value not less than the given value """
+        low, high = 0, len(self._array)
+        while low < high:
+            mid = (low + high) // 2
+            if self._array.get(mid) < value:
+                low = mid + 1
+            else:
+                high = mid
+        return low
+
+    def iter_reversed(self, start: int = 0, below: int = None):
+        """ Iterate values from the largest one
+
+        :param start: count of the largest values to skip
+        :param below: iterate values less than it only (optional)
+        """
+        end = len(self._array) if below is None else self.bisect_left(below)
+        for i in range(end - 1 - start, -1, -1):
+            yield self._array.get(i)
+
+    @staticmethod
+    def merge_reversed(indexes: list, below: int = None):
+        """ Iterate values of several indexes from the largest one
+
+        :param indexes: SortedIndex list
+        :param below: iterate values less than it only (optional)
+        """
+        iterators = [index.iter_reversed(below=below) for index in indexes]
+        heads = [next(iterator, None) for iterator in iterators]
+        while True:
+            largest = -1
+            for i, head in enumerate(heads):
+                if head is not None and (largest < 0 or head > heads[largest]):
+                    largest = i
+            if largest < 0:
+                return
+            yield heads[largest]
+            heads[largest] = next(iterators[largest], None)
@@ -0,0 +1,46 @@
+import unittest
+
+from iconservice import *
+
+from governance.codec import RecordReader, RecordWriter
+
+TEST_SCHEMA = 0x7f
+
+
+class TestUnitCodec(unittest.TestCase):
+
+    def test_int(self):
+        values = [0, 1, -1, 63, -64, 64, 127, 128, 300, -300, 2 ** 63, -(2 ** 63), 10 ** 30, -(10 ** 30)]
+        writer = RecordWriter(TEST_SCHEMA)
+        for value in values:
+            writer.write_int(value)
+
+        reader = RecordReader(writer.to_bytes())
+        self.assertEqual(TEST_SCHEMA, reader.schema)
+        for value in values:
+            self.assertEqual(value, reader.read_int())
+        self.assertEqual(len(writer.to_bytes()), reader.offset)
+
+    def test_uint(self):
+        self.assertEqual(bytes([TEST_SCHEMA, 0x00]), RecordWriter(TEST_SCHEMA).write_uint(0).to_bytes())
+        self.assertEqual(bytes([TEST_SCHEMA, 0x7f]), RecordWriter(TEST_SCHEMA).write_uint(127).to_bytes())
+        self.assertEqual(bytes([TEST_SCHEMA, 0xac, 0x02]), RecordWriter(TEST_SCHEMA).write_uint(300).to_bytes())
+        self.assertRaises(ValueError, RecordWriter(TEST_SCHEMA).write_uint, -1)
+
+    def test_bytes_str_address(self):
+        eoa = Address.from_string(f"hx{'1' * 40}")
+        score = Address.from_string(f"cx{'2' * 40}")
+        writer = RecordWriter(TEST_SCHEMA)
+        writer.write_bytes(b'\x00\x01\x02').write_str("proposal 제안").write_address(eoa).write_address(score)
+        buf = writer.to_bytes()
+        self.assertEqual(1 + 4 + 1 + len("proposal 제안".encode()) + 21 + 22, len(buf))
+
+        reader = RecordReader(buf)
+        self.assertEqual(b'\x00\x01\x02', reader.read_bytes())
+        self.assertEqual("proposal 제안", reader.read_str())
+        self.assertEqual(eoa, reader.read_address())
+        self.assertEqual(score, reader.read_address())
+
+    def test_truncated(self):
+        buf = RecordWriter(TEST_SCHEMA).write_bytes(b'\x01' * 10).to_bytes()
+        self.assertRaises(ValueError, RecordReader(buf[:-1]).read_bytes)
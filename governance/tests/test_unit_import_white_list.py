@@ -0,0 +1,75 @@
+import unittest
+from unittest.mock import patch
+
+from governance.import_white_list import ImportWhiteList, MAX_PARSED_IMPORT_STMTS
+
+IMPORT_WHITE_LIST = {
+    "iconservice": ["*"],
+    "os": ["path"],
+    "json": ["loads", "dumps"],
+    "base.exception": ["*"]
+}
+
+
+class TestUnitImportWhiteList(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.import_white_list = ImportWhiteList(IMPORT_WHITE_LIST)
+
+    def test_contains(self):
+        for import_stmt, expected in (({"iconservice": []}, True),
+                                      ({"iconservice": ["IconScoreBase"]}, True),
+                                      ({"base.exception": ["*"]}, True),
+                                      ({"os": ["path"]}, True),
+                                      ({"json": ["dumps", "loads"]}, True),
+                                      ({"os": ["path"], "json": ["loads"]}, True),
+                                      ({}, True),
+                                      ({"os": []}, False),
+                                      ({"os": ["path", "system"]}, False),
+                                      ({"os.path": ["join"]}, False),
+                                      ({"base": ["exception"]}, False),
+                                      ({"sys": ["exit"]}, False),
+                                      ({"json": ["loads"], "sys": ["exit"]}, False)):
+            self.assertEqual(expected, self.import_white_list.contains(import_stmt), import_stmt)
+
+    def test_parse_import_stmt(self):
+        import_white_list = self.import_white_list
+        self.assertEqual({"os": ["path"]}, import_white_list.parse_import_stmt("{'os': ['path']}"))
+        self.assertEqual({"json": []}, import_white_list.parse_import_stmt('{"json": []}'))
+        for invalid_import_stmt in ("{1: ['path']}", "{'os': 'path'}", "{'os': [1]}", "{'os':"):
+            self.assertRaises(Exception, import_white_list.parse_import_stmt, invalid_import_stmt)
+        self.assertEqual(2, len(import_white_list._parsed_import_stmts))
+
+        # parsed once
+        with patch.object(ImportWhiteList, '_check_import_stmt') as check_import_stmt:
+            self.assertEqual({"os": ["path"]}, import_white_list.parse_import_stmt("{'os': ['path']}"))
+            check_import_stmt.assert_not_called()
+
+        # kept with the compiled white list only
+        self.assertEqual(0, len(ImportWhiteList(IMPORT_WHITE_LIST)._parsed_import_stmts))
+
+    def test_parse_import_stmt_evicts_least_recently_used(self):
+        import_white_list = self.import_white_list
+        import_stmts = [f"{{'module{i}': []}}" for i in range(MAX_PARSED_IMPORT_STMTS)]
+        for import_stmt in import_stmts:
+            import_white_list.parse_import_stmt(import_stmt)
+        # use the first one again, so that the second one is the least recently used
+        import_white_list.parse_import_stmt(import_stmts[0])
+
+        import_white_list.parse_import_stmt("{'os': ['path']}")
+        parsed_import_stmts = import_white_list._parsed_import_stmts
+        self.assertEqual(MAX_PARSED_IMPORT_STMTS, len(parsed_import_stmts))
+        self.assertIn(import_stmts[0], parsed_import_stmts)
+        self.assertNotIn(import_stmts[1], parsed_import_stmts)
+        self.assertIn("{'os': ['path']}", parsed_import_stmts)
+
+    def test_parse_import_stmt_evicted_by_another_call(self):
+        class EvictedDict(dict):
+            def __delitem__(self, key):
+                # evicted by another call at the same time
+                raise KeyError(key)
+
+        import_white_list = self.import_white_list
+        import_white_list._parsed_import_stmts = EvictedDict(
+            (f"{{'module{i}': []}}", {f"module{i}": []}) for i in range(MAX_PARSED_IMPORT_STMTS))
+        self.assertEqual({"os": ["path"]}, import_white_list.parse_import_stmt("{'os': ['path']}"))
@@ -3,16 +3,20 @@ import random
 import sys
 import unittest
 from collections import namedtuple
+from fractions import Fraction
 from copy import deepcopy
 from json import dumps, loads
-from unittest.mock import patch, Mock
+from unittest.mock import patch, Mock, PropertyMock
 
 from iconservice import *
 from iconservice.iconscore.icon_score_context_util import IconScoreContextUtil
+from iconservice.iconscore.system import IconNetworkValueType, IconSystemScoreBase
 
 from governance.governance import Governance
 from governance.network_proposal import NetworkProposal, ProposalInfo, NetworkProposalVote, NetworkProposalStatus, \
-    NetworkProposalType
+    NetworkProposalType, ProposalTally, ProposalThresholds, PRepSnapshot, ApproveCondition, MaliciousScoreType, \
+    ProposalVote, ProposalHeaders, MAX_GET_PROPOSALS_PAGE_SIZE, MAX_PROPOSALS_PAGE_SIZE_LIMIT
+from governance.sorted_index import SortedIndex
 
 DATA_BYTE_ORDER = 'big'  # big endian
 COUNT_OF_MAIN_PREPS = 22
@@ -43,6 +47,7 @@ PATCHER_VALIDATE_REWARD_FUND_ALLOCATION_PROPOSAL = patch(
 
 PATCHER_NP_ARRAY_DB = patch('governance.network_proposal.ArrayDB')
 PATCHER_NP_DICT_DB = patch('governance.network_proposal.DictDB')
+PATCHER_NP_VAR_DB = patch('governance.network_proposal.VarDB')
 PATCHER_JSON_LOADS = patch('governance.network_proposal.json_loads', side_effect=loads)
 PATCHER_JSON_DUMPS = patch('governance.network_proposal.json_dumps', side_effect=dumps)
 PATCHER_CHECK_VOTE_RESULT = patch('governance.network_proposal.NetworkProposal._check_vote_result', return_value=True)
@@ -96,6 +101,72 @@ class Prep:
         self.name = "name_" + str(address)
 
 
+class DictDBStub(dict):
+    """ dict returning None for a missing key like DictDB """
+
+    def __missing__(self, key):
+        return None
+
+    def remove(self, key):
+        del self[key]
+
+
+class DefaultDictDBStub(dict):
+    """ dict returning the default value of the value type for a missing key like DictDB """
+
+    def __init__(self, value_type: type):
+        super().__init__()
+        self._value_type = value_type
+
+    def __missing__(self, key):
+        return self._value_type()
+
+    def remove(self, key):
+        self.pop(key, None)
+
+
+class ArrayDBStub(list):
+    """ list having ArrayDB methods """
+
+    def get(self, index: int):
+        return self[index]
+
+    def put(self, value):
+        self.append(value)
+
+
+class VarDBStub:
+    """ VarDB of int """
+
+    def __init__(self):
+        self._value = 0
+
+    def get(self):
+        return self._value
+
+    def set(self, value):
+        self._value = value
+
+
+class NestedDictDBStub(dict):
+    """ dict of DictDBStub like DictDB of depth 2 or more """
+
+    def __init__(self, value_type: type = None, depth: int = 2):
+        super().__init__()
+        self._value_type = value_type
+        self._depth = depth
+
+    def __missing__(self, key):
+        if self._depth > 2:
+            value = NestedDictDBStub(self._value_type, self._depth - 1)
+        elif self._value_type is None:
+            value = DictDBStub()
+        else:
+            value = DefaultDictDBStub(self._value_type)
+        self[key] = value
+        return value
+
+
 # @unittest.skip("skip governance SCORE")
 class TestUnitGovernance(unittest.TestCase):
 
@@ -219,16 +290,194 @@ class TestUnitGovernance(unittest.TestCase):
             }
             assert test.result == self.governance._validate_reward_fund_allocation_proposal(value_of_type_7), f"#{i+1}"
 
+    def test_import_white_list(self):
+        values = {IconNetworkValueType.IMPORT_WHITE_LIST: {"iconservice": ["*"]}}
+        with patch.object(Governance, 'get_icon_network_value', side_effect=lambda type: dict(values[type])) \
+                as get_icon_network_value:
+            # compiled once over calls
+            self.assertTrue(self.governance.isInImportWhiteList("{'iconservice': []}"))
+            self.assertFalse(self.governance.isInImportWhiteList("{'os': ['path']}"))
+            self.assertEqual(1, get_icon_network_value.call_count)
+
+            self.assertRaises(ValueError, self.governance.isInImportWhiteList, "{'os': 'path'}")
+
+    def test_score_black_list(self):
+        scores = [create_address(1) for _ in range(4)]
+        values = {IconNetworkValueType.SCORE_BLACK_LIST: scores[:3]}
+        self.governance._score_black_list_index = DefaultDictDBStub(int)
+
+        def set_icon_network_value(type, value):
+            values[type] = list(value)
+
+        def assert_black_list(expected: list):
+            self.assertEqual(expected, values[IconNetworkValueType.SCORE_BLACK_LIST])
+            self.assertEqual({address: i + 1 for i, address in enumerate(expected)},
+                             self.governance._score_black_list_index)
+
+        with patch.object(Governance, 'get_icon_network_value', side_effect=lambda type: list(values[type])), \
+                patch.object(IconSystemScoreBase, 'set_icon_network_value', create=True,
+                             side_effect=set_icon_network_value), \
+                patch.object(Governance, 'MaliciousScore') as malicious_score:
+            # backfilled from the network value
+            self.governance._migrate_v1_4_0()
+            assert_black_list(scores[:3])
+            self.assertTrue(self.governance.isInScoreBlackList(scores[1]))
+            self.assertFalse(self.governance.isInScoreBlackList(scores[3]))
+            self.assertEqual([True, False, True], self.governance.areInScoreBlackList([scores[2], scores[3], scores[0]]))
+            for invalid_addresses in ([], [scores[0]] * 101):
+                self.assertRaises(IconScoreException, self.governance.areInScoreBlackList, invalid_addresses)
+
+            self.governance._addToScoreBlackList(scores[3])
+            assert_black_list(scores)
+            malicious_score.assert_called_with(scores[3], MaliciousScoreType.FREEZE)
+            self.assertRaisesRegex(IconScoreException, "already SCORE blacklist",
+                                   self.governance._addToScoreBlackList, scores[3])
+
+            # the last one takes the place of the removed one
+            self.governance._removeFromScoreBlackList(scores[0])
+            assert_black_list([scores[3], scores[1], scores[2]])
+            malicious_score.assert_called_with(scores[0], MaliciousScoreType.UNFREEZE)
+            self.governance._removeFromScoreBlackList(scores[2])
+            assert_black_list([scores[3], scores[1]])
+            self.assertRaisesRegex(IconScoreException, "not in list",
+                                   self.governance._removeFromScoreBlackList, scores[0])
+            self.assertEqual([False, True, True], self.governance.areInScoreBlackList(scores[:2] + scores[3:]))
+
+    def test_auditor_list(self):
+        auditors = [create_address() for _ in range(4)]
+        self.governance._auditor_list = ArrayDBStub(auditors[:3])
+        self.governance._auditor_index = DefaultDictDBStub(int)
+
+        def assert_auditor_list(expected: list):
+            self.assertEqual(expected, self.governance._auditor_list)
+            self.assertEqual({address: i + 1 for i, address in enumerate(expected)}, self.governance._auditor_index)
+
+        with patch.object(Governance, 'msg', new_callable=PropertyMock, create=True) as msg, \
+                patch.object(Governance, 'owner', new_callable=PropertyMock, create=True, return_value=self.owner), \
+                patch.object(Governance, 'get_deploy_tx_params', create=True, return_value=None):
+            msg.return_value = Mock(sender=self.owner)
+
+            # backfilled from the auditor list
+            self.governance._migrate_v1_5_0()
+            assert_auditor_list(auditors[:3])
+
+            self.governance.addAuditor(auditors[3])
+            assert_auditor_list(auditors)
+            self.assertRaisesRegex(IconScoreException, "already auditor", self.governance.addAuditor, auditors[3])
+
+            # the last one takes the place of the removed one
+            self.governance.removeAuditor(auditors[0])
+            assert_auditor_list([auditors[3], auditors[1], auditors[2]])
+            msg.return_value = Mock(sender=auditors[2])
+            self.governance.removeAuditor(auditors[2])
+            assert_auditor_list([auditors[3], auditors[1]])
+            self.assertRaisesRegex(IconScoreException, "not in list", self.governance.removeAuditor, auditors[0])
+            self.assertRaisesRegex(IconScoreException, "not yourself", self.governance.removeAuditor, auditors[1])
+
+            # only the auditors pass the sender check
+            for sender, message in ((auditors[0], "no permission"), (auditors[2], "no permission"),
+                                    (auditors[3], "Invalid txHash")):
+                msg.return_value = Mock(sender=sender)
+                self.assertRaisesRegex(IconScoreException, message, self.governance.acceptScore, create_tx_hash())
+                self.assertRaisesRegex(IconScoreException, message, self.governance.rejectScore, create_tx_hash(),
+                                       "reason")
+
+    def test_vote_proposals(self):
+        main_preps = [Prep(create_address(), DEFAULT_DELEGATED) for _ in range(COUNT_OF_MAIN_PREPS)]
+        sender = main_preps[3].address
+        ids = [create_tx_hash() for _ in range(3)]
+        votes = [NetworkProposalVote.AGREE, NetworkProposalVote.DISAGREE, NetworkProposalVote.AGREE]
+        network_proposal = Mock()
+        self.governance._network_proposal = network_proposal
+        with patch('governance.governance.get_main_prep_info', return_value=(main_preps, 0)), \
+                patch.object(Governance, 'msg', new_callable=PropertyMock, create=True) as msg, \
+                patch.object(Governance, 'tx', new_callable=PropertyMock, create=True), \
+                patch.object(Governance, 'block_height', new_callable=PropertyMock, create=True, return_value=100), \
+                patch.object(Governance, 'NetworkProposalVoted') as voted, \
+                patch.object(Governance, 'NetworkProposalApproved') as approved, \
+                patch.object(Governance, '_approve_network_proposal') as approve_network_proposal:
+            msg.return_value = Mock(sender=sender)
+
+            # invalid parameters
+            for invalid_ids, invalid_votes in (([], []),
+                                               ([create_tx_hash() for _ in range(21)], [NetworkProposalVote.AGREE] * 21),
+                                               (ids, votes[:2]),
+                                               ([ids[0], ids[1], ids[0]], votes)):
+                self.assertRaises(IconScoreException, self.governance.voteProposals, invalid_ids, invalid_votes)
+            network_proposal.vote_proposal.assert_not_called()
+
+            # sender is not a main P-Rep
+            msg.return_value = Mock(sender=create_address())
+            self.assertRaisesRegex(IconScoreException, "No permission - only for main prep",
+                                   self.governance.voteProposals, ids, votes)
+            network_proposal.vote_proposal.assert_not_called()
+            msg.return_value = Mock(sender=sender)
+
+            # votes are applied in order and the second one approves its proposal
+            network_proposal.vote_proposal.side_effect = [(False, 0, None), (True, 1, {"value": "0x1"}),
+                                                          (False, 0, None)]
+            self.governance.voteProposals(ids, votes)
+            self.assertEqual(ids, [call[0][0] for call in network_proposal.vote_proposal.call_args_list])
+            self.assertEqual(votes, [call[0][2] for call in network_proposal.vote_proposal.call_args_list])
+            for call in network_proposal.vote_proposal.call_args_list:
+                self.assertIs(main_preps[3], call[0][1])
+            self.assertEqual([(id_, vote, sender) for id_, vote in zip(ids, votes)],
+                             [call[0] for call in voted.call_args_list])
+            approved.assert_called_once_with(ids[1])
+            approve_network_proposal.assert_called_once_with(1, {"value": "0x1"})
+            network_proposal.finalize_expired_proposals.assert_called_once()
+
+            # a failed vote fails the whole call
+            network_proposal.vote_proposal.side_effect = [(False, 0, None), IconScoreException("Already voted")]
+            self.assertRaisesRegex(IconScoreException, "Already voted", self.governance.voteProposals, ids, votes)
+
 
 class TestUnitNetworkProposal(unittest.TestCase):
 
-    @patch_several(PATCHER_NP_ARRAY_DB, PATCHER_NP_DICT_DB)
+    @patch_several(PATCHER_NP_ARRAY_DB, PATCHER_NP_DICT_DB, PATCHER_NP_VAR_DB)
     def setUp(self) -> None:
         db = Mock()
         db.__class = IconScoreDatabase
         self.network_proposal = NetworkProposal(db)
         self.network_proposal._proposal_list = {}
-        self.network_proposal._proposal_list_keys = []
+        self.network_proposal._proposal_list_keys = ArrayDBStub()
+        self.network_proposal._proposal_tally = DictDBStub()
+        self.network_proposal._proposal_votes = NestedDictDBStub()
+        self.network_proposal._proposal_voters = NestedDictDBStub(depth=3)
+        self.network_proposal._proposal_thresholds = DictDBStub()
+        self.network_proposal._proposal_prep_snapshot = DictDBStub()
+        self.network_proposal._prep_snapshots = DictDBStub()
+        self.network_proposal._prep_snapshot_ids = DefaultDictDBStub(int)
+        self.network_proposal._prep_snapshot_members = NestedDictDBStub()
+        self.network_proposal._prep_snapshot_count = VarDBStub()
+        self.network_proposal._proposal_seq = DictDBStub()
+        self.network_proposal._type_index = {
+            type_: SortedIndex(ArrayDBStub()) for type_ in range(NetworkProposalType.MIN, NetworkProposalType.MAX + 1)
+        }
+        self.network_proposal._status_index = {
+            status: SortedIndex(ArrayDBStub())
+            for status in range(NetworkProposalStatus.MIN, NetworkProposalStatus.MAX + 1)
+        }
+        self.network_proposal._type_status_index = {
+            type_: {
+                status: SortedIndex(ArrayDBStub())
+                for status in range(NetworkProposalStatus.MIN, NetworkProposalStatus.MAX + 1)
+            }
+            for type_ in range(NetworkProposalType.MIN, NetworkProposalType.MAX + 1)
+        }
+        proposer_indexes = {}
+        self.network_proposal._proposer_index = \
+            lambda proposer: proposer_indexes.setdefault(proposer, SortedIndex(ArrayDBStub()))
+        self.network_proposal._proposal_count = NestedDictDBStub(int)
+        self.network_proposal._proposer_count = NestedDictDBStub(int, depth=3)
+        self.network_proposal._prep_votes = NestedDictDBStub()
+        self.network_proposal._prep_vote_count = DefaultDictDBStub(int)
+        self.network_proposal._expiry_queue = SortedIndex(ArrayDBStub())
+        self.network_proposal._expiry_head = VarDBStub()
+        self.network_proposal._proposal_archive = DictDBStub()
+        self.network_proposal._archive_head = VarDBStub()
+        self.network_proposal._change_log = SortedIndex(ArrayDBStub())
+        self.network_proposal._max_page_size = VarDBStub()
 
     @patch_several(PATCHER_JSON_LOADS, PATCHER_JSON_DUMPS)
     def test_proposal_info_to_bytes_from_bytes(self):
@@ -239,8 +488,57 @@ class TestUnitNetworkProposal(unittest.TestCase):
             NetworkProposalStatus.VOTING, vote)
         proposal_info_in_bytes = proposal_info.to_bytes()
 
-        expected_value = {
-            "id": proposal_info.id,
+        self.assertEqual(ProposalInfo._SCHEMA_V1, proposal_info_in_bytes[0])
+        decoded_proposal_info = ProposalInfo.from_bytes(proposal_info_in_bytes)
+        # voter lists are decoded on the first access to vote
+        self.assertNotIn("vote", vars(decoded_proposal_info))
+        self.assertEqual([(1, 100), (2, 200), (19, total_delegated_amount - 300)],
+                         decoded_proposal_info.get_vote_tallies())
+        self.assertEqual(proposal_info.vote, decoded_proposal_info.decode_vote())
+        self.assertIn("vote", vars(decoded_proposal_info))
+        self.assertEqual(vars(proposal_info), vars(decoded_proposal_info))
+        self.assertEqual(proposal_info_in_bytes, decoded_proposal_info.to_bytes())
+
+    @patch_several(PATCHER_JSON_LOADS, PATCHER_JSON_DUMPS)
+    def test_proposal_info_header_to_bytes_from_bytes(self):
+        vote = self._generate_vote(1, 100, 2, 200, 3000)
+        proposal_info, _ = self._generate_proposal_info(NetworkProposalStatus.APPROVED, vote)
+        header_in_bytes = proposal_info.header_to_bytes()
+
+        self.assertEqual(ProposalInfo._SCHEMA_HEADER, header_in_bytes[0])
+        decoded_proposal_info = ProposalInfo.from_bytes(header_in_bytes)
+        self.assertEqual(NetworkProposalStatus.VOTING, decoded_proposal_info.status)
+        self.assertEqual([(0, 0), (0, 0), (COUNT_OF_MAIN_PREPS, 3000)], decoded_proposal_info.get_vote_tallies())
+        self.assertEqual(header_in_bytes, decoded_proposal_info.header_to_bytes())
+        # the registered voters are not in the header
+        self.assertRaises(AttributeError, getattr, decoded_proposal_info, "vote")
+        self.assertRaises(AttributeError, decoded_proposal_info.decode_vote)
+
+        addresses = [voter["address"] for voter in vote["agree"]["list"] + vote["disagree"]["list"]]
+        addresses += vote["noVote"]["list"]
+        decoded_proposal_info = ProposalInfo.from_bytes(header_in_bytes, addresses)
+        self.assertNotIn("vote", vars(decoded_proposal_info))
+        self.assertEqual(addresses, decoded_proposal_info.vote["noVote"]["list"])
+        self.assertEqual(3000, decoded_proposal_info.vote["noVote"]["amount"])
+        self.assertEqual([], decoded_proposal_info.vote["agree"]["list"])
+        self.assertNotIn("_vote_source", vars(decoded_proposal_info))
+
+    def test_prep_snapshot_to_bytes_from_bytes(self):
+        main_preps = [Prep(create_address(), i * 10) for i in range(COUNT_OF_MAIN_PREPS)]
+        snapshot = PRepSnapshot.from_main_preps(main_preps)
+        self.assertEqual([str(main_prep.address) for main_prep in main_preps], snapshot.addresses)
+        self.assertEqual(sum(main_prep.delegated for main_prep in main_preps), snapshot.total_delegated)
+        self.assertEqual(snapshot.preps, PRepSnapshot.from_bytes(snapshot.to_bytes()).preps)
+
+    @patch_several(PATCHER_JSON_LOADS, PATCHER_JSON_DUMPS)
+    def test_proposal_info_from_legacy_bytes(self):
+        total_voter: int = 22
+        total_delegated_amount: int = 3000
+        vote = self._generate_vote(1, 100, 2, 200, total_delegated_amount, total_voter)
+        proposal_info, _ = self._generate_proposal_info(NetworkProposalStatus.VOTING, vote)
+
+        legacy_value = {
+            "id": bytes.hex(proposal_info.id),
             "proposer": str(proposal_info.proposer),
             "proposer_name": proposal_info.proposer_name,
             "title": proposal_info.title,
@@ -254,9 +552,11 @@ class TestUnitNetworkProposal(unittest.TestCase):
             "total_voter": total_voter,
             "total_delegated_amount": total_delegated_amount
         }
+        legacy_bytes = dumps(legacy_value).encode()
 
-        self.assertEqual(proposal_info_in_bytes, dumps(expected_value).encode())
-        self.assertEqual(proposal_info_in_bytes, proposal_info.from_bytes(proposal_info_in_bytes).to_bytes())
+        decoded_proposal_info = ProposalInfo.from_bytes(legacy_bytes)
+        self.assertEqual(vars(proposal_info), vars(decoded_proposal_info))
+        self.assertLess(len(decoded_proposal_info.to_bytes()), len(legacy_bytes))
 
     def test_validate_proposal_type(self):
         for valid_proposal_type in (0, 1, 2, 3, 4, 5, 6, 7):
@@ -279,130 +579,317 @@ class TestUnitNetworkProposal(unittest.TestCase):
     @patch_several(PATCHER_JSON_LOADS, PATCHER_JSON_DUMPS)
     def test_check_registered_proposal(self):
         tx_hash = create_tx_hash()
-        self.assertRaises(KeyError, self.network_proposal._check_registered_proposal, tx_hash)
+        headers = ProposalHeaders(self.network_proposal._proposal_list)
+        self.assertRaises(KeyError, self.network_proposal._check_registered_proposal, tx_hash, headers)
 
         self.network_proposal._proposal_list[tx_hash] = create_tx_hash()
-        self.assertTrue(self.network_proposal._check_registered_proposal(tx_hash))
+        headers = ProposalHeaders(self.network_proposal._proposal_list)
+        self.assertTrue(self.network_proposal._check_registered_proposal(tx_hash, headers))
 
     @patch_several(PATCHER_JSON_LOADS, PATCHER_JSON_DUMPS)
     def test_check_vote_result(self):
         # case(1): return False, when type is 'agree', len(prep) < 15, delegated >= 66%
         vote = self._generate_vote(14, 66, 0, 0, 100)
         proposal_info, _ = self._generate_proposal_info(NetworkProposalStatus.VOTING, vote)
-        self.assertFalse(self.network_proposal._check_vote_result(NetworkProposalVote.AGREE, proposal_info))
+        self.assertFalse(self.network_proposal._check_vote_result(NetworkProposalVote.AGREE, ProposalThresholds.from_proposal_info(proposal_info),
+                                                                  ProposalTally.from_proposal_info(proposal_info)))
 
         # case(2): return False, when type is 'agree', len(prep) >= 15, delegated < 66%
         vote = self._generate_vote(15, 65, 0, 0, 100)
         proposal_info, _ = self._generate_proposal_info(NetworkProposalStatus.VOTING, vote)
-        self.assertFalse(self.network_proposal._check_vote_result(NetworkProposalVote.AGREE, proposal_info))
+        self.assertFalse(self.network_proposal._check_vote_result(NetworkProposalVote.AGREE, ProposalThresholds.from_proposal_info(proposal_info),
+                                                                  ProposalTally.from_proposal_info(proposal_info)))
 
         # case(3): return True, when type is 'agree', len(prep) >= 15, delegated >= 66%
         vote = self._generate_vote(15, 66, 0, 0, 100)
         proposal_info, _ = self._generate_proposal_info(NetworkProposalStatus.VOTING, vote)
-        self.assertTrue(self.network_proposal._check_vote_result(NetworkProposalVote.AGREE, proposal_info))
+        self.assertTrue(self.network_proposal._check_vote_result(NetworkProposalVote.AGREE, ProposalThresholds.from_proposal_info(proposal_info),
+                                                                  ProposalTally.from_proposal_info(proposal_info)))
 
         # case(4): return False, when type is 'disagree', len(prep) < 8, delegated >= 33%
         vote = self._generate_vote(0, 0, 7, 33, 100)
         proposal_info, _ = self._generate_proposal_info(NetworkProposalStatus.VOTING, vote)
-        self.assertFalse(self.network_proposal._check_vote_result(NetworkProposalVote.DISAGREE, proposal_info))
+        self.assertFalse(self.network_proposal._check_vote_result(NetworkProposalVote.DISAGREE, ProposalThresholds.from_proposal_info(proposal_info),
+                                                                  ProposalTally.from_proposal_info(proposal_info)))
 
         # case(5): return False, when type is 'disagree', len(prep) >= 8, delegated < 33%
         vote = self._generate_vote(0, 0, 8, 32, 100)
         proposal_info, _ = self._generate_proposal_info(NetworkProposalStatus.VOTING, vote)
-        self.assertFalse(self.network_proposal._check_vote_result(NetworkProposalVote.DISAGREE, proposal_info))
+        self.assertFalse(self.network_proposal._check_vote_result(NetworkProposalVote.DISAGREE, ProposalThresholds.from_proposal_info(proposal_info),
+                                                                  ProposalTally.from_proposal_info(proposal_info)))
 
         # case(6): return True, when type is 'disagree', len(prep) >= 8, delegated >= 33%
         vote = self._generate_vote(0, 0, 8, 33, 100)
         proposal_info, _ = self._generate_proposal_info(NetworkProposalStatus.VOTING, vote)
-        self.assertTrue(self.network_proposal._check_vote_result(NetworkProposalVote.DISAGREE, proposal_info))
+        self.assertTrue(self.network_proposal._check_vote_result(NetworkProposalVote.DISAGREE, ProposalThresholds.from_proposal_info(proposal_info),
+                                                                  ProposalTally.from_proposal_info(proposal_info)))
 
         # case(7): return True, when type is 'agree', len(prep) >= 3, delegated >= 66%, total_voter = 4
         vote = self._generate_vote(3, 66, 0, 0, 100, 4)
         proposal_info, _ = self._generate_proposal_info(NetworkProposalStatus.VOTING, vote)
-        self.assertTrue(self.network_proposal._check_vote_result(NetworkProposalVote.AGREE, proposal_info))
+        self.assertTrue(self.network_proposal._check_vote_result(NetworkProposalVote.AGREE, ProposalThresholds.from_proposal_info(proposal_info),
+                                                                  ProposalTally.from_proposal_info(proposal_info)))
 
         # case(8): return False, when type is 'agree', len(prep) = 2, delegated >= 66%, total_voter = 4
         vote = self._generate_vote(2, 66, 0, 0, 100, 4)
         proposal_info, _ = self._generate_proposal_info(NetworkProposalStatus.VOTING, vote)
-        self.assertFalse(self.network_proposal._check_vote_result(NetworkProposalVote.AGREE, proposal_info))
+        self.assertFalse(self.network_proposal._check_vote_result(NetworkProposalVote.AGREE, ProposalThresholds.from_proposal_info(proposal_info),
+                                                                  ProposalTally.from_proposal_info(proposal_info)))
 
         # case(9): return True, when type is 'disagree', len(prep) = 2, delegated >= 33%, total_voter = 4
         vote = self._generate_vote(0, 0, 2, 33, 100, 4)
         proposal_info, _ = self._generate_proposal_info(NetworkProposalStatus.VOTING, vote)
-        self.assertTrue(self.network_proposal._check_vote_result(NetworkProposalVote.DISAGREE, proposal_info))
+        self.assertTrue(self.network_proposal._check_vote_result(NetworkProposalVote.DISAGREE, ProposalThresholds.from_proposal_info(proposal_info),
+                                                                  ProposalTally.from_proposal_info(proposal_info)))
 
         # case(10): return False, when type is 'disagree', len(prep) = 2, delegated < 33%, total_voter = 4
         vote = self._generate_vote(0, 0, 2, 32, 100, 4)
         proposal_info, _ = self._generate_proposal_info(NetworkProposalStatus.VOTING, vote)
-        self.assertFalse(self.network_proposal._check_vote_result(NetworkProposalVote.DISAGREE, proposal_info))
+        self.assertFalse(self.network_proposal._check_vote_result(NetworkProposalVote.DISAGREE, ProposalThresholds.from_proposal_info(proposal_info),
+                                                                  ProposalTally.from_proposal_info(proposal_info)))
+
+    def test_check_vote_result_same_as_exact_rate(self):
+        def legacy_check(count, amount, total_voter, total_delegated, rate):
+            try:
+                return count / total_voter >= rate and amount / total_delegated >= rate
+            except ZeroDivisionError:
+                return False
+
+        def exact_check(count, amount, total_voter, total_delegated, rate):
+            if total_voter == 0 or total_delegated == 0:
+                return False
+            rate = Fraction(rate).limit_denominator(100)
+            return Fraction(count, total_voter) >= rate and Fraction(amount, total_delegated) >= rate
+
+        conditions = (
+            (NetworkProposalVote.AGREE, "agree", ApproveCondition.APPROVE_RATE),
+            (NetworkProposalVote.DISAGREE, "disagree", ApproveCondition.DISAPPROVE_RATE)
+        )
+        rand = random.Random(1)
+        for i in range(3000):
+            total_voter = rand.randint(0, 30)
+            total_delegated = rand.choice((0, rand.randint(1, 200), rand.randint(1, 10 ** 27)))
+            count = rand.randint(0, total_voter)
+            if total_delegated > 0 and rand.random() < 0.5:
+                # near the boundary of the rate
+                amount = total_delegated * rand.choice((33, 66)) // 100 + rand.randint(-1, 1)
+            else:
+                amount = rand.randint(0, total_delegated)
+            amount = min(max(amount, 0), total_delegated)
+
+            thresholds = ProposalThresholds.from_proposal_info(Mock(total_voter=total_voter,
+                                                                    total_delegated_amount=total_delegated))
+            thresholds = ProposalThresholds.from_bytes(thresholds.to_bytes())
+            for vote_type, key, rate in conditions:
+                tally = Mock(vote={key: {"count": count, "amount": amount}})
+                result = self.network_proposal._check_vote_result(vote_type, thresholds, tally)
+                args = (count, amount, total_voter, total_delegated, rate)
+                self.assertEqual(exact_check(*args), result, f"#{i} {args}")
+                if result != legacy_check(*args):
+                    # float division can differ only by rounding at the boundary
+                    self.assertTrue(abs(Fraction(amount, total_delegated) - Fraction(rate).limit_denominator(100))
+                                    < Fraction(1, 10 ** 15), f"#{i} {args}")
+
+        # float division rounds up to the rate although the amount is below it
+        total_delegated = 3 * 10 ** 26 + 1
+        amount = total_delegated * 66 // 100
+        self.assertTrue(legacy_check(22, amount, 22, total_delegated, ApproveCondition.APPROVE_RATE))
+        thresholds = ProposalThresholds.from_proposal_info(Mock(total_voter=22, total_delegated_amount=total_delegated))
+        tally = Mock(vote={"agree": {"count": 22, "amount": amount}})
+        self.assertFalse(self.network_proposal._check_vote_result(NetworkProposalVote.AGREE, thresholds, tally))
 
     @patch_several(PATCHER_JSON_LOADS, PATCHER_JSON_DUMPS, PATCHER_CHECK_REGISTERED_PROPOSAL)
     def test_get_proposal(self):
         voter = self._generate_vote(2, 10, 3, 20, 100)
-        proposal_info, self.network_proposal._proposal_list[proposal_info.id] = self._generate_proposal_info(
-            NetworkProposalStatus.VOTING, voter)
-        current_block_height = proposal_info.end_block_height + 1
+        proposal_info, _ = self._generate_proposal_info(NetworkProposalStatus.VOTING, voter)
+        self._put_proposal_info(proposal_info)
 
-        buf_proposal_info = deepcopy(proposal_info)
-        expected_value = self.network_proposal._generate_proposal_info_in_dict_for_get_proposal(buf_proposal_info)
+        expected_value = self.network_proposal._generate_proposal_info_in_dict_for_get_proposal(
+            deepcopy(proposal_info))
 
         self.network_proposal._check_registered_proposal.return_value = True
-        # case(1): when finish prep period (end block height < current block height), NetworkProposalStatus == VOTING
-        with patch.object(ProposalInfo, 'from_bytes', return_value=deepcopy(proposal_info)):
-            result = self.network_proposal.get_proposal(proposal_info.id, current_block_height)
-            expected_value["status"] = hex(NetworkProposalStatus.DISAPPROVED)
-            self.assertEqual(result, expected_value)
-
-        # case(2): when finish prep period (end block height < current block height), NetworkProposalStatus == APPROVED
-        proposal_info.status = NetworkProposalStatus.APPROVED
-        with patch.object(ProposalInfo, 'from_bytes', return_value=deepcopy(proposal_info)):
-            result = self.network_proposal.get_proposal(proposal_info.id, current_block_height)
-            expected_value["status"] = hex(NetworkProposalStatus.APPROVED)
-            self.assertEqual(result, expected_value)
-
-        # case(3): when finish prep period (end block height < current block height),
-        # NetworkProposalStatus == DISAPPROVED
-        proposal_info.status = NetworkProposalStatus.DISAPPROVED
-        with patch.object(ProposalInfo, 'from_bytes', return_value=deepcopy(proposal_info)):
-            result = self.network_proposal.get_proposal(proposal_info.id, current_block_height)
-            expected_value["status"] = hex(NetworkProposalStatus.DISAPPROVED)
-            self.assertEqual(result, expected_value)
-
-        # case(4): when finish prep period (end block height < current block height), NetworkProposalStatus == CANCELED
-        proposal_info.status = NetworkProposalStatus.CANCELED
-        with patch.object(ProposalInfo, 'from_bytes', return_value=deepcopy(proposal_info)):
-            result = self.network_proposal.get_proposal(proposal_info.id, current_block_height)
-            expected_value["status"] = hex(NetworkProposalStatus.CANCELED)
-            self.assertEqual(result, expected_value)
+        # case(1): when finish prep period (end block height < current block height),
+        # only VOTING status is changed to DISAPPROVED
+        # case(2): during prep period (end block height >= current block height), status is not changed
+        for current_block_height, expired in ((proposal_info.end_block_height + 1, True),
+                                              (proposal_info.end_block_height - 1, False)):
+            for status in (NetworkProposalStatus.VOTING, NetworkProposalStatus.APPROVED,
+                           NetworkProposalStatus.DISAPPROVED, NetworkProposalStatus.CANCELED):
+                self._set_status(proposal_info.id, status)
+                result = self.network_proposal.get_proposal(proposal_info.id, current_block_height)
+
+                if expired and status == NetworkProposalStatus.VOTING:
+                    status = NetworkProposalStatus.DISAPPROVED
+                expected_value["status"] = hex(status)
+                self.assertEqual(result, expected_value)
 
+    @patch_several(PATCHER_JSON_LOADS, PATCHER_JSON_DUMPS)
+    def test_get_proposal_with_voters_page(self):
+        voter = self._generate_vote(3, 30, 2, 20, 100)
+        proposal_info, _ = self._generate_proposal_info(NetworkProposalStatus.VOTING, voter)
+        self._put_proposal_info(proposal_info)
         current_block_height = proposal_info.end_block_height - 1
-        proposal_info.status = NetworkProposalStatus.VOTING
-        # case(5): during prep period (end block height >= current block height), Network proposal status == VOTING
-        with patch.object(ProposalInfo, 'from_bytes', return_value=deepcopy(proposal_info)):
-            result = self.network_proposal.get_proposal(proposal_info.id, current_block_height)
-            expected_value["status"] = hex(NetworkProposalStatus.VOTING)
-            self.assertEqual(result, expected_value)
-
-        proposal_info.status = NetworkProposalStatus.APPROVED
-        # case(6): during prep period (end block height >= current block height), Network proposal status == APPROVED
-        with patch.object(ProposalInfo, 'from_bytes', return_value=deepcopy(proposal_info)):
-            result = self.network_proposal.get_proposal(proposal_info.id, current_block_height)
-            expected_value["status"] = hex(NetworkProposalStatus.APPROVED)
-            self.assertEqual(result, expected_value)
-
-        proposal_info.status = NetworkProposalStatus.DISAPPROVED
-        # case(7): during prep period (end block height >= current block height), Network proposal status == DISAPPROVED
-        with patch.object(ProposalInfo, 'from_bytes', return_value=deepcopy(proposal_info)):
-            result = self.network_proposal.get_proposal(proposal_info.id, current_block_height)
-            expected_value["status"] = hex(NetworkProposalStatus.DISAPPROVED)
-            self.assertEqual(result, expected_value)
+        self.network_proposal._check_registered_proposal = Mock(return_value=True)
+
+        expected = self.network_proposal.get_proposal(proposal_info.id, current_block_height)
+        self.assertEqual(expected, self.network_proposal.get_proposal(proposal_info.id, current_block_height, "all"))
+
+        result = self.network_proposal.get_proposal(proposal_info.id, current_block_height, "none")
+        self.assertEqual(self.network_proposal.get_proposals(current_block_height)["proposals"][0], result)
+        self.assertEqual({"count": "0x3", "amount": hex(30)}, result["vote"]["agree"])
+
+        result = self.network_proposal.get_proposal(proposal_info.id, current_block_height, "agree", 1, 5)
+        self.assertEqual({key: value for key, value in expected.items() if key != "vote"},
+                         {key: value for key, value in result.items() if key != "vote"})
+        self.assertEqual({
+            "agree": {"count": "0x3", "amount": hex(30), "list": expected["vote"]["agree"]["list"][1:]},
+            "disagree": {"count": "0x2", "amount": hex(20)},
+            "noVote": {"count": hex(COUNT_OF_MAIN_PREPS - 5), "amount": hex(50)}
+        }, result["vote"])
+
+        result = self.network_proposal.get_proposal(proposal_info.id, current_block_height, "noVote", 15, 5)
+        self.assertEqual(expected["vote"]["noVote"]["list"][15:], result["vote"]["noVote"]["list"])
+        result = self.network_proposal.get_proposal(proposal_info.id, current_block_height, "noVote", size=2)
+        self.assertEqual(expected["vote"]["noVote"]["list"][:2], result["vote"]["noVote"]["list"])
+
+        # votes are read only for the page
+        voter_address = Address.from_string(expected["vote"]["noVote"]["list"][0])
+        self.network_proposal.vote_proposal(proposal_info.id, Prep(voter_address, 10), NetworkProposalVote.AGREE,
+                                            current_block_height, create_tx_hash(), 10)
+        expected = self.network_proposal.get_proposal(proposal_info.id, current_block_height)
+        with patch.object(ProposalVote, 'from_bytes', side_effect=ProposalVote.from_bytes) as from_bytes:
+            result = self.network_proposal.get_proposal(proposal_info.id, current_block_height, "agree", 2, 5)
+            self.assertEqual(expected["vote"]["agree"]["list"][2:], result["vote"]["agree"]["list"])
+            self.assertEqual(2, from_bytes.call_count)
+            result = self.network_proposal.get_proposal(proposal_info.id, current_block_height, "disagree", 0, 1)
+            self.assertEqual(expected["vote"]["disagree"]["list"][:1], result["vote"]["disagree"]["list"])
+            self.assertEqual(3, from_bytes.call_count)
+        result = self.network_proposal.get_proposal(proposal_info.id, current_block_height, "noVote", 0, 3)
+        self.assertEqual(expected["vote"]["noVote"]["list"][:3], result["vote"]["noVote"]["list"])
+
+        # archived proposals are paged the same
+        self.network_proposal.finalize_expired_proposals(proposal_info.end_block_height + 1, 10)
+        self.network_proposal.archive_proposals(10)
+        self.assertIsNotNone(self.network_proposal._proposal_archive[proposal_info.id])
+        self.assertEqual(0, len(self.network_proposal._proposal_voters[proposal_info.id][NetworkProposalVote.AGREE]))
+        for voters in ("agree", "disagree", "noVote"):
+            result = self.network_proposal.get_proposal(proposal_info.id, current_block_height, voters, 1, 2)
+            self.assertEqual(expected["vote"][voters]["list"][1:3], result["vote"][voters]["list"])
+
+        for voters, start, size in (("vote", 0, 1), ("agree", -1, 1), ("agree", 0, 0)):
+            self.assertRaises(IconScoreException, self.network_proposal.get_proposal,
+                              proposal_info.id, current_block_height, voters, start, size)
 
-        proposal_info.status = NetworkProposalStatus.CANCELED
-        # case(8): during prep period (end block height >= current block height), Network proposal status == CANCELED
-        with patch.object(ProposalInfo, 'from_bytes', return_value=deepcopy(proposal_info)):
-            result = self.network_proposal.get_proposal(proposal_info.id, current_block_height)
-            expected_value["status"] = hex(NetworkProposalStatus.CANCELED)
-            self.assertEqual(result, expected_value)
+    @patch_several(PATCHER_JSON_LOADS, PATCHER_JSON_DUMPS)
+    def test_get_proposals_by_ids(self):
+        self.network_proposal._proposal_list = DictDBStub()
+        proposals = []
+        for status in (NetworkProposalStatus.VOTING, NetworkProposalStatus.APPROVED):
+            voter = self._generate_vote(2, 10, 3, 20, 100)
+            proposal_info, _ = self._generate_proposal_info(status, voter)
+            self._put_proposal_info(proposal_info)
+            proposals.append(proposal_info)
+        unregistered_id = create_tx_hash()
+        ids = [proposals[1].id, unregistered_id, proposals[0].id, proposals[1].id]
+
+        for current_block_height in (proposals[0].end_block_height - 1, proposals[0].end_block_height + 1):
+            expected = [self.network_proposal.get_proposal(proposal_info.id, current_block_height)
+                        for proposal_info in proposals]
+            result = self.network_proposal.get_proposals_by_ids(ids, current_block_height)
+            self.assertEqual([expected[1], None, expected[0], expected[1]], result["proposals"])
+
+            expected = {
+                proposal["id"]: proposal
+                for proposal in self.network_proposal.get_proposals(current_block_height)["proposals"]
+            }
+            result = self.network_proposal.get_proposals_by_ids(ids, current_block_height, False)
+            self.assertEqual([expected['0x' + bytes.hex(id)] if id != unregistered_id else None for id in ids],
+                             result["proposals"])
+
+        self.assertRaises(IconScoreException, self.network_proposal.get_proposals_by_ids, [], 1)
+        self.assertRaises(IconScoreException, self.network_proposal.get_proposals_by_ids, [unregistered_id] * 21, 1)
+
+    @patch_several(PATCHER_JSON_LOADS, PATCHER_JSON_DUMPS)
+    def test_migrate_proposals(self):
+        voter = self._generate_vote(2, 10, 3, 20, 100)
+        legacy_proposal_info, _ = self._generate_proposal_info(NetworkProposalStatus.VOTING, voter)
+        legacy_value = dict(vars(legacy_proposal_info))
+        legacy_value["id"] = bytes.hex(legacy_proposal_info.id)
+        legacy_value["proposer"] = str(legacy_proposal_info.proposer)
+        self.network_proposal._proposal_list[legacy_proposal_info.id] = dumps(legacy_value).encode()
+        self.network_proposal._proposal_list_keys.append(legacy_proposal_info.id)
+
+        voter = self._generate_vote(1, 10, 0, 0, 100)
+        proposal_info, _ = self._generate_proposal_info(NetworkProposalStatus.APPROVED, voter)
+        self.network_proposal._proposal_list[proposal_info.id] = proposal_info.to_bytes()
+        self.network_proposal._proposal_list_keys.append(proposal_info.id)
+
+        self.network_proposal.migrate_proposals()
+        # migrating again does nothing
+        self.network_proposal.migrate_proposals()
+
+        for expected in (legacy_proposal_info, proposal_info):
+            self.assertEqual(expected.header_to_bytes(), self.network_proposal._proposal_list[expected.id])
+            preps = [(voter_in_dict["address"], voter_in_dict["name"], voter_in_dict["amount"])
+                     for voter_in_dict in expected.vote["agree"]["list"] + expected.vote["disagree"]["list"]]
+            preps += [(address, "", 0) for address in expected.vote["noVote"]["list"]]
+            snapshot_id = self.network_proposal._proposal_prep_snapshot[expected.id]
+            self.assertEqual(preps, PRepSnapshot.from_bytes(self.network_proposal._prep_snapshots[snapshot_id]).preps)
+            self.assertEqual({Address.from_string(address): True for address, _, _ in preps},
+                             self.network_proposal._prep_snapshot_members[snapshot_id])
+            self.assertEqual(ProposalThresholds.from_proposal_info(expected).to_bytes(),
+                             self.network_proposal._proposal_thresholds[expected.id])
+            self.assertEqual(vars(expected), vars(self._get_proposal_info(expected.id)))
+
+    @patch_several(PATCHER_JSON_LOADS, PATCHER_JSON_DUMPS)
+    def test_migrate_indexes(self):
+        voter = self._generate_vote(2, 10, 3, 20, 100)
+        proposers = [create_address(), create_address()]
+        for i in range(6):
+            type_ = NetworkProposalType.REVISION if i % 2 == 0 else NetworkProposalType.TEXT
+            proposal_info, _ = self._generate_proposal_info(NetworkProposalStatus.VOTING, voter, type_)
+            proposal_info.proposer = proposers[i % 3 // 2]
+            self._put_proposal_info(proposal_info)
+            if i % 3 == 0:
+                self._set_status(proposal_info.id, NetworkProposalStatus.APPROVED)
+
+        def get_indexes() -> dict:
+            return {(type_, status): list(index.iter_reversed())
+                    for type_, indexes in self.network_proposal._type_status_index.items()
+                    for status, index in indexes.items() if len(index) > 0}
+
+        def get_counts() -> dict:
+            return {(proposer, type_, status): count
+                    for proposer, counts in self.network_proposal._proposer_count.items()
+                    for type_, counts_of_type in counts.items()
+                    for status, count in counts_of_type.items() if count > 0}
+
+        expected_indexes = {(NetworkProposalType.REVISION, NetworkProposalStatus.APPROVED): [0],
+                            (NetworkProposalType.REVISION, NetworkProposalStatus.VOTING): [4, 2],
+                            (NetworkProposalType.TEXT, NetworkProposalStatus.APPROVED): [3],
+                            (NetworkProposalType.TEXT, NetworkProposalStatus.VOTING): [5, 1]}
+        # proposals 0, 1, 3 and 4 by the first proposer and 2 and 5 by the second one
+        expected_counts = {(proposers[0], NetworkProposalType.REVISION, NetworkProposalStatus.APPROVED): 1,
+                           (proposers[0], NetworkProposalType.REVISION, NetworkProposalStatus.VOTING): 1,
+                           (proposers[0], NetworkProposalType.TEXT, NetworkProposalStatus.APPROVED): 1,
+                           (proposers[0], NetworkProposalType.TEXT, NetworkProposalStatus.VOTING): 1,
+                           (proposers[1], NetworkProposalType.REVISION, NetworkProposalStatus.VOTING): 1,
+                           (proposers[1], NetworkProposalType.TEXT, NetworkProposalStatus.VOTING): 1}
+        self.assertEqual(expected_indexes, get_indexes())
+        self.assertEqual(expected_counts, get_counts())
+
+        # proposals indexed already by migrate_proposals are not added again
+        self.network_proposal.migrate_indexes()
+        self.assertEqual(expected_indexes, get_indexes())
+        self.assertEqual(expected_counts, get_counts())
+
+        for indexes in self.network_proposal._type_status_index.values():
+            for status in indexes:
+                indexes[status] = SortedIndex(ArrayDBStub())
+        self.network_proposal._proposer_count = NestedDictDBStub(int, depth=3)
+        self.network_proposal.migrate_indexes()
+        self.assertEqual(expected_indexes, get_indexes())
+        self.assertEqual(expected_counts, get_counts())
 
     @patch_several(PATCHER_JSON_LOADS, PATCHER_JSON_DUMPS)
     def test_get_proposals_during_prep_period(self):
@@ -412,12 +899,12 @@ class TestUnitNetworkProposal(unittest.TestCase):
         voter = self._generate_vote(2, 10, 3, 20, 100)
 
         for i in range(5):
-            proposal_info, self.network_proposal._proposal_list[proposal_info.id] = self._generate_proposal_info(
+            proposal_info, _ = self._generate_proposal_info(
                 NetworkProposalStatus.VOTING, voter)
-            self.network_proposal._proposal_list_keys.append(proposal_info.id)
+            self._put_proposal_info(proposal_info)
             proposal_info_in_dict = self.network_proposal._generate_proposal_info_in_dict_for_get_proposals(
-                proposal_info)
-            expected_proposal_list["proposals"].append(proposal_info_in_dict)
+                proposal_info, ProposalTally.from_proposal_info(proposal_info))
+            expected_proposal_list["proposals"].insert(0, proposal_info_in_dict)
 
         current_block_height = proposal_info.end_block_height - 1
         result = self.network_proposal.get_proposals(current_block_height)
@@ -431,15 +918,15 @@ class TestUnitNetworkProposal(unittest.TestCase):
         voter = self._generate_vote(2, 10, 3, 20, 100)
 
         for i in range(5):
-            proposal_info, self.network_proposal._proposal_list[proposal_info.id] = self._generate_proposal_info(
+            proposal_info, _ = self._generate_proposal_info(
                 NetworkProposalStatus.VOTING, voter)
-            self.network_proposal._proposal_list_keys.append(proposal_info.id)
+            self._put_proposal_info(proposal_info)
 
             buf_proposal_info = deepcopy(proposal_info)
             buf_proposal_info.status = NetworkProposalStatus.DISAPPROVED
             buf_proposal_info_in_dict = self.network_proposal._generate_proposal_info_in_dict_for_get_proposals(
-                buf_proposal_info)
-            expected_proposal_list["proposals"].append(buf_proposal_info_in_dict)
+                buf_proposal_info, ProposalTally.from_proposal_info(buf_proposal_info))
+            expected_proposal_list["proposals"].insert(0, buf_proposal_info_in_dict)
 
             current_block_height = proposal_info.end_block_height + 1
             result = self.network_proposal.get_proposals(current_block_height)
@@ -457,12 +944,12 @@ class TestUnitNetworkProposal(unittest.TestCase):
                 NetworkProposalType.TEXT, NetworkProposalType.REVISION, NetworkProposalType.MALICIOUS_SCORE,
                 NetworkProposalType.PREP_DISQUALIFICATION, NetworkProposalType.STEP_PRICE
             ]
-            proposal_info, self.network_proposal._proposal_list[proposal_info.id] = self._generate_proposal_info(
+            proposal_info, _ = self._generate_proposal_info(
                 NetworkProposalStatus.VOTING, voter, buf_network_proposal_type[i])
-            self.network_proposal._proposal_list_keys.append(proposal_info.id)
+            self._put_proposal_info(proposal_info)
 
             buf_proposal_info_in_dict = self.network_proposal._generate_proposal_info_in_dict_for_get_proposals(
-                proposal_info)
+                proposal_info, ProposalTally.from_proposal_info(proposal_info))
             expected_proposal_list["proposals"].append(buf_proposal_info_in_dict)
 
             current_block_height = proposal_info.end_block_height - 1
@@ -485,12 +972,12 @@ class TestUnitNetworkProposal(unittest.TestCase):
                 NetworkProposalStatus.VOTING, NetworkProposalStatus.APPROVED,
                 NetworkProposalStatus.DISAPPROVED, NetworkProposalStatus.CANCELED
             ]
-            proposal_info, self.network_proposal._proposal_list[proposal_info.id] = self._generate_proposal_info(
+            proposal_info, _ = self._generate_proposal_info(
                 buf_network_proposal_status[i], voter, buf_network_proposal_type[i])
-            self.network_proposal._proposal_list_keys.append(proposal_info.id)
+            self._put_proposal_info(proposal_info)
 
             buf_proposal_info_in_dict = self.network_proposal._generate_proposal_info_in_dict_for_get_proposals(
-                proposal_info)
+                proposal_info, ProposalTally.from_proposal_info(proposal_info))
             expected_proposal_list["proposals"].append(buf_proposal_info_in_dict)
 
             current_block_height = proposal_info.end_block_height - 1
@@ -509,15 +996,15 @@ class TestUnitNetworkProposal(unittest.TestCase):
                 NetworkProposalType.TEXT, NetworkProposalType.REVISION, NetworkProposalType.REVISION,
                 NetworkProposalType.PREP_DISQUALIFICATION, NetworkProposalType.STEP_PRICE
             ]
-            proposal_info, self.network_proposal._proposal_list[proposal_info.id] = self._generate_proposal_info(
+            proposal_info, _ = self._generate_proposal_info(
                 NetworkProposalStatus.VOTING, voter, buf_network_proposal_type[i])
-            self.network_proposal._proposal_list_keys.append(proposal_info.id)
+            self._put_proposal_info(proposal_info)
 
             buf_proposal_info_in_dict = self.network_proposal._generate_proposal_info_in_dict_for_get_proposals(
-                proposal_info)
+                proposal_info, ProposalTally.from_proposal_info(proposal_info))
 
             if proposal_info.type == NetworkProposalType.REVISION:
-                expected_proposal_list["proposals"].append(buf_proposal_info_in_dict)
+                expected_proposal_list["proposals"].insert(0, buf_proposal_info_in_dict)
 
         current_block_height = proposal_info.end_block_height - 1
         result = self.network_proposal.get_proposals(current_block_height, NetworkProposalType.REVISION,
@@ -526,24 +1013,514 @@ class TestUnitNetworkProposal(unittest.TestCase):
         self.assertEqual(5, len(self.network_proposal._proposal_list))
         self.assertEqual(expected_proposal_list, result)
 
-    @patch_several(PATCHER_JSON_LOADS, PATCHER_JSON_DUMPS, PATCHER_NP_ARRAY_DB, PATCHER_NP_DICT_DB)
-    def test_register_proposal(self):
+    @patch_several(PATCHER_JSON_LOADS, PATCHER_JSON_DUMPS)
+    def test_get_proposal_list_filled_by_index(self):
+        voter = self._generate_vote(2, 10, 3, 20, 100)
+        proposal_infos = []
+        for i in range(30):
+            type_ = NetworkProposalType.REVISION if i % 3 == 0 else NetworkProposalType.TEXT
+            proposal_info, _ = self._generate_proposal_info(NetworkProposalStatus.VOTING, voter, type_)
+            proposal_info.end_block_height = 100 if i % 2 == 0 else 10
+            self._put_proposal_info(proposal_info)
+            proposal_infos.append(proposal_info)
+        self._set_status(proposal_infos[4].id, NetworkProposalStatus.CANCELED)
+        self._set_status(proposal_infos[3].id, NetworkProposalStatus.APPROVED)
+
+        def get_ids(type_: int = None, status: int = None, start: int = 0) -> list:
+            result = self.network_proposal.get_proposals(50, type_, status, start)
+            return [proposal["id"] for proposal in result["proposals"]]
+
+        def expected_ids(indexes) -> list:
+            return ['0x' + bytes.hex(proposal_infos[i].id) for i in indexes][:10]
+
+        revisions = [i for i in range(29, -1, -1) if i % 3 == 0]
+        self.assertEqual(expected_ids(revisions), get_ids(NetworkProposalType.REVISION))
+        self.assertEqual(expected_ids(revisions[2:]), get_ids(NetworkProposalType.REVISION, start=2))
+
+        voting = [i for i in range(29, -1, -1) if i % 2 == 0 and i != 4]
+        self.assertEqual(expected_ids(voting), get_ids(status=NetworkProposalStatus.VOTING))
+        self.assertEqual(expected_ids(voting[10:]), get_ids(status=NetworkProposalStatus.VOTING, start=10))
+
+        # expired proposals in VOTING are DISAPPROVED
+        disapproved = [i for i in range(29, -1, -1) if i % 2 == 1 and i != 3]
+        self.assertEqual(expected_ids(disapproved), get_ids(status=NetworkProposalStatus.DISAPPROVED))
+        self.assertEqual(expected_ids([i for i in disapproved if i % 3 == 0]),
+                         get_ids(NetworkProposalType.REVISION, NetworkProposalStatus.DISAPPROVED))
+        self.assertEqual(expected_ids([3]), get_ids(NetworkProposalType.REVISION, NetworkProposalStatus.APPROVED))
+        self.assertEqual(expected_ids([4]), get_ids(status=NetworkProposalStatus.CANCELED))
+
+        # proposals to skip are not decoded if the index has the matching proposals only
+        get_header = ProposalHeaders.get
+        with patch.object(ProposalHeaders, 'get', autospec=True, side_effect=get_header) as mock_get_header:
+            self.assertEqual(expected_ids(range(4, -1, -1)), get_ids(start=25))
+            self.assertEqual(5, mock_get_header.call_count)
+
+            mock_get_header.reset_mock()
+            self.assertEqual(expected_ids(revisions[8:]), get_ids(NetworkProposalType.REVISION, start=8))
+            self.assertEqual(2, mock_get_header.call_count)
+
+            mock_get_header.reset_mock()
+            self.assertEqual([], get_ids(status=NetworkProposalStatus.APPROVED, start=1))
+            self.assertEqual(0, mock_get_header.call_count)
+
+            mock_get_header.reset_mock()
+            self.assertEqual([], get_ids(NetworkProposalType.REVISION, NetworkProposalStatus.APPROVED, start=1))
+            self.assertEqual(0, mock_get_header.call_count)
+
+            # proposals of the type in VOTING are looked up only
+            mock_get_header.reset_mock()
+            self.assertEqual(expected_ids([i for i in voting if i % 3 == 0]),
+                             get_ids(NetworkProposalType.REVISION, NetworkProposalStatus.VOTING))
+            self.assertEqual(len([i for i in range(30) if i % 3 == 0 and i != 3]), mock_get_header.call_count)
+
+        # up to MAX_SKIPPED_PROPOSALS_SIZE proposals not matching are looked up in a call
+        with patch('governance.network_proposal.MAX_SKIPPED_PROPOSALS_SIZE', 3):
+            self.assertEqual(expected_ids([28, 26]), get_ids(status=NetworkProposalStatus.VOTING))
+            self.assertEqual([], get_ids(status=NetworkProposalStatus.VOTING, start=3))
+
+            result = self.network_proposal.get_proposals_by_cursor(50, None, NetworkProposalStatus.VOTING, None, 4)
+            self.assertEqual(expected_ids([28, 26]), [proposal["id"] for proposal in result["proposals"]])
+            self.assertEqual((True, hex(25)), (result["hasMore"], result["next"]))
+            # expired proposals in VOTING are counted as DISAPPROVED
+            self.assertEqual(hex(len(voting)), result["total"])
+            result = self.network_proposal.get_proposals_by_cursor(50, None, NetworkProposalStatus.VOTING, 25, 4)
+            self.assertEqual(expected_ids([24, 22, 20]), [proposal["id"] for proposal in result["proposals"]])
+            self.assertEqual((True, hex(19)), (result["hasMore"], result["next"]))
+
+    @patch_several(PATCHER_JSON_LOADS, PATCHER_JSON_DUMPS)
+    def test_get_proposals_by_cursor(self):
+        voter = self._generate_vote(2, 10, 3, 20, 100)
+        proposal_infos = []
+
+        def put_proposals(count: int):
+            for i in range(len(proposal_infos), len(proposal_infos) + count):
+                type_ = NetworkProposalType.REVISION if i % 3 == 0 else NetworkProposalType.TEXT
+                proposal_info, _ = self._generate_proposal_info(NetworkProposalStatus.VOTING, voter, type_)
+                proposal_info.end_block_height = 100
+                self._put_proposal_info(proposal_info)
+                proposal_infos.append(proposal_info)
+
+        def get_page(type_: int = None, cursor: int = None, size: int = 4) -> (list, dict):
+            result = self.network_proposal.get_proposals_by_cursor(50, type_, None, cursor, size)
+            ids = [proposal["id"] for proposal in result.pop("proposals")]
+            return [['0x' + bytes.hex(proposal_info.id) for proposal_info in proposal_infos].index(id) for id in ids], \
+                result
+
+        self.assertEqual(([], {"total": "0x0", "hasMore": False}), get_page())
+
+        put_proposals(10)
+        self.assertEqual(([9, 8, 7, 6], {"total": "0xa", "hasMore": True, "next": "0x6"}), get_page())
+
+        # new proposals do not shift the next page
+        put_proposals(3)
+        self.assertEqual(([5, 4, 3, 2], {"total": "0xd", "hasMore": True, "next": "0x2"}), get_page(cursor=6))
+        self.assertEqual(([1, 0], {"total": "0xd", "hasMore": False}), get_page(cursor=2))
+        self.assertEqual(([3, 2, 1, 0], {"total": "0xd", "hasMore": False}), get_page(cursor=4, size=100))
+
+        # filtered pages
+        self.assertEqual(([12, 9, 6], {"total": "0x5", "hasMore": True, "next": "0x6"}),
+                         get_page(NetworkProposalType.REVISION, size=3))
+        self.assertEqual(([3, 0], {"total": "0x5", "hasMore": False}),
+                         get_page(NetworkProposalType.REVISION, cursor=6, size=3))
+
+        self.assertRaises(IconScoreException, get_page, cursor=14)
+        self.assertRaises(IconScoreException, get_page, cursor=-1)
+        self.assertRaises(IconScoreException, get_page, size=0)
 
-        class TmpArrayDB():
-            def __init__(self):
-                self.id = []
+    @patch_several(PATCHER_JSON_LOADS, PATCHER_JSON_DUMPS)
+    def test_max_page_size(self):
+        voter = self._generate_vote(2, 10, 3, 20, 100)
+        for _ in range(MAX_GET_PROPOSALS_PAGE_SIZE + 10):
+            proposal_info, _ = self._generate_proposal_info(NetworkProposalStatus.VOTING, voter)
+            proposal_info.end_block_height = 100
+            self._put_proposal_info(proposal_info)
 
-            def put(self, _id):
-                self.id.append(_id)
-                return self.id
+        def get_page_size(size: int) -> int:
+            return len(self.network_proposal.get_proposals_by_cursor(50, None, None, None, size)["proposals"])
 
-            def __str__(self):
-                return self.id
+        self.assertEqual(MAX_GET_PROPOSALS_PAGE_SIZE, self.network_proposal.get_max_page_size())
+        self.assertEqual(MAX_GET_PROPOSALS_PAGE_SIZE, get_page_size(100))
 
-        attrs = {'return_value': TmpArrayDB()}
-        self.network_proposal._proposal_list_keys = Mock()
-        self.network_proposal._proposal_list_keys.configure_mock(**attrs)
+        self.network_proposal.set_max_page_size(5)
+        self.assertEqual(5, self.network_proposal.get_max_page_size())
+        self.assertEqual(5, get_page_size(100))
+        self.assertEqual(3, get_page_size(3))
+        self.assertEqual(5, len(self.network_proposal.get_proposals_since(50, 0, None, 100)["proposals"]))
 
+        self.network_proposal.set_max_page_size(MAX_GET_PROPOSALS_PAGE_SIZE + 5)
+        self.assertEqual(MAX_GET_PROPOSALS_PAGE_SIZE + 5, get_page_size(100))
+
+        self.network_proposal.set_max_page_size(MAX_PROPOSALS_PAGE_SIZE_LIMIT)
+        self.assertEqual(MAX_PROPOSALS_PAGE_SIZE_LIMIT, self.network_proposal.get_max_page_size())
+
+        self.assertRaises(IconScoreException, self.network_proposal.set_max_page_size, 0)
+        self.assertRaises(IconScoreException, self.network_proposal.set_max_page_size, -1)
+        self.assertRaises(IconScoreException, self.network_proposal.set_max_page_size,
+                          MAX_PROPOSALS_PAGE_SIZE_LIMIT + 1)
+        self.assertEqual(MAX_PROPOSALS_PAGE_SIZE_LIMIT, self.network_proposal.get_max_page_size())
+
+    @patch_several(PATCHER_JSON_LOADS, PATCHER_JSON_DUMPS)
+    def test_get_proposals_by_proposer(self):
+        voter = self._generate_vote(0, 0, 0, 0, DEFAULT_DELEGATED * COUNT_OF_MAIN_PREPS)
+        proposer = create_address()
+        types = [NetworkProposalType.TEXT, NetworkProposalType.STEP_PRICE, NetworkProposalType.TEXT,
+                 NetworkProposalType.TEXT, NetworkProposalType.TEXT, NetworkProposalType.STEP_PRICE]
+        proposal_infos = []
+        for i, type_ in enumerate(types):
+            proposal_info, _ = self._generate_proposal_info(NetworkProposalStatus.VOTING, deepcopy(voter), type_)
+            if i % 3 != 1:
+                proposal_info.proposer = proposer
+            self._put_proposal_info(proposal_info)
+            proposal_infos.append(proposal_info)
+        self._set_status(proposal_infos[3].id, NetworkProposalStatus.APPROVED)
+
+        def get_ids(result: dict) -> list:
+            return [bytes.fromhex(proposal["id"][2:]) for proposal in result["proposals"]]
+
+        # proposals of the proposer are 0, 2, 3 and 5
+        current_block_height = proposal_infos[0].end_block_height - 1
+        result = self.network_proposal.get_proposals_by_proposer(current_block_height, proposer)
+        self.assertEqual([proposal_infos[i].id for i in (5, 3, 2, 0)], get_ids(result))
+        self.assertEqual("0x4", result["total"])
+        self.assertFalse(result["hasMore"])
+
+        result = self.network_proposal.get_proposals_by_proposer(current_block_height, proposer, size=2)
+        self.assertEqual([proposal_infos[i].id for i in (5, 3)], get_ids(result))
+        self.assertEqual("0x3", result["next"])
+        result = self.network_proposal.get_proposals_by_proposer(current_block_height, proposer,
+                                                                 cursor=int(result["next"], 16), size=2)
+        self.assertEqual([proposal_infos[i].id for i in (2, 0)], get_ids(result))
+        self.assertFalse(result["hasMore"])
+
+        result = self.network_proposal.get_proposals_by_proposer(current_block_height, proposer,
+                                                                 type=NetworkProposalType.TEXT,
+                                                                 status=NetworkProposalStatus.VOTING)
+        self.assertEqual([proposal_infos[i].id for i in (2, 0)], get_ids(result))
+        self.assertEqual("0x2", result["total"])
+        result = self.network_proposal.get_proposals_by_proposer(current_block_height, proposer,
+                                                                 type=NetworkProposalType.TEXT)
+        self.assertEqual("0x3", result["total"])
+        result = self.network_proposal.get_proposals_by_proposer(proposal_infos[0].end_block_height + 1, proposer,
+                                                                 status=NetworkProposalStatus.DISAPPROVED)
+        self.assertEqual([proposal_infos[i].id for i in (5, 2, 0)], get_ids(result))
+        self.assertEqual("0x3", result["total"])
+
+        result = self.network_proposal.get_proposals_by_proposer(current_block_height, create_address())
+        self.assertEqual({"proposals": [], "total": "0x0", "hasMore": False}, result)
+
+        self.assertRaises(IconScoreException, self.network_proposal.get_proposals_by_proposer,
+                          current_block_height, proposer, cursor=7)
+        self.assertRaises(IconScoreException, self.network_proposal.get_proposals_by_proposer,
+                          current_block_height, proposer, type=100)
+
+    @patch_several(PATCHER_JSON_LOADS, PATCHER_JSON_DUMPS)
+    def test_finalize_expired_proposals(self):
+        voter = self._generate_vote(0, 0, 0, 0, DEFAULT_DELEGATED * COUNT_OF_MAIN_PREPS)
+        end_block_heights = [30, 10, 20, 10, 40, 20, 50]
+        proposal_infos = []
+        for end_block_height in end_block_heights:
+            proposal_info, _ = self._generate_proposal_info(NetworkProposalStatus.VOTING, deepcopy(voter))
+            proposal_info.end_block_height = end_block_height
+            self._put_proposal_info(proposal_info)
+            proposal_infos.append(proposal_info)
+        self._set_status(proposal_infos[2].id, NetworkProposalStatus.APPROVED)
+        self._set_status(proposal_infos[3].id, NetworkProposalStatus.CANCELED)
+
+        def get_statuses() -> list:
+            return [ProposalTally.from_bytes(self.network_proposal._proposal_tally[proposal_info.id]).status
+                    for proposal_info in proposal_infos]
+
+        VOTING, APPROVED, DISAPPROVED, CANCELED = (NetworkProposalStatus.VOTING, NetworkProposalStatus.APPROVED,
+                                                   NetworkProposalStatus.DISAPPROVED, NetworkProposalStatus.CANCELED)
+
+        # nothing has expired
+        self.assertEqual(0, self.network_proposal.finalize_expired_proposals(10, 10))
+        self.assertEqual(0, self.network_proposal._expiry_head.get())
+
+        # visits entries of end block height 10, 10 and 20 in order and skips the canceled one
+        self.assertEqual(1, self.network_proposal.finalize_expired_proposals(31, 3))
+        self.assertEqual([VOTING, DISAPPROVED, APPROVED, CANCELED, VOTING, VOTING, VOTING], get_statuses())
+        self.assertEqual(3, self.network_proposal._expiry_head.get())
+
+        self.assertEqual(2, self.network_proposal.finalize_expired_proposals(31, 10))
+        self.assertEqual([DISAPPROVED, DISAPPROVED, APPROVED, CANCELED, VOTING, DISAPPROVED, VOTING], get_statuses())
+        self.assertEqual(5, self.network_proposal._expiry_head.get())
+        self.assertEqual(0, self.network_proposal.finalize_expired_proposals(31, 10))
+
+        # a new proposal is queued after the finalized ones
+        proposal_info, _ = self._generate_proposal_info(NetworkProposalStatus.VOTING, deepcopy(voter))
+        proposal_info.end_block_height = 45
+        self._put_proposal_info(proposal_info)
+        proposal_infos.append(proposal_info)
+        self.assertEqual(3, self.network_proposal.finalize_expired_proposals(100, 10))
+        self.assertEqual([DISAPPROVED, DISAPPROVED, APPROVED, CANCELED, DISAPPROVED, DISAPPROVED, DISAPPROVED,
+                          DISAPPROVED], get_statuses())
+        self.assertEqual(8, self.network_proposal._expiry_head.get())
+
+        # status indexes follow the finalized status
+        self.assertEqual([], list(self.network_proposal._status_index[VOTING].iter_reversed()))
+        self.assertEqual([7, 6, 5, 4, 1, 0], list(self.network_proposal._status_index[DISAPPROVED].iter_reversed()))
+        result = self.network_proposal.get_proposals(0, status=DISAPPROVED)
+        self.assertEqual(6, len(result["proposals"]))
+
+    @patch_several(PATCHER_JSON_LOADS, PATCHER_JSON_DUMPS)
+    def test_archive_proposals(self):
+        end_block_heights = [30, 10, 20, 40]
+        statuses = [NetworkProposalStatus.VOTING, NetworkProposalStatus.APPROVED, NetworkProposalStatus.VOTING,
+                    NetworkProposalStatus.VOTING]
+        proposal_infos = []
+        for end_block_height, status in zip(end_block_heights, statuses):
+            voter = self._generate_vote(2, 10, 3, 20, 100)
+            proposal_info, _ = self._generate_proposal_info(status, voter)
+            proposal_info.end_block_height = end_block_height
+            self._put_proposal_info(proposal_info)
+            proposal_infos.append(proposal_info)
+        self.network_proposal.cancel_proposal(proposal_infos[2].id, proposal_infos[2].proposer, 15)
+        # name and delegation of the voter differ from the ones in the P-Rep snapshot
+        voter_address = Address.from_string(proposal_infos[0].vote["noVote"]["list"][0])
+        self.network_proposal.vote_proposal(proposal_infos[0].id, Prep(voter_address, 7),
+                                            NetworkProposalVote.DISAGREE, 25, create_tx_hash(), 25)
+
+        current_block_height = 35
+        expected = [self.network_proposal.get_proposal(proposal_info.id, current_block_height)
+                    for proposal_info in proposal_infos]
+        live_sizes = [sum(len(vote) for vote in self.network_proposal._proposal_votes[proposal_info.id].values()) +
+                      len(self.network_proposal._proposal_thresholds[proposal_info.id])
+                      for proposal_info in proposal_infos]
+
+        # only finalized proposals are archived
+        self.assertEqual(0, self.network_proposal.archive_proposals(10))
+        self.network_proposal.finalize_expired_proposals(current_block_height, 2)
+        self.assertEqual(2, self.network_proposal.archive_proposals(10))
+        self.network_proposal.finalize_expired_proposals(current_block_height, 10)
+        self.assertEqual(1, self.network_proposal.archive_proposals(1))
+        self.assertEqual(0, self.network_proposal.archive_proposals(10))
+        self.assertEqual(3, self.network_proposal._archive_head.get())
+
+        for proposal_info, result, live_size in zip(proposal_infos, expected, live_sizes):
+            self.assertEqual(result, self.network_proposal.get_proposal(proposal_info.id, current_block_height))
+            archived = proposal_info.end_block_height < current_block_height
+            archived_votes = self.network_proposal._proposal_archive[proposal_info.id]
+            self.assertEqual(archived, archived_votes is not None)
+            self.assertEqual(archived, len(self.network_proposal._proposal_votes[proposal_info.id]) == 0)
+            self.assertEqual(archived, self.network_proposal._proposal_thresholds[proposal_info.id] is None)
+            self.assertIsNotNone(self.network_proposal._proposal_prep_snapshot[proposal_info.id])
+            if archived:
+                # the archive is smaller than the votes and the thresholds removed
+                self.assertLess(len(archived_votes), live_size)
+
+        # archived proposals are rendered from the archive without their removed votes
+        with patch.object(self.network_proposal, '_get_votes', side_effect=AssertionError):
+            for proposal_info, result in zip(proposal_infos[:3], expected):
+                self.assertEqual(result, self.network_proposal.get_proposal(proposal_info.id, current_block_height))
+            ids = [proposal_info.id for proposal_info in proposal_infos[:3]]
+            result = self.network_proposal.get_proposals_by_ids(ids, current_block_height)
+            self.assertEqual(expected[:3], result["proposals"])
+
+        # archived proposals are rendered once for the same records
+        with patch('governance.network_proposal.ProposalArchive.from_bytes', side_effect=AssertionError):
+            for proposal_info, result in zip(proposal_infos[:3], expected):
+                self.assertEqual(result, self.network_proposal.get_proposal(proposal_info.id, current_block_height))
+        self.assertEqual(3, len(self.network_proposal._rendered_archives))
+
+        # up to MAX_RENDERED_ARCHIVES_SIZE results are kept
+        with patch('governance.network_proposal.MAX_RENDERED_ARCHIVES_SIZE', 2):
+            self.network_proposal._rendered_archives = {}
+            for proposal_info, result in zip(proposal_infos[:3], expected):
+                self.assertEqual(result, self.network_proposal.get_proposal(proposal_info.id, current_block_height))
+            self.assertEqual(1, len(self.network_proposal._rendered_archives))
+
+        # lists are read from the header and the tally kept for them
+        result = self.network_proposal.get_proposals(current_block_height)
+        self.assertEqual([hex(status) for status in (NetworkProposalStatus.VOTING, NetworkProposalStatus.CANCELED,
+                                                     NetworkProposalStatus.APPROVED,
+                                                     NetworkProposalStatus.DISAPPROVED)],
+                         [proposal["status"] for proposal in result["proposals"]])
+
+    @patch_several(PATCHER_JSON_LOADS, PATCHER_JSON_DUMPS)
+    def test_get_proposals_since(self):
+        proposal_infos = []
+        for start_block_height in (1, 2, 3):
+            voter = self._generate_vote(0, 0, 0, 0, 100, 4)
+            proposal_info, _ = self._generate_proposal_info(NetworkProposalStatus.VOTING, voter)
+            proposal_info.start_block_height = start_block_height
+            proposal_info.end_block_height = 20
+            self._put_proposal_info(proposal_info)
+            proposal_infos.append(proposal_info)
+
+        def vote(proposal_info: 'ProposalInfo', voter_index: int, block_height: int):
+            address = Address.from_string(proposal_info.vote["noVote"]["list"][voter_index])
+            self.network_proposal.vote_proposal(proposal_info.id, Prep(address, 10), NetworkProposalVote.AGREE,
+                                                block_height, create_tx_hash(), 10)
+
+        vote(proposal_infos[2], 0, 5)
+        vote(proposal_infos[0], 0, 5)
+        vote(proposal_infos[2], 1, 5)
+        self.network_proposal.cancel_proposal(proposal_infos[1].id, proposal_infos[1].proposer, 7)
+        vote(proposal_infos[2], 2, 9)
+
+        def get_ids(result: dict) -> list:
+            return [bytes.fromhex(proposal["id"][2:]) for proposal in result["proposals"]]
+
+        current_block_height = 10
+        result = self.network_proposal.get_proposals_since(current_block_height, 0)
+        self.assertEqual([proposal_info.id for proposal_info in proposal_infos], get_ids(result))
+        self.assertFalse(result["hasMore"])
+
+        # changes in a block are ordered by proposal
+        result = self.network_proposal.get_proposals_since(current_block_height, 5)
+        self.assertEqual([proposal_infos[i].id for i in (0, 2, 1)], get_ids(result))
+        self.assertEqual(self.network_proposal.get_proposals_by_ids(get_ids(result), current_block_height, False),
+                         {"proposals": result["proposals"]})
+        result = self.network_proposal.get_proposals_since(current_block_height, 8)
+        self.assertEqual([proposal_infos[2].id], get_ids(result))
+        self.assertEqual({"proposals": [], "hasMore": False, "next": result["next"]},
+                         self.network_proposal.get_proposals_since(current_block_height, 10))
+
+        # pages by cursor
+        result = self.network_proposal.get_proposals_since(current_block_height, 5, size=2)
+        self.assertEqual([proposal_infos[i].id for i in (0, 2)], get_ids(result))
+        self.assertTrue(result["hasMore"])
+        result = self.network_proposal.get_proposals_since(current_block_height, 0, int(result["next"], 16), 2)
+        self.assertEqual([proposal_infos[i].id for i in (1, 2)], get_ids(result))
+        self.assertFalse(result["hasMore"])
+        next_cursor = int(result["next"], 16)
+
+        # expiry is logged when it is finalized
+        self.assertEqual([], self.network_proposal.get_proposals_since(30, 0, next_cursor)["proposals"])
+        self.network_proposal.finalize_expired_proposals(30, 10)
+        result = self.network_proposal.get_proposals_since(30, 0, next_cursor)
+        self.assertEqual([proposal_infos[i].id for i in (0, 2)], get_ids(result))
+        self.assertEqual([hex(NetworkProposalStatus.DISAPPROVED)] * 2,
+                         [proposal["status"] for proposal in result["proposals"]])
+
+        self.assertRaises(IconScoreException, self.network_proposal.get_proposals_since, 30, -1)
+        self.assertRaises(IconScoreException, self.network_proposal.get_proposals_since, 30, 0, 100)
+        self.assertRaises(IconScoreException, self.network_proposal.get_proposals_since, 30, 0, None, 0)
+
+    @patch_several(PATCHER_JSON_LOADS, PATCHER_JSON_DUMPS)
+    def test_get_votes_by_prep(self):
+        voter = self._generate_vote(2, 10, 1, 10, 100)
+        address = Address.from_string(voter["agree"]["list"][1]["address"])
+        address_of_other_voter = Address.from_string(voter["disagree"]["list"][0]["address"])
+        migrated_proposal_info, _ = self._generate_proposal_info(NetworkProposalStatus.VOTING, voter)
+        self._put_proposal_info(migrated_proposal_info)
+
+        proposal_infos = []
+        for _ in range(3):
+            voter = self._generate_vote(0, 0, 0, 0, 100)
+            voter["noVote"]["list"][0] = str(address)
+            proposal_info, _ = self._generate_proposal_info(NetworkProposalStatus.VOTING, voter)
+            self._put_proposal_info(proposal_info)
+            proposal_infos.append(proposal_info)
+        for block_height, (proposal_info, vote_type) in enumerate(((proposal_infos[2], NetworkProposalVote.DISAGREE),
+                                                                   (proposal_infos[0], NetworkProposalVote.AGREE))):
+            self.network_proposal.vote_proposal(proposal_info.id, Prep(address, 10), vote_type, block_height + 5,
+                                                create_tx_hash(), 10)
+
+        expected = [
+            {"id": '0x' + bytes.hex(proposal_infos[0].id), "vote": hex(NetworkProposalVote.AGREE), "blockHeight": "0x6"},
+            {"id": '0x' + bytes.hex(proposal_infos[2].id), "vote": hex(NetworkProposalVote.DISAGREE),
+             "blockHeight": "0x5"},
+            {"id": '0x' + bytes.hex(migrated_proposal_info.id), "vote": hex(NetworkProposalVote.AGREE),
+             "blockHeight": "0x0"}
+        ]
+        result = self.network_proposal.get_votes_by_prep(address)
+        self.assertEqual({"votes": expected, "total": "0x3", "hasMore": False}, result)
+
+        result = self.network_proposal.get_votes_by_prep(address, size=2)
+        self.assertEqual({"votes": expected[:2], "total": "0x3", "hasMore": True, "next": "0x1"}, result)
+        result = self.network_proposal.get_votes_by_prep(address, int(result["next"], 16), 2)
+        self.assertEqual({"votes": expected[2:], "total": "0x3", "hasMore": False}, result)
+
+        # votes of the others are not included
+        self.assertEqual({"votes": [], "total": "0x0", "hasMore": False},
+                         self.network_proposal.get_votes_by_prep(create_address()))
+        result = self.network_proposal.get_votes_by_prep(address_of_other_voter)
+        self.assertEqual([hex(NetworkProposalVote.DISAGREE)], [vote["vote"] for vote in result["votes"]])
+
+        self.assertRaises(IconScoreException, self.network_proposal.get_votes_by_prep, address, 4)
+        self.assertRaises(IconScoreException, self.network_proposal.get_votes_by_prep, address, -1)
+        self.assertRaises(IconScoreException, self.network_proposal.get_votes_by_prep, address, None, 0)
+
+    @patch_several(PATCHER_JSON_LOADS, PATCHER_JSON_DUMPS)
+    def test_get_proposal_stats(self):
+        voter = self._generate_vote(0, 0, 0, 0, DEFAULT_DELEGATED * COUNT_OF_MAIN_PREPS)
+        types = [NetworkProposalType.TEXT, NetworkProposalType.STEP_PRICE, NetworkProposalType.TEXT,
+                 NetworkProposalType.MALICIOUS_SCORE, NetworkProposalType.STEP_PRICE, NetworkProposalType.TEXT]
+        end_block_heights = [30, 10, 20, 10, 40, 20]
+        proposal_infos = []
+        for type_, end_block_height in zip(types, end_block_heights):
+            proposal_info, _ = self._generate_proposal_info(NetworkProposalStatus.VOTING, deepcopy(voter), type_)
+            proposal_info.end_block_height = end_block_height
+            self._put_proposal_info(proposal_info)
+            proposal_infos.append(proposal_info)
+        self._set_status(proposal_infos[2].id, NetworkProposalStatus.APPROVED)
+        self._set_status(proposal_infos[3].id, NetworkProposalStatus.CANCELED)
+        self._set_status(proposal_infos[4].id, NetworkProposalStatus.APPROVED)
+
+        def get_expected_stats(current_block_height: int) -> dict:
+            by_type = {
+                hex(type_): {hex(status): 0 for status in range(NetworkProposalStatus.MIN,
+                                                                NetworkProposalStatus.MAX + 1)}
+                for type_ in range(NetworkProposalType.MIN, NetworkProposalType.MAX + 1)
+            }
+            for proposal_info in proposal_infos:
+                result = self.network_proposal.get_proposal(proposal_info.id, current_block_height)
+                by_type[result["contents"]["type"]][result["status"]] += 1
+            return {
+                "total": hex(len(proposal_infos)),
+                "byStatus": {
+                    hex(status): hex(sum(counts[hex(status)] for counts in by_type.values()))
+                    for status in range(NetworkProposalStatus.MIN, NetworkProposalStatus.MAX + 1)
+                },
+                "byType": {
+                    type_: {status: hex(count) for status, count in counts.items()}
+                    for type_, counts in by_type.items()
+                },
+                "approximate": False
+            }
+
+        self.network_proposal._check_registered_proposal = Mock(return_value=True)
+        for current_block_height in (5, 15, 25, 100):
+            self.assertEqual(get_expected_stats(current_block_height),
+                             self.network_proposal.get_proposal_stats(current_block_height))
+        stats = self.network_proposal.get_proposal_stats(25)
+        self.assertEqual({"0x0": "0x1", "0x1": "0x1", "0x2": "0x1", "0x3": "0x0"},
+                         stats["byType"][hex(NetworkProposalType.TEXT)])
+        self.assertEqual({"0x0": "0x1", "0x1": "0x2", "0x2": "0x2", "0x3": "0x1"}, stats["byStatus"])
+
+        # the counts are the same after the expired proposals are finalized
+        self.network_proposal.finalize_expired_proposals(25, 2)
+        self.assertEqual(stats, self.network_proposal.get_proposal_stats(25))
+        self.network_proposal.finalize_expired_proposals(25, 10)
+        self.assertEqual(stats, self.network_proposal.get_proposal_stats(25))
+
+    def test_get_proposal_stats_bounded(self):
+        voter = self._generate_vote(0, 0, 0, 0, DEFAULT_DELEGATED * COUNT_OF_MAIN_PREPS)
+        for end_block_height in (10, 20, 30):
+            proposal_info, _ = self._generate_proposal_info(NetworkProposalStatus.VOTING, deepcopy(voter),
+                                                            NetworkProposalType.TEXT)
+            proposal_info.end_block_height = end_block_height
+            self._put_proposal_info(proposal_info)
+
+        def get_counts(current_block_height: int) -> (str, str, bool):
+            stats = self.network_proposal.get_proposal_stats(current_block_height)
+            by_status = stats["byStatus"]
+            return by_status[hex(NetworkProposalStatus.VOTING)], by_status[hex(NetworkProposalStatus.DISAPPROVED)], \
+                stats["approximate"]
+
+        with patch('governance.network_proposal.MAX_FINALIZE_EXPIRED_SIZE', 2):
+            # only the expired proposals within the bound are counted as DISAPPROVED
+            self.assertEqual(("0x1", "0x2", True), get_counts(100))
+            self.assertEqual(("0x1", "0x2", False), get_counts(25))
+            self.assertEqual(("0x2", "0x1", False), get_counts(15))
+
+            self.network_proposal.finalize_expired_proposals(100, 1)
+            self.assertEqual(("0x0", "0x3", False), get_counts(100))
+
+    @patch_several(PATCHER_JSON_LOADS, PATCHER_JSON_DUMPS, PATCHER_NP_ARRAY_DB, PATCHER_NP_DICT_DB)
+    def test_register_proposal(self):
         voter = self._generate_vote(0, 0, 0, 0, DEFAULT_DELEGATED * COUNT_OF_MAIN_PREPS)
         for i in range(5):
             proposal_info, _ = self._generate_proposal_info(NetworkProposalStatus.VOTING, voter)
@@ -555,243 +1532,212 @@ class TestUnitNetworkProposal(unittest.TestCase):
                                                     proposal_info.type, proposal_info.value,
                                                     main_preps)
             self.assertEqual(i + 1, len(self.network_proposal._proposal_list))
-            self.assertEqual(self.network_proposal._proposal_list[proposal_info.id], proposal_info.to_bytes())
+            self.assertEqual(self.network_proposal._proposal_list[proposal_info.id], proposal_info.header_to_bytes())
+            self.assertEqual(self.network_proposal._proposal_tally[proposal_info.id],
+                             ProposalTally.from_proposal_info(proposal_info).to_bytes())
+            self.assertEqual(self.network_proposal._proposal_thresholds[proposal_info.id],
+                             ProposalThresholds(15, 146, 8, 73).to_bytes())
+            self.assertEqual(i, self.network_proposal._proposal_seq[proposal_info.id])
+            self.assertEqual(i + 1, self.network_proposal._proposal_prep_snapshot[proposal_info.id])
+            self.assertEqual(PRepSnapshot.from_main_preps(main_preps).to_bytes(),
+                             self.network_proposal._prep_snapshots[i + 1])
+            self.assertEqual({main_prep.address: True for main_prep in main_preps},
+                             self.network_proposal._prep_snapshot_members[i + 1])
+            self.assertEqual(list(range(i + 1)),
+                             list(self.network_proposal._status_index[NetworkProposalStatus.VOTING]._array))
+
+        # proposals registered by the same main P-Reps share the snapshot
+        proposal_info, _ = self._generate_proposal_info(NetworkProposalStatus.VOTING, voter)
+        self.network_proposal.register_proposal(proposal_info.id, main_preps[0].address,
+                                                proposal_info.start_block_height, proposal_info.end_block_height,
+                                                proposal_info.title, proposal_info.description,
+                                                proposal_info.type, proposal_info.value,
+                                                main_preps)
+        self.assertEqual(5, self.network_proposal._proposal_prep_snapshot[proposal_info.id])
+        self.assertEqual(5, self.network_proposal._prep_snapshot_count.get())
+        self.assertEqual(5, len(self.network_proposal._prep_snapshots))
+
+    @patch_several(PATCHER_JSON_LOADS, PATCHER_JSON_DUMPS)
+    def test_header_read_once_per_request(self):
+        voter = self._generate_vote(0, 0, 0, 0, DEFAULT_DELEGATED * COUNT_OF_MAIN_PREPS)
+        proposal_info, _ = self._generate_proposal_info(NetworkProposalStatus.VOTING, voter)
+        self._put_proposal_info(proposal_info)
+        current_block_height = proposal_info.end_block_height - 1
+
+        reads = []
+
+        class CountingDictDB(dict):
+            def __getitem__(self, key):
+                reads.append(key)
+                return super().__getitem__(key)
+
+        self.network_proposal._proposal_list = CountingDictDB(self.network_proposal._proposal_list)
+        with patch('governance.network_proposal.ProposalInfo.from_bytes', side_effect=ProposalInfo.from_bytes) \
+                as from_bytes:
+            main_preps = [Prep(Address.from_string(address), DEFAULT_DELEGATED)
+                          for address in voter["noVote"]["list"]]
+            self.network_proposal.vote_proposal(proposal_info.id, main_preps[0], NetworkProposalVote.AGREE,
+                                                current_block_height, create_tx_hash(), 10)
+            self.assertEqual([proposal_info.id], reads)
+            self.assertEqual(1, from_bytes.call_count)
+
+            # cache is not shared with the next request
+            self.network_proposal.cancel_proposal(proposal_info.id, proposal_info.proposer, current_block_height)
+            self.assertEqual([proposal_info.id] * 2, reads)
+            self.assertEqual(2, from_bytes.call_count)
+
+            self.network_proposal.get_proposal(proposal_info.id, current_block_height)
+            self.assertEqual([proposal_info.id] * 3, reads)
+            self.assertEqual(3, from_bytes.call_count)
 
     @patch_several(PATCHER_JSON_LOADS, PATCHER_JSON_DUMPS, PATCHER_CHECK_REGISTERED_PROPOSAL)
     def test_cancel_proposal(self):
         voter = self._generate_vote(1, DEFAULT_DELEGATED, 2, DEFAULT_DELEGATED, 100)
-        proposal_info, self.network_proposal._proposal_list[proposal_info.id] = self._generate_proposal_info(
-            NetworkProposalStatus.VOTING, voter)
+        proposal_info, _ = self._generate_proposal_info(NetworkProposalStatus.VOTING, voter)
+        self._put_proposal_info(proposal_info)
         current_block_height = proposal_info.end_block_height - 1
 
         # case(1): raise revert when not check registered proposal
-        with patch.object(ProposalInfo, 'from_bytes', return_value=proposal_info):
-            self.assertRaisesRegex(IconScoreException, "No registered proposal", self.network_proposal.cancel_proposal,
-                                   proposal_info.id, proposal_info.proposer, current_block_height)
+        self.assertRaisesRegex(IconScoreException, "No registered proposal", self.network_proposal.cancel_proposal,
+                               proposal_info.id, proposal_info.proposer, current_block_height)
 
         # case(2): raise revert when end block height < current block height
         current_block_height = proposal_info.end_block_height + 1
         self.network_proposal._check_registered_proposal.return_value = True
-        with patch.object(ProposalInfo, 'from_bytes', return_value=proposal_info):
-            self.assertRaisesRegex(IconScoreException, "This proposal has already expired",
-                                   self.network_proposal.cancel_proposal,
-                                   proposal_info.id, proposal_info.proposer, current_block_height)
+        self.assertRaisesRegex(IconScoreException, "This proposal has already expired",
+                               self.network_proposal.cancel_proposal,
+                               proposal_info.id, proposal_info.proposer, current_block_height)
 
         # case(3): raise revert when proposer is not the proposer who registered the proposal
         current_block_height = proposal_info.end_block_height - 1
-        with patch.object(ProposalInfo, 'from_bytes', return_value=proposal_info):
-            self.assertRaisesRegex(IconScoreException, "No permission - only for proposer",
-                                   self.network_proposal.cancel_proposal,
-                                   proposal_info.id, create_address(), current_block_height)
+        self.assertRaisesRegex(IconScoreException, "No permission - only for proposer",
+                               self.network_proposal.cancel_proposal,
+                               proposal_info.id, create_address(), current_block_height)
 
         # case(4): raise revert when status is not VOTING
-        proposal_info.status = NetworkProposalStatus.APPROVED
-        with patch.object(ProposalInfo, 'from_bytes', return_value=proposal_info):
-            self.assertRaisesRegex(IconScoreException, "Can not be canceled - only voting proposal",
-                                   self.network_proposal.cancel_proposal,
-                                   proposal_info.id, proposal_info.proposer, current_block_height)
-
-        # confirmed the correct proposal status is CANCELED
-        proposal_info.status = NetworkProposalStatus.VOTING
-        proposal_info.proposer = proposal_info.proposer
-        with patch.object(ProposalInfo, 'from_bytes', return_value=proposal_info):
-            id = proposal_info.id
-            self.network_proposal.cancel_proposal(proposal_info.id, proposal_info.proposer, current_block_height)
-            proposal_info.status = NetworkProposalStatus.CANCELED
-            self.assertEqual(proposal_info, ProposalInfo.from_bytes(self.network_proposal._proposal_list[id]))
+        self._set_status(proposal_info.id, NetworkProposalStatus.APPROVED)
+        self.assertRaisesRegex(IconScoreException, "Can not be canceled - only voting proposal",
+                               self.network_proposal.cancel_proposal,
+                               proposal_info.id, proposal_info.proposer, current_block_height)
+
+        # confirmed the correct proposal status is CANCELED and others are not changed
+        self._set_status(proposal_info.id, NetworkProposalStatus.VOTING)
+        self.network_proposal.cancel_proposal(proposal_info.id, proposal_info.proposer, current_block_height)
+        proposal_info.status = NetworkProposalStatus.CANCELED
+        self.assertEqual(vars(proposal_info), vars(self._get_proposal_info(proposal_info.id)))
 
     @patch_several(PATCHER_JSON_LOADS, PATCHER_JSON_DUMPS, PATCHER_CHECK_VOTE_RESULT, PATCHER_CHECK_REGISTERED_PROPOSAL)
     def test_vote_proposal(self):
         voter = self._generate_vote(3, DEFAULT_DELEGATED, 2, DEFAULT_DELEGATED,
                                     DEFAULT_DELEGATED * COUNT_OF_MAIN_PREPS)
-        address_of_voter_agreeing = voter["agree"]["list"][0]["address"]
-        address_of_voter_disagreeing = voter["disagree"]["list"][0]["address"]
-        proposal_info, self.network_proposal._proposal_list[proposal_info.id] = self._generate_proposal_info(
-            NetworkProposalStatus.VOTING, voter)
+        address_of_voter_agreeing = Address.from_string(voter["agree"]["list"][0]["address"])
+        address_of_voter_disagreeing = Address.from_string(voter["disagree"]["list"][0]["address"])
+        proposal_info, _ = self._generate_proposal_info(NetworkProposalStatus.VOTING, voter)
+        self._put_proposal_info(proposal_info)
         current_block_height = proposal_info.end_block_height - 1
 
         buf_timestamp = 10
         # case(1): raise revert when not check registered proposal
-        with patch.object(ProposalInfo, 'from_bytes', return_value=proposal_info):
-            self.assertRaisesRegex(IconScoreException, "No registered proposal", self.network_proposal.vote_proposal,
-                                   proposal_info.id, proposal_info.proposer, NetworkProposalVote.AGREE,
-                                   current_block_height, create_tx_hash(), buf_timestamp, [])
+        self.assertRaisesRegex(IconScoreException, "No registered proposal", self.network_proposal.vote_proposal,
+                               proposal_info.id, Prep(proposal_info.proposer, 0), NetworkProposalVote.AGREE,
+                               current_block_height, create_tx_hash(), buf_timestamp)
 
         # case(2): raise revert when end block height < current block height
-        current_block_height = proposal_info.end_block_height + 1
         self.network_proposal._check_registered_proposal.return_value = True
-        with patch.object(ProposalInfo, 'from_bytes', return_value=proposal_info):
-            self.assertRaisesRegex(IconScoreException, "This proposal has already expired",
-                                   self.network_proposal.vote_proposal, proposal_info.id, proposal_info.proposer,
-                                   NetworkProposalVote.AGREE,
-                                   current_block_height, create_tx_hash(), buf_timestamp, [])
+        self.assertRaisesRegex(IconScoreException, "This proposal has already expired",
+                               self.network_proposal.vote_proposal, proposal_info.id, Prep(proposal_info.proposer, 0),
+                               NetworkProposalVote.AGREE,
+                               proposal_info.end_block_height + 1, create_tx_hash(), buf_timestamp)
 
         # case(3): raise revert status is CANCELED
-        current_block_height = proposal_info.end_block_height - 1
-        proposal_info.status = NetworkProposalStatus.CANCELED
-        with patch.object(ProposalInfo, 'from_bytes', return_value=proposal_info):
-            self.assertRaisesRegex(IconScoreException, "This proposal has already canceled",
-                                   self.network_proposal.vote_proposal, proposal_info.id, proposal_info.proposer,
-                                   NetworkProposalVote.AGREE,
-                                   current_block_height, create_tx_hash(), buf_timestamp, [])
-
-        # case(4): raise revert voter has already voted for agree
-        with patch.object(ProposalInfo, 'from_bytes', return_value=proposal_info):
-            proposal_info.status = NetworkProposalStatus.APPROVED
-            self.assertRaisesRegex(IconScoreException, "Already voted",
-                                   self.network_proposal.vote_proposal, proposal_info.id, address_of_voter_agreeing,
-                                   NetworkProposalVote.AGREE,
-                                   current_block_height, create_tx_hash(), buf_timestamp, [])
-            proposal_info.status = NetworkProposalStatus.DISAPPROVED
-            self.assertRaisesRegex(IconScoreException, "Already voted",
-                                   self.network_proposal.vote_proposal, proposal_info.id, address_of_voter_agreeing,
-                                   NetworkProposalVote.AGREE,
-                                   current_block_height, create_tx_hash(), buf_timestamp, [])
-            proposal_info.status = NetworkProposalStatus.VOTING
-            self.assertRaisesRegex(IconScoreException, "Already voted",
-                                   self.network_proposal.vote_proposal, proposal_info.id, address_of_voter_agreeing,
-                                   NetworkProposalVote.AGREE,
-                                   current_block_height, create_tx_hash(), buf_timestamp, [])
-
-        # case(5): raise revert voter has already voted for disagree
-        with patch.object(ProposalInfo, 'from_bytes', return_value=proposal_info):
-            proposal_info.status = NetworkProposalStatus.APPROVED
-            self.assertRaisesRegex(IconScoreException, "Already voted",
-                                   self.network_proposal.vote_proposal, proposal_info.id, address_of_voter_disagreeing,
-                                   NetworkProposalVote.DISAGREE,
-                                   current_block_height, create_tx_hash(), buf_timestamp, [])
-            proposal_info.status = NetworkProposalStatus.DISAPPROVED
-            self.assertRaisesRegex(IconScoreException, "Already voted",
-                                   self.network_proposal.vote_proposal, proposal_info.id, address_of_voter_disagreeing,
-                                   NetworkProposalVote.DISAGREE,
-                                   current_block_height, create_tx_hash(), buf_timestamp, [])
-            proposal_info.status = NetworkProposalStatus.VOTING
-            self.assertRaisesRegex(IconScoreException, "Already voted",
-                                   self.network_proposal.vote_proposal, proposal_info.id, address_of_voter_disagreeing,
-                                   NetworkProposalVote.DISAGREE,
-                                   current_block_height, create_tx_hash(), buf_timestamp, [])
-
-            # case: raise revert voter is not main P-Rep when registered this network proposal
-            self.assertRaisesRegex(IconScoreException,
-                                   "No permission - only for main prep when network proposal registered",
-                                   self.network_proposal.vote_proposal, proposal_info.id, "hx1234",
-                                   NetworkProposalVote.DISAGREE,
-                                   current_block_height, create_tx_hash(), buf_timestamp, [])
+        self._set_status(proposal_info.id, NetworkProposalStatus.CANCELED)
+        self.assertRaisesRegex(IconScoreException, "This proposal has already canceled",
+                               self.network_proposal.vote_proposal, proposal_info.id, Prep(proposal_info.proposer, 0),
+                               NetworkProposalVote.AGREE,
+                               current_block_height, create_tx_hash(), buf_timestamp)
+
+        # case(4): raise revert voter has already voted for agree or disagree
+        for address, vote_type in ((address_of_voter_agreeing, NetworkProposalVote.AGREE),
+                                   (address_of_voter_disagreeing, NetworkProposalVote.DISAGREE)):
+            for status in (NetworkProposalStatus.APPROVED, NetworkProposalStatus.DISAPPROVED,
+                           NetworkProposalStatus.VOTING):
+                self._set_status(proposal_info.id, status)
+                self.assertRaisesRegex(IconScoreException, "Already voted",
+                                       self.network_proposal.vote_proposal, proposal_info.id, Prep(address, 0),
+                                       vote_type, current_block_height, create_tx_hash(), buf_timestamp)
+
+        # case(5): raise revert voter is not main P-Rep when registered this network proposal
+        self.assertRaisesRegex(IconScoreException,
+                               "No permission - only for main prep when network proposal registered",
+                               self.network_proposal.vote_proposal, proposal_info.id, Prep(create_address(), 0),
+                               NetworkProposalVote.DISAGREE,
+                               current_block_height, create_tx_hash(), buf_timestamp)
 
         # case(6): when status is VOTING and check vote result is True and vote type is AGREE,
         # check status is APPROVED and return values is correct
-        buf_proposal_info = deepcopy(proposal_info)
-        with patch.object(ProposalInfo, 'from_bytes', return_value=deepcopy(buf_proposal_info)):
-            self.assertEqual(buf_proposal_info.status, NetworkProposalStatus.VOTING)
-            self.network_proposal._proposal_list[proposal_info.id] = create_tx_hash()
-            buf_voter_address = voter["noVote"]["list"][0]
-            buf_prep_of_voter_address = Prep(buf_voter_address, DEFAULT_DELEGATED * 2)
-            buf_id = create_tx_hash()
-            buf_voter_item_in_dict = self.network_proposal._generate_voter_in_dict(buf_id, buf_timestamp,
-                                                                                   buf_prep_of_voter_address)
-
-            voter_all_types = [voter_item["address"] for voter_item in
-                               voter["agree"]["list"] + voter["disagree"]["list"]]
-            voter_all_types += voter["noVote"]["list"]
-
-            main_preps = [Prep(address, DEFAULT_DELEGATED if address != buf_voter_address else DEFAULT_DELEGATED * 2)
-                          for address in voter_all_types]
-            approved, proposal_info_type, proposal_info_value = self.network_proposal.vote_proposal(proposal_info.id,
-                                                                                                    buf_voter_address,
-                                                                                                    NetworkProposalVote.AGREE,
-                                                                                                    current_block_height,
-                                                                                                    buf_id,
-                                                                                                    buf_timestamp,
-                                                                                                    main_preps)
-
-            buf_proposal_info.status = NetworkProposalStatus.APPROVED
-            buf_proposal_info.vote["agree"]["list"].append(buf_voter_item_in_dict)
-            buf_proposal_info.vote["agree"]["amount"] += DEFAULT_DELEGATED * 2
-            buf_proposal_info.vote["noVote"]["list"].remove(buf_voter_item_in_dict["address"])
-            buf_proposal_info.vote["noVote"]["amount"] -= DEFAULT_DELEGATED * 2
-            self.assertEqual(self.network_proposal._proposal_list[proposal_info.id], buf_proposal_info.to_bytes())
-            self.assertTrue(approved)
-            self.assertEqual(proposal_info.type, proposal_info_type)
-            self.assertEqual(proposal_info.value, proposal_info_value)
+        self._vote_and_check(proposal_info, NetworkProposalVote.AGREE, DEFAULT_DELEGATED * 2,
+                             NetworkProposalStatus.APPROVED)
 
         # case(7): when status is VOTING and check vote result is True and vote type is DISAGREE,
         # check status is DISAPPROVED and return values is correct
-        buf_proposal_info = deepcopy(proposal_info)
-        with patch.object(ProposalInfo, 'from_bytes', return_value=deepcopy(buf_proposal_info)):
-            buf_proposal_info.status = NetworkProposalStatus.VOTING
-            self.assertEqual(buf_proposal_info.status, NetworkProposalStatus.VOTING)
-
-            buf_voter_address = voter["noVote"]["list"][0]
-            buf_prep_of_voter_address = Prep(buf_voter_address, DEFAULT_DELEGATED * 2)
-            buf_id = create_tx_hash()
-            buf_voter_item_in_dict = self.network_proposal._generate_voter_in_dict(buf_id, buf_timestamp,
-                                                                                   buf_prep_of_voter_address)
-
-            voter_all_types = [voter_item["address"] for voter_item in
-                               voter["agree"]["list"] + voter["disagree"]["list"]]
-            voter_all_types += voter["noVote"]["list"]
-
-            main_preps = [Prep(address, DEFAULT_DELEGATED if address != buf_voter_address else DEFAULT_DELEGATED * 2)
-                          for address in voter_all_types]
-            approved, proposal_info_type, proposal_info_value = self.network_proposal.vote_proposal(proposal_info.id,
-                                                                                                    buf_voter_address,
-                                                                                                    NetworkProposalVote.DISAGREE,
-                                                                                                    current_block_height,
-                                                                                                    buf_id,
-                                                                                                    buf_timestamp,
-                                                                                                    main_preps)
-
-            buf_proposal_info.status = NetworkProposalStatus.DISAPPROVED
-            buf_proposal_info.vote["disagree"]["list"].append(buf_voter_item_in_dict)
-            buf_proposal_info.vote["disagree"]["amount"] += DEFAULT_DELEGATED * 2
-            buf_proposal_info.vote["noVote"]["list"].remove(buf_voter_item_in_dict["address"])
-            buf_proposal_info.vote["noVote"]["amount"] -= DEFAULT_DELEGATED * 2
-            self.assertEqual(self.network_proposal._proposal_list[proposal_info.id], buf_proposal_info.to_bytes())
-            self.assertFalse(approved)
-            self.assertEqual(proposal_info.type, proposal_info_type)
-            self.assertEqual(proposal_info.value, proposal_info_value)
+        voter = self._generate_vote(3, DEFAULT_DELEGATED, 2, DEFAULT_DELEGATED,
+                                    DEFAULT_DELEGATED * COUNT_OF_MAIN_PREPS)
+        proposal_info, _ = self._generate_proposal_info(NetworkProposalStatus.VOTING, voter)
+        self._put_proposal_info(proposal_info)
+        self._vote_and_check(proposal_info, NetworkProposalVote.DISAGREE, DEFAULT_DELEGATED * 2,
+                             NetworkProposalStatus.DISAPPROVED)
 
         # case(8): when status is VOTING and last voter votes to DISAGREE and check vote result is False,
         # check status is DISAPPROVED and return values is correct
-        new_voter = self._generate_vote(3, DEFAULT_DELEGATED * 3, 0, 0, DEFAULT_DELEGATED * 6, 4)
-        proposal_info, self.network_proposal._proposal_list[proposal_info.id] = self._generate_proposal_info(
-            NetworkProposalStatus.VOTING, new_voter)
+        self.network_proposal._check_vote_result.return_value = False
+        voter = self._generate_vote(3, DEFAULT_DELEGATED * 3, 0, 0, DEFAULT_DELEGATED * 6, 4)
+        proposal_info, _ = self._generate_proposal_info(NetworkProposalStatus.VOTING, voter)
+        self._put_proposal_info(proposal_info)
+        self._vote_and_check(proposal_info, NetworkProposalVote.DISAGREE, DEFAULT_DELEGATED * 3,
+                             NetworkProposalStatus.DISAPPROVED)
+
+    def _vote_and_check(self, proposal_info: 'ProposalInfo', vote_type: int, delegated: int, expected_status: int):
+        buf_timestamp = 10
         current_block_height = proposal_info.end_block_height - 1
-
-        buf_proposal_info = deepcopy(proposal_info)
-        with patch.object(ProposalInfo, 'from_bytes', return_value=deepcopy(buf_proposal_info)):
-            buf_proposal_info.status = NetworkProposalStatus.VOTING
-            self.assertEqual(buf_proposal_info.status, NetworkProposalStatus.VOTING)
-
-            buf_voter_address = new_voter["noVote"]["list"][0]
-            buf_prep_of_voter_address = Prep(buf_voter_address, DEFAULT_DELEGATED * 3)
-            buf_id = create_tx_hash()
-            buf_voter_item_in_dict = self.network_proposal._generate_voter_in_dict(buf_id, buf_timestamp,
-                                                                                   buf_prep_of_voter_address)
-
-            voter_all_types = [voter_item["address"] for voter_item in
-                               new_voter["agree"]["list"] + new_voter["disagree"]["list"]]
-            voter_all_types += new_voter["noVote"]["list"]
-
-            main_preps = [Prep(address, DEFAULT_DELEGATED if address != buf_voter_address else DEFAULT_DELEGATED * 3)
-                          for address in voter_all_types]
-            approved, proposal_info_type, proposal_info_value = self.network_proposal.vote_proposal(proposal_info.id,
-                                                                                                    buf_voter_address,
-                                                                                                    NetworkProposalVote.DISAGREE,
-                                                                                                    current_block_height,
-                                                                                                    buf_id,
-                                                                                                    buf_timestamp,
-                                                                                                    main_preps)
-
-            buf_proposal_info.status = NetworkProposalStatus.DISAPPROVED
-            buf_proposal_info.vote["disagree"]["list"].append(buf_voter_item_in_dict)
-            buf_proposal_info.vote["disagree"]["amount"] += DEFAULT_DELEGATED * 3
-            buf_proposal_info.vote["noVote"]["list"].remove(buf_voter_item_in_dict["address"])
-            buf_proposal_info.vote["noVote"]["amount"] -= DEFAULT_DELEGATED * 3
-            self.assertEqual(self.network_proposal._proposal_list[proposal_info.id], buf_proposal_info.to_bytes())
-            self.assertFalse(approved)
-            self.assertEqual(proposal_info.type, proposal_info_type)
-            self.assertEqual(proposal_info.value, proposal_info_value)
+        buf_voter_address = proposal_info.vote["noVote"]["list"][0]
+        buf_id = create_tx_hash()
+
+        approved, proposal_info_type, proposal_info_value = self.network_proposal.vote_proposal(
+            proposal_info.id, Prep(Address.from_string(buf_voter_address), delegated), vote_type,
+            current_block_height, buf_id, buf_timestamp)
+
+        vote_type_in_str = "agree" if vote_type == NetworkProposalVote.AGREE else "disagree"
+        expected_proposal_info = deepcopy(proposal_info)
+        expected_proposal_info.status = expected_status
+        expected_proposal_info.vote[vote_type_in_str]["list"].append({
+            "id": '0x' + bytes.hex(buf_id),
+            "timestamp": buf_timestamp,
+            "address": buf_voter_address,
+            "name": "name_" + buf_voter_address,
+            "amount": delegated
+        })
+        expected_proposal_info.vote[vote_type_in_str]["amount"] += delegated
+        expected_proposal_info.vote["noVote"]["list"].remove(buf_voter_address)
+        expected_proposal_info.vote["noVote"]["amount"] -= delegated
+
+        self.assertEqual(vars(expected_proposal_info),
+                         vars(self._get_proposal_info(proposal_info.id)))
+        self.assertEqual(expected_status == NetworkProposalStatus.APPROVED, approved)
+        self.assertEqual(proposal_info.type, proposal_info_type)
+        self.assertEqual(proposal_info.value, proposal_info_value)
+
+    def _put_proposal_info(self, proposal_info: 'ProposalInfo'):
+        self.network_proposal._proposal_list[proposal_info.id] = proposal_info.to_bytes()
+        self.network_proposal._proposal_list_keys.append(proposal_info.id)
+        self.network_proposal.migrate_proposals()
+
+    def _set_status(self, id: bytes, status: int):
+        tally = ProposalTally.from_bytes(self.network_proposal._proposal_tally[id])
+        self.network_proposal._set_status(id, tally, ProposalHeaders(self.network_proposal._proposal_list), status)
+        self.network_proposal._proposal_tally[id] = tally.to_bytes()
+
+    def _get_proposal_info(self, id: bytes) -> 'ProposalInfo':
+        return self.network_proposal._get_proposal_info(id, ProposalHeaders(self.network_proposal._proposal_list))
 
     def _generate_vote(self, cnt_agree_voter: int, delegated_agree_voter: int, cnt_disagree_voter: int,
                        delegated_disagree_voter: int, total_delegated: int,
@@ -0,0 +1,55 @@
+import random
+import unittest
+
+from governance.sorted_index import SortedIndex
+
+
+class ArrayDBStub(list):
+    """ list having ArrayDB methods """
+
+    def get(self, index: int):
+        return self[index]
+
+    def put(self, value):
+        self.append(value)
+
+
+class TestUnitSortedIndex(unittest.TestCase):
+
+    def test_add_remove(self):
+        index = SortedIndex(ArrayDBStub())
+        expected = []
+        for _ in range(200):
+            value = random.randint(0, 50)
+            if value in expected and random.random() < 0.5:
+                self.assertTrue(index.remove(value))
+                expected.remove(value)
+            else:
+                index.add(value)
+                expected.append(value)
+            expected.sort()
+            self.assertEqual(expected, list(index._array))
+
+        self.assertFalse(index.remove(51))
+        self.assertEqual(len(expected), len(index))
+
+    def test_iter_reversed(self):
+        index = SortedIndex(ArrayDBStub())
+        for value in (3, 1, 2, 5):
+            index.add(value)
+        self.assertEqual([5, 3, 2, 1], list(index.iter_reversed()))
+        self.assertEqual([2, 1], list(index.iter_reversed(2)))
+        self.assertEqual([], list(index.iter_reversed(4)))
+        self.assertEqual([3, 2, 1], list(index.iter_reversed(below=5)))
+        self.assertEqual([3, 2, 1], list(index.iter_reversed(below=4)))
+        self.assertEqual([2, 1], list(index.iter_reversed(1, below=4)))
+        self.assertEqual([], list(index.iter_reversed(below=1)))
+        self.assertEqual([5, 3, 2, 1], list(index.iter_reversed(below=100)))
+
+    def test_merge_reversed(self):
+        indexes = [SortedIndex(ArrayDBStub()) for _ in range(3)]
+        for value in range(20):
+            indexes[value % 3].add(value)
+        self.assertEqual(list(range(19, -1, -1)), list(SortedIndex.merge_reversed(indexes)))
+        self.assertEqual(list(range(9, -1, -1)), list(SortedIndex.merge_reversed(indexes, below=10)))
+        self.assertEqual([], list(SortedIndex.merge_reversed([SortedIndex(ArrayDBStub())])))
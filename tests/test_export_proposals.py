@@ -0,0 +1,125 @@
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import csv
+import dbm
+import io
+import json
+import os
+import tempfile
+import unittest
+from collections import namedtuple
+from unittest.mock import ANY, Mock
+
+from iconservice import *
+
+from governance.network_proposal import NetworkProposal, ProposalInfo, NetworkProposalStatus, NetworkProposalType
+from tools.export_proposals import VOTE_COLUMNS, export, iter_proposals, open_direct_score_db, open_score_db
+
+Prep = namedtuple("Prep", "address, name, delegated")
+
+
+class KeyValueDatabaseStub(dict):
+    """ In-memory stand-in of KeyValueDatabase """
+
+    def put(self, key: bytes, value: bytes) -> None:
+        self[key] = value
+
+    def delete(self, key: bytes) -> None:
+        self.pop(key, None)
+
+
+def create_proposal_info(index: int) -> 'ProposalInfo':
+    addresses = [str(Address.from_data(AddressPrefix.EOA, os.urandom(20))) for _ in range(3)]
+    vote = {
+        "agree": {"list": [{"id": '0x' + bytes.hex(os.urandom(32)), "timestamp": 100 + index, "address": addresses[0],
+                            "name": "P-Rep 0", "amount": 10}], "amount": 10},
+        "disagree": {"list": [], "amount": 0},
+        "noVote": {"list": addresses[1:], "amount": 20}
+    }
+    return ProposalInfo(os.urandom(32), Address.from_string(addresses[0]), "P-Rep 0", f"title {index}", "description",
+                        NetworkProposalType.TEXT, {"value": "text"}, 10, 20, NetworkProposalStatus.VOTING, vote)
+
+
+class TestExportProposals(unittest.TestCase):
+
+    def test_open_score_db(self):
+        from iconservice.iconscore.context.context import ContextContainer
+        self.addCleanup(ContextContainer._clear_context)
+
+        main_preps = [Prep(Address.from_data(AddressPrefix.EOA, os.urandom(20)), f"P-Rep {i}", 10) for i in range(3)]
+        id = os.urandom(32)
+        key_value_db = KeyValueDatabaseStub()
+        NetworkProposal(open_direct_score_db(key_value_db)).register_proposal(
+            id, main_preps[0].address, 10, 20, "title", "description", NetworkProposalType.TEXT, {"value": "text"},
+            main_preps)
+
+        with tempfile.TemporaryDirectory() as dir_name:
+            path = os.path.join(dir_name, "state")
+            with dbm.open(path, 'n') as db:
+                for key, value in key_value_db.items():
+                    db[key] = value
+
+            proposals = list(iter_proposals(NetworkProposal(open_score_db(path))))
+
+        self.assertEqual(1, len(proposals))
+        self.assertEqual(id, proposals[0].id)
+        self.assertEqual(main_preps[0].address, proposals[0].proposer)
+        self.assertEqual("P-Rep 0", proposals[0].proposer_name)
+        self.assertEqual(NetworkProposalStatus.VOTING, proposals[0].status)
+        self.assertEqual([str(main_prep.address) for main_prep in main_preps], proposals[0].vote["noVote"]["list"])
+
+    def test_iter_proposals(self):
+        legacy = create_proposal_info(0)
+        split = create_proposal_info(1)
+        network_proposal = Mock()
+        network_proposal._proposal_list_keys = [legacy.id, split.id]
+        network_proposal._proposal_tally = {legacy.id: None, split.id: b'tally'}
+        network_proposal._proposal_list = {legacy.id: legacy.to_bytes()}
+        network_proposal._get_proposal_info.return_value = split
+
+        proposals = iter_proposals(network_proposal)
+        self.assertEqual(legacy.id, next(proposals).id)
+        network_proposal._get_proposal_info.assert_not_called()
+        self.assertIs(split, next(proposals))
+        network_proposal._get_proposal_info.assert_called_once_with(split.id, ANY)
+        self.assertIsNone(next(proposals, None))
+
+    def test_export(self):
+        proposals = [create_proposal_info(i) for i in range(2)]
+        proposal_out = io.StringIO()
+        vote_out = io.StringIO()
+
+        self.assertEqual(2, export(iter(proposals), proposal_out, vote_out))
+
+        lines = proposal_out.getvalue().splitlines()
+        self.assertEqual(2, len(lines))
+        for line, proposal_info in zip(lines, proposals):
+            proposal_in_dict = json.loads(line)
+            self.assertEqual('0x' + bytes.hex(proposal_info.id), proposal_in_dict["id"])
+            self.assertEqual(str(proposal_info.proposer), proposal_in_dict["proposer"])
+            self.assertEqual(proposal_info.title, proposal_in_dict["title"])
+            self.assertEqual({"count": 1, "amount": 10}, proposal_in_dict["vote"]["agree"])
+            self.assertEqual({"count": 0, "amount": 0}, proposal_in_dict["vote"]["disagree"])
+            self.assertEqual({"count": 2, "amount": 20}, proposal_in_dict["vote"]["noVote"])
+            self.assertEqual(3, proposal_in_dict["totalVoter"])
+
+        rows = list(csv.reader(io.StringIO(vote_out.getvalue())))
+        self.assertEqual(list(VOTE_COLUMNS), rows[0])
+        self.assertEqual(1 + 2 * 3, len(rows))
+        voter = proposals[0].vote["agree"]["list"][0]
+        self.assertEqual(['0x' + bytes.hex(proposals[0].id), "agree", "0", voter["address"], voter["name"],
+                          voter["id"], "100", "10"], rows[1])
+        self.assertEqual(['0x' + bytes.hex(proposals[0].id), "noVote", "0", proposals[0].vote["noVote"]["list"][0],
+                          "", "", "", ""], rows[2])
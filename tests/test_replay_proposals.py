@@ -0,0 +1,119 @@
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import os
+import tempfile
+import unittest
+
+from governance.network_proposal import NetworkProposalStatus, NetworkProposalType
+from tools.export_proposals import GOVERNANCE_SCORE_ADDRESS
+from tools.replay_proposals import APPROVED, CANCELED, REGISTERED, VOTED, ProposalReplayer, verify
+
+PROPOSER = "hx" + "1" * 40
+VOTER = "hx" + "2" * 40
+
+
+def create_event(signature: str, block_height: int, data: list) -> dict:
+    return {
+        "blockHeight": hex(block_height),
+        "txHash": '0x' + bytes.hex(block_height.to_bytes(32, 'big')),
+        "timestamp": hex(1_600_000_000_000_000 + block_height),
+        "scoreAddress": GOVERNANCE_SCORE_ADDRESS,
+        "indexed": [signature],
+        "data": data
+    }
+
+
+def create_events() -> list:
+    value = '0x' + bytes.hex(json.dumps({"value": "text"}).encode())
+    first_id = '0x' + bytes.hex((1).to_bytes(32, 'big'))
+    second_id = '0x' + bytes.hex((2).to_bytes(32, 'big'))
+    return [
+        create_event(REGISTERED, 1, ["first", "description", hex(NetworkProposalType.TEXT), value, PROPOSER]),
+        create_event(REGISTERED, 2, ["second", "description", hex(NetworkProposalType.TEXT), value, PROPOSER]),
+        create_event("ICXTransfer(Address,Address,int)", 3, [PROPOSER, VOTER, "0x1"]),
+        create_event(VOTED, 4, [first_id, "0x1", PROPOSER]),
+        create_event(VOTED, 5, [first_id, "0x0", VOTER]),
+        create_event(APPROVED, 5, [first_id]),
+        create_event(CANCELED, 6, [second_id])
+    ]
+
+
+class TestReplayProposals(unittest.TestCase):
+
+    def test_replay(self):
+        replayer = ProposalReplayer()
+        replayer.replay(create_events())
+
+        self.assertEqual(7, replayer.position)
+        first, second = replayer.proposals.values()
+        self.assertEqual("first", first.title)
+        self.assertEqual({"value": "text"}, first.value)
+        self.assertEqual(1, first.start_block_height)
+        self.assertEqual(NetworkProposalStatus.APPROVED, first.status)
+        self.assertEqual([PROPOSER], [voter["address"] for voter in first.vote["agree"]["list"]])
+        self.assertEqual([VOTER], [voter["address"] for voter in first.vote["disagree"]["list"]])
+        self.assertEqual(1_600_000_000_000_005, first.vote["disagree"]["list"][0]["timestamp"])
+        self.assertEqual(NetworkProposalStatus.CANCELED, second.status)
+
+    def test_resume_from_checkpoint(self):
+        events = create_events()
+        expected = ProposalReplayer()
+        expected.replay(events)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "checkpoint.json")
+            replayer = ProposalReplayer()
+            replayer.replay(events[:4], path, checkpoint_interval=3)
+            self.assertFalse(os.path.exists(f"{path}.tmp"))
+
+            resumed = ProposalReplayer()
+            resumed.load_checkpoint(path)
+            self.assertEqual(4, resumed.position)
+            resumed.replay(events)
+
+        self.assertEqual(expected.position, resumed.position)
+        self.assertEqual([proposal_info.to_bytes() for proposal_info in expected.proposals.values()],
+                         [proposal_info.to_bytes() for proposal_info in resumed.proposals.values()])
+
+    def test_verify(self):
+        replayer = ProposalReplayer()
+        replayer.replay(create_events()[:2])
+        first_id = '0x' + bytes.hex((1).to_bytes(32, 'big'))
+        captured = {
+            "id": first_id,
+            "proposer": PROPOSER,
+            "proposerName": "P-Rep 1",
+            "status": hex(NetworkProposalStatus.DISAPPROVED),
+            "startBlockHeight": "0x1",
+            "endBlockHeight": "0x10",
+            "contents": {"title": "first", "description": "description", "type": hex(NetworkProposalType.TEXT),
+                         "value": {"value": "text"}},
+            "vote": {
+                "agree": {"list": [], "amount": "0x0"},
+                "disagree": {"list": [], "amount": "0x0"},
+                "noVote": {"list": [PROPOSER], "amount": "0x10"}
+            }
+        }
+        # expired without votes
+        self.assertEqual([], verify(replayer.proposals, [captured]))
+
+        captured["vote"]["agree"]["list"].append({"id": '0x' + "0" * 64, "timestamp": "0x1", "address": VOTER,
+                                                  "name": "P-Rep 2", "amount": "0x10"})
+        missing = dict(captured, id='0x' + "f" * 64)
+        differences = verify(replayer.proposals, [captured, missing])
+        self.assertEqual(2, len(differences))
+        self.assertTrue(differences[0].startswith(f"{first_id}: vote"))
+        self.assertEqual(f"{missing['id']}: not rebuilt", differences[1])
@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+""" Exports all the proposals and votes in a governance SCORE state database to NDJSON and CSV files
+
+A proposal is read, written and dropped one at a time, so that memory usage does not grow with the history.
+The state database is either a LevelDB directory of a node snapshot or a dbm file keeping the same keys and values.
+
+Usage: python -m tools.export_proposals STATE_DB OUT_NDJSON OUT_VOTES_CSV [SCORE_ADDRESS]
+"""
+
+import csv
+import dbm
+import json
+import os
+import sys
+
+from iconservice import *
+from pkg_resources import get_distribution
+
+from governance.network_proposal import NetworkProposal, ProposalHeaders, ProposalInfo
+
+GOVERNANCE_SCORE_ADDRESS = "cx0000000000000000000000000000000000000001"
+SUPPORTED_ICONSERVICE_MAJOR_VERSION = 1
+
+VOTE_COLUMNS = ("proposal_id", "vote", "order", "address", "name", "tx_id", "timestamp", "amount")
+
+
+def open_score_db(path: str, score_address: str = GOVERNANCE_SCORE_ADDRESS) -> 'IconScoreDatabase':
+    """ Open the state database of the SCORE read only
+
+    :param path: LevelDB directory or dbm file
+    :param score_address: address of the SCORE
+    :return: IconScoreDatabase of the SCORE
+    """
+    if os.path.isdir(path):
+        from iconservice.database.db import KeyValueDatabase
+        key_value_db = KeyValueDatabase.from_path(path, create_if_missing=False)
+    else:
+        # dbm objects return None for missing keys on `get` as KeyValueDatabase does
+        key_value_db = dbm.open(path, 'r')
+    return open_direct_score_db(key_value_db, score_address)
+
+
+def open_direct_score_db(key_value_db, score_address: str = GOVERNANCE_SCORE_ADDRESS) -> 'IconScoreDatabase':
+    """ Open the SCORE database on the key value database out of iconservice
+
+    iconservice has no public API for it, so this is the only place relying on its internals: ContextDatabase and
+    the context stack of ContextContainer, which IconScoreDatabase reads the context from. They are checked for
+    SUPPORTED_ICONSERVICE_MAJOR_VERSION only.
+
+    :param key_value_db: object with `get`, and `put` and `delete` to write, as the DB of KeyValueDatabase
+    :param score_address: address of the SCORE
+    :return: IconScoreDatabase of the SCORE in DIRECT context
+    """
+    version = get_distribution("iconservice").version
+    if int(version.split('.')[0]) != SUPPORTED_ICONSERVICE_MAJOR_VERSION:
+        raise RuntimeError(f"Unsupported iconservice version: {version}")
+
+    from iconservice.database.db import ContextDatabase, IconScoreDatabase
+    from iconservice.icon_constant import IconScoreContextType
+    from iconservice.iconscore.context.context import ContextContainer
+    from iconservice.iconscore.icon_score_context import IconScoreContext
+
+    ContextContainer._push_context(IconScoreContext(IconScoreContextType.DIRECT))
+    return IconScoreDatabase(Address.from_string(score_address), ContextDatabase(key_value_db))
+
+
+def iter_proposals(network_proposal: 'NetworkProposal'):
+    """ Iterate all the proposals in the order of registration
+
+    :param network_proposal: NetworkProposal on the state database
+    :return: ProposalInfo objects including the voter lists
+    """
+    for id in network_proposal._proposal_list_keys:
+        if network_proposal._proposal_tally[id] is None:
+            # saved as a whole before migrate_proposals
+            yield ProposalInfo.from_bytes(network_proposal._proposal_list[id])
+        else:
+            # headers are read apart for each proposal not to keep every proposal read
+            yield network_proposal._get_proposal_info(id, ProposalHeaders(network_proposal._proposal_list))
+
+
+def proposal_to_dict(proposal_info: 'ProposalInfo') -> dict:
+    """ Convert the proposal into a JSON serializable dict, leaving the voter lists out """
+    vote = proposal_info.vote
+    return {
+        "id": '0x' + bytes.hex(proposal_info.id),
+        "proposer": str(proposal_info.proposer),
+        "proposerName": proposal_info.proposer_name,
+        "title": proposal_info.title,
+        "description": proposal_info.description,
+        "type": proposal_info.type,
+        "value": proposal_info.value,
+        "startBlockHeight": proposal_info.start_block_height,
+        "endBlockHeight": proposal_info.end_block_height,
+        "status": proposal_info.status,
+        "totalVoter": proposal_info.total_voter,
+        "totalDelegatedAmount": proposal_info.total_delegated_amount,
+        "vote": {
+            vote_type_in_str: {"count": len(vote[vote_type_in_str]["list"]),
+                               "amount": vote[vote_type_in_str]["amount"]}
+            for vote_type_in_str in ("agree", "disagree", "noVote")
+        }
+    }
+
+
+def iter_vote_rows(proposal_info: 'ProposalInfo'):
+    """ Iterate the votes of the proposal as rows of VOTE_COLUMNS
+
+    noVote rows only have the address, as the voters have not voted.
+    """
+    id = '0x' + bytes.hex(proposal_info.id)
+    vote = proposal_info.vote
+    for vote_type_in_str in ("agree", "disagree"):
+        for order, voter_in_dict in enumerate(vote[vote_type_in_str]["list"]):
+            yield (id, vote_type_in_str, order, voter_in_dict["address"], voter_in_dict["name"], voter_in_dict["id"],
+                   voter_in_dict["timestamp"], voter_in_dict["amount"])
+    for order, address in enumerate(vote["noVote"]["list"]):
+        yield id, "noVote", order, address, "", "", "", ""
+
+
+def export(proposals, proposal_out, vote_out) -> int:
+    """ Write the proposals to NDJSON and their votes to CSV
+
+    :param proposals: iterable of ProposalInfo
+    :param proposal_out: text stream for the proposals, one JSON object per line
+    :param vote_out: text stream for the votes, one row per vote
+    :return: count of the proposals written
+    """
+    vote_writer = csv.writer(vote_out)
+    vote_writer.writerow(VOTE_COLUMNS)
+    count = 0
+    for proposal_info in proposals:
+        proposal_out.write(json.dumps(proposal_to_dict(proposal_info), separators=(',', ':')))
+        proposal_out.write('\n')
+        vote_writer.writerows(iter_vote_rows(proposal_info))
+        count += 1
+    return count
+
+
+def main(args: list) -> int:
+    if len(args) not in (3, 4):
+        print(__doc__.strip().splitlines()[-1], file=sys.stderr)
+        return 1
+
+    db = open_score_db(*args[:1], *args[3:])
+    with open(args[1], 'w') as proposal_out, open(args[2], 'w', newline='') as vote_out:
+        count = export(iter_proposals(NetworkProposal(db)), proposal_out, vote_out)
+    print(f"exported proposals: {count}", file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
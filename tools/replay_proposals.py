@@ -0,0 +1,242 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+""" Rebuilds the proposals of the governance SCORE from its eventlogs
+
+The events are read from a NDJSON file with one eventlog per line in the order of the blocks, each of which is
+the eventlog in the transaction result with the block height, hash and timestamp of the transaction:
+
+    {"blockHeight": "0x10", "txHash": "0x...", "timestamp": "0x...", "scoreAddress": "cx...01",
+     "indexed": ["NetworkProposalVoted(bytes,int,Address)"], "data": ["0x...", "0x1", "hx..."]}
+
+The eventlogs do not have the main P-Reps, their delegated amounts and the end block height of a proposal,
+so they are left empty in the rebuilt proposals, and a proposal is not seen as disapproved as no eventlog tells it.
+
+Usage: python -m tools.replay_proposals EVENTS [--checkpoint FILE] [--verify GET_PROPOSAL_RESULTS] [--out FILE]
+"""
+
+import argparse
+import json
+import os
+import sys
+
+from iconservice import *
+
+from governance.network_proposal import NetworkProposalStatus, NetworkProposalVote, ProposalInfo
+from tools.export_proposals import GOVERNANCE_SCORE_ADDRESS
+
+REGISTERED = "NetworkProposalRegistered(str,str,int,bytes,Address)"
+CANCELED = "NetworkProposalCanceled(bytes)"
+VOTED = "NetworkProposalVoted(bytes,int,Address)"
+APPROVED = "NetworkProposalApproved(bytes)"
+
+CHECKPOINT_INTERVAL = 1000
+
+
+def read_ndjson(path: str):
+    """ Iterate the objects in the NDJSON file like the eventlogs or the results of `getProposal` """
+    with open(path) as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def _to_int(value) -> int:
+    return int(value, 16) if isinstance(value, str) else value
+
+
+def _to_bytes(value: str) -> bytes:
+    return bytes.fromhex(value[2:])
+
+
+class ProposalReplayer:
+    """ Fold the eventlogs of the proposals into ProposalInfo objects one by one
+
+    `position` is the count of the eventlogs consumed, including the ones of the other events,
+    so that replaying the same source can resume after it.
+    """
+
+    def __init__(self, score_address: str = GOVERNANCE_SCORE_ADDRESS):
+        self._score_address = score_address
+        self.position = 0
+        self.proposals = {}
+        self._handlers = {
+            REGISTERED: self._on_registered,
+            CANCELED: self._on_canceled,
+            VOTED: self._on_voted,
+            APPROVED: self._on_approved
+        }
+
+    def apply(self, event: dict) -> None:
+        handler = self._handlers.get(event["indexed"][0])
+        if handler is not None and event["scoreAddress"] == self._score_address:
+            handler(event, event["data"])
+        self.position += 1
+
+    def replay(self, events, checkpoint_path: str = None, checkpoint_interval: int = CHECKPOINT_INTERVAL) -> None:
+        """ Apply the events after `position`
+
+        :param events: iterable of the eventlogs from the first one
+        :param checkpoint_path: file to save the state every `checkpoint_interval` events and at the end (optional)
+        :param checkpoint_interval: count of the events between the checkpoints
+        """
+        for i, event in enumerate(events):
+            if i < self.position:
+                continue
+            self.apply(event)
+            if checkpoint_path is not None and self.position % checkpoint_interval == 0:
+                self.save_checkpoint(checkpoint_path)
+        if checkpoint_path is not None:
+            self.save_checkpoint(checkpoint_path)
+
+    def _get(self, id: bytes) -> 'ProposalInfo':
+        proposal_info = self.proposals.get(id)
+        if proposal_info is None:
+            raise ValueError(f"No registered proposal: 0x{bytes.hex(id)}")
+        return proposal_info
+
+    def _on_registered(self, event: dict, data: list) -> None:
+        title, description, type, value, proposer = data
+        id = _to_bytes(event["txHash"])
+        vote = {vote_type_in_str: {"list": [], "amount": 0} for vote_type_in_str in ("agree", "disagree", "noVote")}
+        self.proposals[id] = ProposalInfo(id, Address.from_string(proposer), "", title, description, _to_int(type),
+                                          json_loads(_to_bytes(value).decode()), _to_int(event["blockHeight"]), 0,
+                                          NetworkProposalStatus.VOTING, vote)
+
+    def _on_canceled(self, event: dict, data: list) -> None:
+        self._get(_to_bytes(data[0])).status = NetworkProposalStatus.CANCELED
+
+    def _on_voted(self, event: dict, data: list) -> None:
+        id, vote_type, voter = data
+        vote_type_in_str = "agree" if _to_int(vote_type) == NetworkProposalVote.AGREE else "disagree"
+        self._get(_to_bytes(id)).vote[vote_type_in_str]["list"].append({
+            "id": event["txHash"],
+            "timestamp": _to_int(event["timestamp"]),
+            "address": voter,
+            "name": "",
+            "amount": 0
+        })
+
+    def _on_approved(self, event: dict, data: list) -> None:
+        self._get(_to_bytes(data[0])).status = NetworkProposalStatus.APPROVED
+
+    def save_checkpoint(self, path: str) -> None:
+        """ Save the position and the proposals, replacing the previous checkpoint at once """
+        checkpoint = {
+            "position": self.position,
+            "proposals": ['0x' + bytes.hex(proposal_info.to_bytes()) for proposal_info in self.proposals.values()]
+        }
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(checkpoint, f)
+        os.replace(tmp_path, path)
+
+    def load_checkpoint(self, path: str) -> None:
+        with open(path) as f:
+            checkpoint = json.load(f)
+        self.position = checkpoint["position"]
+        self.proposals = {}
+        for proposal_in_hex in checkpoint["proposals"]:
+            proposal_info = ProposalInfo.from_bytes(_to_bytes(proposal_in_hex))
+            # decoded at once as the voter lists are changed by the events
+            proposal_info.decode_vote()
+            self.proposals[proposal_info.id] = proposal_info
+
+
+def proposal_to_dict(proposal_info: 'ProposalInfo') -> dict:
+    """ Convert the rebuilt proposal into the format of `getProposal` without the fields the eventlogs miss """
+    return {
+        "id": '0x' + bytes.hex(proposal_info.id),
+        "proposer": str(proposal_info.proposer),
+        "status": hex(proposal_info.status),
+        "startBlockHeight": hex(proposal_info.start_block_height),
+        "contents": {
+            "title": proposal_info.title,
+            "description": proposal_info.description,
+            "type": hex(proposal_info.type),
+            "value": proposal_info.value
+        },
+        "vote": {
+            vote_type_in_str: [{"id": voter["id"], "timestamp": hex(voter["timestamp"]), "address": voter["address"]}
+                               for voter in proposal_info.vote[vote_type_in_str]["list"]]
+            for vote_type_in_str in ("agree", "disagree")
+        }
+    }
+
+
+def verify(proposals: dict, captured_proposals) -> list:
+    """ Compare the rebuilt proposals with the results of `getProposal`
+
+    :param proposals: ProposalInfo objects by ID
+    :param captured_proposals: iterable of the results of `getProposal` with all the voters
+    :return: list of the differences in text
+    """
+    differences = []
+    for captured in captured_proposals:
+        proposal_info = proposals.get(_to_bytes(captured["id"]))
+        if proposal_info is None:
+            differences.append(f"{captured['id']}: not rebuilt")
+            continue
+
+        rebuilt = proposal_to_dict(proposal_info)
+        expected = {key: captured[key] for key in ("id", "proposer", "status", "startBlockHeight", "contents")}
+        expected["vote"] = {
+            vote_type_in_str: [{key: voter[key] for key in ("id", "timestamp", "address")}
+                               for voter in captured["vote"][vote_type_in_str]["list"]]
+            for vote_type_in_str in ("agree", "disagree")
+        }
+        # disapproval has no eventlog
+        if expected["status"] == hex(NetworkProposalStatus.DISAPPROVED) \
+                and rebuilt["status"] == hex(NetworkProposalStatus.VOTING):
+            rebuilt["status"] = expected["status"]
+
+        for key, value in expected.items():
+            if rebuilt[key] != value:
+                differences.append(f"{captured['id']}: {key} {rebuilt[key]} != {value}")
+    return differences
+
+
+def main(args: list) -> int:
+    parser = argparse.ArgumentParser(description="Rebuild the proposals from the eventlogs of the governance SCORE")
+    parser.add_argument("events", help="NDJSON file of the eventlogs")
+    parser.add_argument("--checkpoint", help="file to resume from and save the state to")
+    parser.add_argument("--verify", help="NDJSON file of the results of getProposal to compare with")
+    parser.add_argument("--out", help="NDJSON file to write the rebuilt proposals to")
+    parser.add_argument("--score", default=GOVERNANCE_SCORE_ADDRESS, help="address of the governance SCORE")
+    args = parser.parse_args(args)
+
+    replayer = ProposalReplayer(args.score)
+    if args.checkpoint is not None and os.path.exists(args.checkpoint):
+        replayer.load_checkpoint(args.checkpoint)
+    replayer.replay(read_ndjson(args.events), args.checkpoint)
+    print(f"events: {replayer.position}, proposals: {len(replayer.proposals)}", file=sys.stderr)
+
+    if args.out is not None:
+        with open(args.out, 'w') as f:
+            for proposal_info in replayer.proposals.values():
+                f.write(json.dumps(proposal_to_dict(proposal_info), separators=(',', ':')))
+                f.write('\n')
+
+    if args.verify is not None:
+        differences = verify(replayer.proposals, read_ndjson(args.verify))
+        for difference in differences:
+            print(difference)
+        return 1 if differences else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))